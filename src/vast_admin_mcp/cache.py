@@ -56,7 +56,7 @@ class CacheManager:
             
             return cache[key]
     
-    def set(self, cache_name: str, key: str, value: Any, ttl: Optional[float] = None) -> None:
+    def set(self, cache_name: str, key: str, value: Any, ttl: Optional[float] = None, maxsize: Optional[int] = None) -> None:
         """Set a value in a named cache.
         
         Args:
@@ -64,18 +64,61 @@ class CacheManager:
             key: Cache key
             value: Value to cache
             ttl: Time-to-live in seconds (None for no expiration)
+            maxsize: Maximum number of entries (None for unbounded). When exceeded,
+                expired entries are pruned first, then the oldest ones.
         """
         with self._lock:
             if cache_name not in self._caches:
                 self._caches[cache_name] = {}
                 self._cache_timestamps[cache_name] = {}
             
-            self._caches[cache_name][key] = value
-            self._cache_timestamps[cache_name][key] = time.time()
+            cache = self._caches[cache_name]
+            timestamps = self._cache_timestamps[cache_name]
+            # Re-insert so the entries stay ordered oldest first
+            cache.pop(key, None)
+            timestamps.pop(key, None)
+            now = time.time()
+            cache[key] = value
+            timestamps[key] = now
             
             # Set TTL for this cache if provided
             if ttl is not None:
                 self._cache_ttls[cache_name] = ttl
+            
+            if maxsize is not None and len(cache) > maxsize:
+                cache_ttl = self._cache_ttls.get(cache_name)
+                while len(cache) > 1:
+                    oldest = next(iter(cache))
+                    expired = cache_ttl is not None and now - timestamps[oldest] > cache_ttl
+                    if not expired and len(cache) <= maxsize:
+                        break
+                    del cache[oldest]
+                    del timestamps[oldest]
+    
+    def delete(self, cache_name: str, key: str) -> None:
+        """Remove a single key from a named cache (no-op if absent).
+        
+        Args:
+            cache_name: Name of the cache
+            key: Cache key
+        """
+        with self._lock:
+            self._caches.get(cache_name, {}).pop(key, None)
+            self._cache_timestamps.get(cache_name, {}).pop(key, None)
+    
+    def delete_prefix(self, cache_name: str, prefix: str) -> None:
+        """Remove all keys starting with prefix from a named cache.
+        
+        Args:
+            cache_name: Name of the cache
+            prefix: Key prefix (e.g. a cluster address followed by ':')
+        """
+        with self._lock:
+            cache = self._caches.get(cache_name, {})
+            timestamps = self._cache_timestamps.get(cache_name, {})
+            for key in [k for k in cache if k.startswith(prefix)]:
+                del cache[key]
+                timestamps.pop(key, None)
     
     def clear(self, cache_name: Optional[str] = None) -> None:
         """Clear cache(s).
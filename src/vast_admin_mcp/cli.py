@@ -6,7 +6,7 @@ import logging
 import re
 from typing import Optional, Dict, Tuple, List, Any
 
-from .config import CONFIG_FILE, TEMPLATE_MODIFICATIONS_FILE, get_default_template_path
+from .config import CONFIG_FILE, get_template_modifications_file, get_default_template_path
 from .mcp_server import start_mcp
 from .setup import setup_config
 from .utils import output_results, logging_main, to_cli_name, handle_errors
@@ -183,10 +183,10 @@ def handle_list_command(list_args=None):
             command_name = list_args[help_idx - 1]
             # Don't initialize logging for help - it's not needed and causes duplicates
             default_template_path = get_default_template_path()
-            if not os.path.exists(TEMPLATE_MODIFICATIONS_FILE) and not default_template_path:
-                print(f"Template modifications file {TEMPLATE_MODIFICATIONS_FILE} not found and no default template available.", file=sys.stderr)
+            if not os.path.exists(get_template_modifications_file()) and not default_template_path:
+                print(f"Template modifications file {get_template_modifications_file()} not found and no default template available.", file=sys.stderr)
                 sys.exit(1)
-            template_parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+            template_parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
             template = template_parser.get_command_template(command_name)
             merged_template = template_parser.get_merged_command_template(command_name)
             if template:
@@ -215,12 +215,12 @@ def handle_list_command(list_args=None):
     
     # Load template parser
     default_template_path = get_default_template_path()
-    if not os.path.exists(TEMPLATE_MODIFICATIONS_FILE) and not default_template_path:
-        print(f"Template modifications file {TEMPLATE_MODIFICATIONS_FILE} not found and no default template available.", file=sys.stderr)
+    if not os.path.exists(get_template_modifications_file()) and not default_template_path:
+        print(f"Template modifications file {get_template_modifications_file()} not found and no default template available.", file=sys.stderr)
         sys.exit(1)
     
     try:
-        template_parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+        template_parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -759,7 +759,8 @@ def _generate_performance_mcp_code() -> str:
         object_name: str,
         cluster: str,
         timeframe: str = '5m',
-        instances: str = ''
+        instances: str = '',
+        refresh: bool = False
     ) -> Dict:
         """
         Use this tool to retrieve performance metrics for VAST cluster objects using the ad_hoc_query API.
@@ -781,6 +782,8 @@ def _generate_performance_mcp_code() -> str:
                               Use view name, NOT view path. Example: "tenant1:view1,tenant2:view2".
                             - Leave empty string to get metrics for all instances of the object type.
                             - If object_name is "view" and you want specific views, instances is REQUIRED in "tenant:view_name" format.
+            refresh (bool): Query the cluster even if the same request was answered in the last few seconds
+                            (up to an hour for day-granularity timeframes). Defaults to False.
 
         Returns:
             A dict where each key is the instance name which contains a list of performance metrics. Each item contains metric, IOPS 95th Percentile, IOPS Average, IOPS Max, BW 95th Percentile, BW Average, BW Max, LATENCY 95th Percentile, LATENCY Average, LATENCY Max for the different objects.
@@ -797,7 +800,8 @@ def _generate_performance_mcp_code() -> str:
                 object_name=object_name,
                 cluster=cluster,
                 timeframe=timeframe or '5m',
-                instances=instances or None
+                instances=instances or None,
+                refresh=refresh
             )
             return performance_data
         except Exception as e:
@@ -2006,9 +2010,9 @@ def main():
             # There's a command name, show command-specific help with dynamic arguments
             command_name = sys.argv[2]  # The command name should be right after 'list'
             default_template_path = get_default_template_path()
-            if os.path.exists(TEMPLATE_MODIFICATIONS_FILE) or default_template_path:
+            if os.path.exists(get_template_modifications_file()) or default_template_path:
                 try:
-                    template_parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+                    template_parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
                     template = template_parser.get_command_template(command_name)
                     merged_template = template_parser.get_merged_command_template(command_name)
                     if template or merged_template:
@@ -2080,6 +2084,11 @@ def main():
     
     # Setup command
     setup_parser = subparsers.add_parser('setup', help='Initial setup - clusters and access credentials')
+    setup_parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Save the config file as indented JSON for manual editing (default: compact)'
+    )
     
     # MCP Setup command
     mcpsetup_parser = subparsers.add_parser('mcpsetup', help='Configure MCP server for desktop LLM applications')
@@ -2989,7 +2998,7 @@ def main():
     
     # Execute commands
     if args.command == 'setup':
-        setup_config()
+        setup_config(pretty=args.pretty)
     elif args.command == 'mcpsetup':
         handle_mcpsetup_command(args)
     elif args.command == 'mcp':
@@ -3113,11 +3122,11 @@ def main():
         if not list_args:
             # Load template parser to get available commands
             default_template_path = get_default_template_path()
-            if not os.path.exists(TEMPLATE_MODIFICATIONS_FILE) and not default_template_path:
-                print(f"Template modifications file {TEMPLATE_MODIFICATIONS_FILE} not found and no default template available.", file=sys.stderr)
+            if not os.path.exists(get_template_modifications_file()) and not default_template_path:
+                print(f"Template modifications file {get_template_modifications_file()} not found and no default template available.", file=sys.stderr)
                 sys.exit(1)
             try:
-                template_parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+                template_parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
             except ValueError as e:
                 print(f"Error: {e}", file=sys.stderr)
                 sys.exit(1)
@@ -4,12 +4,16 @@ import os
 import time
 import functools
 import logging
-from typing import Dict, Any, Optional, List
+from threading import Lock
+from typing import Dict, Any, Optional, List, FrozenSet
 import urllib3
+from concurrent.futures import ThreadPoolExecutor
 
 from vastpy import VASTClient
 
-from .config import load_config, REST_PAGE_SIZE, API_CONNECT_TIMEOUT, API_READ_TIMEOUT, API_MAX_RETRIES
+from .config import (
+    load_config, REST_PAGE_SIZE, API_CONNECT_TIMEOUT, API_READ_TIMEOUT, API_MAX_RETRIES, API_PARALLEL_WORKERS
+)
 
 def _get_proxy_url(target_host: str) -> Optional[str]:
     """Detect proxy URL from standard environment variables, respecting NO_PROXY.
@@ -92,22 +96,35 @@ def _create_pool_manager(proxy_url: Optional[str] = None, **kwargs):
     return urllib3.ProxyManager(proxy_url, **kwargs)
 
 
-# Monkey-patch VASTClient.request() to add timeout and retry configuration
-# VASTClient creates a new PoolManager for each request, so we patch the request method
-# to pass our timeout and retry settings to the PoolManager
-_original_vast_client_request = None
+# Connection managers shared across requests, keyed by (proxy_url, cert_file, cert_server_name)
+_pool_managers: Dict[tuple, Any] = {}
+_pool_managers_lock = Lock()
 
-def _patch_vast_client_request():
-    """Patch VASTClient.request() to add timeout and retry configuration."""
-    global _original_vast_client_request
+# Per-cluster locks so concurrent callers build each cached client only once
+_client_locks: Dict[str, Lock] = {}
+_client_locks_lock = Lock()
+
+
+def _get_pool_manager(proxy_url: Optional[str], cert_file: Optional[str], cert_server_name: Optional[str]):
+    """Get a shared urllib3 manager, creating it on first use.
     
-    if _original_vast_client_request is not None:
-        return  # Already patched
+    Reusing the manager keeps HTTP connections alive between requests, so only
+    the first request to a cluster pays for the TCP and TLS handshakes.
     
-    _original_vast_client_request = VASTClient.request
-    
-    def patched_request(self, method, fields=None, data=None):
-        """Patched request method that adds timeout and retry configuration."""
+    Args:
+        proxy_url: Proxy URL string, or None for a direct connection.
+        cert_file: CA certificate file for verification, or None to skip verification.
+        cert_server_name: Server hostname to verify the certificate against.
+        
+    Returns:
+        An urllib3 PoolManager, ProxyManager or SOCKSProxyManager instance.
+    """
+    key = (proxy_url, cert_file, cert_server_name)
+    with _pool_managers_lock:
+        pm = _pool_managers.get(key)
+        if pm is not None:
+            return pm
+        
         # Create retry configuration
         retry_config = urllib3.util.retry.Retry(
             total=API_MAX_RETRIES,
@@ -124,25 +141,49 @@ def _patch_vast_client_request():
         )
         
         # Build common kwargs for the connection manager
+        # maxsize keeps enough idle connections per host for concurrent lookups
         manager_kwargs = {
             'retries': retry_config,
             'timeout': timeout_config,
+            'maxsize': API_PARALLEL_WORKERS,
         }
 
-        if self._cert_file:
-            manager_kwargs['ca_certs'] = self._cert_file
-            manager_kwargs['server_hostname'] = self._cert_server_name
+        if cert_file:
+            manager_kwargs['ca_certs'] = cert_file
+            manager_kwargs['server_hostname'] = cert_server_name
         else:
             manager_kwargs['cert_reqs'] = 'CERT_NONE'
             urllib3.disable_warnings(category=urllib3.exceptions.InsecureRequestWarning)
 
+        # Create the appropriate PoolManager / ProxyManager / SOCKSProxyManager
+        pm = _create_pool_manager(proxy_url, **manager_kwargs)
+        _pool_managers[key] = pm
+        return pm
+
+
+# Monkey-patch VASTClient.request() to add timeout and retry configuration
+# VASTClient creates a new PoolManager for each request, so we patch the request method
+# to use a shared PoolManager carrying our timeout and retry settings
+_original_vast_client_request = None
+
+def _patch_vast_client_request():
+    """Patch VASTClient.request() to add timeout and retry configuration."""
+    global _original_vast_client_request
+    
+    if _original_vast_client_request is not None:
+        return  # Already patched
+    
+    _original_vast_client_request = VASTClient.request
+    
+    def patched_request(self, method, fields=None, data=None):
+        """Patched request method that adds timeout and retry configuration."""
         # Detect proxy from environment variables (respects NO_PROXY)
         proxy_url = _get_proxy_url(self._address)
         if proxy_url:
             logging.debug("Routing request to %s through proxy %s", self._address, proxy_url)
 
-        # Create the appropriate PoolManager / ProxyManager / SOCKSProxyManager
-        pm = _create_pool_manager(proxy_url, **manager_kwargs)
+        # Reuse the shared PoolManager / ProxyManager / SOCKSProxyManager (keeps connections alive)
+        pm = _get_pool_manager(proxy_url, self._cert_file, self._cert_server_name)
         
         # Rest of the request logic (copied from VASTClient.request)
         if self._token:
@@ -196,6 +237,9 @@ from .cache import get_cache_manager
 NON_PAGINATED_ENDPOINTS = ['monitors.ad_hoc_query', 'iodata']
 # Monitor query endpoints follow pattern monitors.{id}.query - handle dynamically
 
+# Shared pool for fetching the pages of a paginated GET concurrently (page requests only, never nested)
+_page_executor = ThreadPoolExecutor(max_workers=API_PARALLEL_WORKERS, thread_name_prefix='vast-page')
+
 # Valid VAST API object types for security validation
 VALID_OBJECT_TYPES = {
     'views', 'tenants', 'snapshots', 'volumes', 'quotas', 'vippools',
@@ -318,13 +362,8 @@ def resolve_cluster_identifier(identifier: str, config: dict, client_cache: Opti
                             if client_cache and c['cluster'] in client_cache:
                                 client = client_cache[c['cluster']]
                             else:
-                                # Create temporary client to query cluster name
-                                username = c['username']
-                                password = retrieve_password_secure(c['cluster'], username, c['password'])
-                                if c.get('user_type') == 'SUPER_ADMIN':
-                                    client = VASTClient(address=c['cluster'], user=username, password=password, version='latest')
-                                else:
-                                    client = VASTClient(address=c['cluster'], user=username, password=password, tenant=c.get('tenant', ''), version='latest')
+                                # Query the cluster name with the cluster's shared client
+                                client = _get_shared_client(c['cluster'], c)
                                 
                                 # Cache the client if cache dict provided
                                 if client_cache is not None:
@@ -421,20 +460,49 @@ def create_vast_client(cluster: str, use_cache: bool = True):
     """
     cfg = load_config()
     
-    # Check cache first if enabled
-    if use_cache:
-        # Resolve to address for cache lookup
-        try:
-            cluster_address, _, _ = resolve_cluster_identifier(cluster, cfg)
-            cached_client = _cache_manager.get('client', cluster_address)
-            if cached_client is not None:
-                return cached_client
-        except ValueError:
-            # If resolution fails, continue to create new client
-            pass
-    
     # Use shared resolution function
     cluster_address, cluster_info, _ = resolve_cluster_identifier(cluster, cfg)
+    
+    if not use_cache:
+        return _build_vast_client(cluster_address, cluster_info)
+    return _get_shared_client(cluster_address, cluster_info)
+
+
+def _get_shared_client(cluster_address: str, cluster_info: Dict[str, Any]):
+    """Get the process-wide VAST client of a resolved cluster, building it on first use.
+    
+    Args:
+        cluster_address: Resolved cluster address
+        cluster_info: Cluster configuration entry
+        
+    Returns:
+        VAST client instance
+    """
+    # One client per cluster for the whole process - its connections are reused across calls
+    cached_client = _cache_manager.get('client', cluster_address)
+    if cached_client is not None:
+        return cached_client
+    with _client_locks_lock:
+        client_lock = _client_locks.setdefault(cluster_address, Lock())
+    with client_lock:
+        # Another thread may have built it while we waited
+        cached_client = _cache_manager.get('client', cluster_address)
+        if cached_client is None:
+            cached_client = _build_vast_client(cluster_address, cluster_info)
+            _cache_manager.set('client', cluster_address, cached_client)
+    return cached_client
+
+
+def _build_vast_client(cluster_address: str, cluster_info: Dict[str, Any]):
+    """Build a new VAST client with wrapped API methods for a resolved cluster.
+    
+    Args:
+        cluster_address: Resolved cluster address
+        cluster_info: Cluster configuration entry
+        
+    Returns:
+        VAST client instance
+    """
     username = cluster_info['username']
     
     # Retrieve password securely
@@ -475,10 +543,6 @@ def create_vast_client(cluster: str, use_cache: bool = True):
                         setattr(attr, method_name, wrapped)
                         wrapped_methods.add(method_id)
         
-        # Cache the client if caching is enabled
-        if use_cache:
-            _cache_manager.set('client', cluster_address, client)
-        
         return client
     except Exception as e:
         logging.error(f"Failed to create VAST client for cluster {cluster_address}. Error: {e}")
@@ -506,13 +570,28 @@ def _build_query_string(params: Dict[str, Any], tenant_id: Optional[str] = None)
     return "&".join(query_parts)
 
 
+def _remaining_page_numbers(count: Any, page_size: int, page: int) -> List[int]:
+    """Page numbers after `page` needed to read `count` items, or [] if count is unknown."""
+    if not isinstance(count, int) or page_size <= 0:
+        return []
+    last_page = -(-count // page_size)
+    return list(range(page + 1, last_page + 1))
+
+
+def _log_api_request(method: str, endpoint: str, params: Dict[str, Any], tenant_id: Optional[str] = None):
+    """Log an API request at debug level; the query string is only built when debug logging is on."""
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"API Request: {method.upper()} /api/{endpoint}/?{_build_query_string(params, tenant_id)}")
+
+
 def call_vast_api(
     client: VASTClient,
     endpoint: str,
     method: str = 'get',
     params: Optional[Dict[str, Any]] = None,
     tenant_id: Optional[str] = None,
-    whitelist: Optional[Dict[str, List[str]]] = None
+    whitelist: Optional[Dict[str, FrozenSet[str]]] = None,
+    max_results: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """Unified function to call VAST API endpoints with whitelist validation.
     
@@ -531,8 +610,10 @@ def call_vast_api(
         params: Query parameters for the API call
         tenant_id: Optional tenant ID for tenant-scoped queries
         whitelist: Optional whitelist dict. If None, no validation is performed.
-                   Format: {endpoint: [allowed_methods]}, defaults to ['get'] if endpoint listed without methods
+                   Format: {endpoint: frozenset(allowed_methods)}, defaults to {'get'} if endpoint listed without methods
                    Empty dict = deny all (restrictive default)
+        max_results: Optional cap on the number of results for paginated GET requests.
+                     Pagination stops as soon as this many results were received.
     
     Returns:
         List of result dictionaries (normalized from paginated responses)
@@ -552,7 +633,7 @@ def call_vast_api(
     if whitelist is not None:
         # Check if endpoint is whitelisted
         endpoint_allowed = False
-        allowed_methods = []
+        allowed_methods = frozenset()
         parent_endpoint = None
         
         # Direct match
@@ -584,9 +665,9 @@ def call_vast_api(
             raise ValueError(error_msg)
         
         # Check HTTP method if restrictions exist
-        # Note: allowed_methods is never empty now (defaults to ['get']), so we always check
+        # Note: allowed_methods is never empty now (defaults to {'get'}), so we always check
         if method not in allowed_methods:
-            methods_str = ', '.join(allowed_methods)
+            methods_str = ', '.join(sorted(allowed_methods))
             error_msg = (
                 f"Access denied: HTTP method '{method.upper()}' is not allowed for endpoint '{endpoint}'. "
                 f"Allowed methods: [{methods_str}]"
@@ -657,9 +738,7 @@ def call_vast_api(
     is_non_paginated = endpoint in NON_PAGINATED_ENDPOINTS or (endpoint.startswith('monitors.') and '.query' in endpoint and endpoint.count('.') >= 2)
     if method == 'get' and is_non_paginated:
         # Don't add page_size or page parameters for monitors.ad_hoc_query
-        # Build query string for logging
-        query_string = _build_query_string(request_params, tenant_id)
-        logging.debug(f"API Request: {method.upper()} /api/{endpoint}/?{query_string}")
+        _log_api_request(method, endpoint, request_params, tenant_id)
         
         # Make API call (no pagination, no page parameter)
         try:
@@ -683,29 +762,29 @@ def call_vast_api(
         # Regular GET requests with pagination support
         # Ensure page_size is set (unless explicitly provided)
         if 'page_size' not in request_params:
-            request_params['page_size'] = REST_PAGE_SIZE
+            request_params['page_size'] = REST_PAGE_SIZE if max_results is None else min(REST_PAGE_SIZE, max_results)
         
-        all_results = []
-        page = 1
-        
-        while True:
+        def _get_page(page: int):
             # Prepare parameters for this page
             current_params = request_params.copy()
             current_params['page'] = page
             
-            # Build query string for logging
-            query_string = _build_query_string(current_params, tenant_id)
-            logging.debug(f"API Request: {method.upper()} /api/{endpoint}/?{query_string}")
+            _log_api_request(method, endpoint, current_params, tenant_id)
             
             # Make API call
             try:
                 if tenant_id:
-                    result = endpoint_obj.get(tenant_id=tenant_id, **current_params)
-                else:
-                    result = endpoint_obj.get(**current_params)
+                    return endpoint_obj.get(tenant_id=tenant_id, **current_params)
+                return endpoint_obj.get(**current_params)
             except Exception as e:
                 logging.error(f"API call failed for endpoint '{endpoint}': {e}")
                 raise
+        
+        all_results = []
+        page = 1
+        
+        while True:
+            result = _get_page(page)
             
             # Handle response format
             if isinstance(result, dict):
@@ -714,11 +793,25 @@ def call_vast_api(
                     page_results = result.get('results', [])
                     all_results.extend(page_results)
                     
+                    # Stop early once the caller has enough results
+                    if max_results is not None and len(all_results) >= max_results:
+                        break
+                    
                     # Check if there are more pages
                     # VAST API uses 'count' for total items and 'next' URL for pagination
                     # When 'next' is null/None, there are no more pages
                     if result.get('next') is None or len(page_results) == 0:
                         break
+                    
+                    # The first page tells how many pages remain - fetch them concurrently
+                    remaining_pages = _remaining_page_numbers(result.get('count'), len(page_results), page)
+                    if page == 1 and max_results is None and remaining_pages:
+                        for page_result in _page_executor.map(_get_page, remaining_pages):
+                            if isinstance(page_result, dict):
+                                all_results.extend(page_result.get('results', []))
+                            elif isinstance(page_result, list):
+                                all_results.extend(page_result)
+                        break
                     page += 1
                 else:
                     # Single object response
@@ -733,14 +826,14 @@ def call_vast_api(
                 logging.warning(f"Unexpected response format from endpoint '{endpoint}': {type(result)}")
                 break
         
+        if max_results is not None:
+            return all_results[:max_results]
         return all_results
     # Note: The elif block for non-paginated endpoints was removed as it's a duplicate
     # of the first if block. This code path should never be reached.
     else:
         # Non-GET methods (post, patch, delete, put)
-        # Build query string for logging
-        query_string = _build_query_string(request_params, tenant_id)
-        logging.debug(f"API Request: {method.upper()} /api/{endpoint}/?{query_string}")
+        _log_api_request(method, endpoint, request_params, tenant_id)
         
         # Get the appropriate method
         method_func = getattr(endpoint_obj, method, None)
@@ -772,7 +865,7 @@ def call_vast_api(
 
 
 # Get object id by name
-def get_id_by_name(client: VASTClient, object_type: str, name: str, field: str='name', tenant_id: str = None, whitelist: Optional[Dict[str, List[str]]] = None) -> Optional[str]:
+def get_id_by_name(client: VASTClient, object_type: str, name: str, field: str='name', tenant_id: str = None, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> Optional[str]:
     """Get object ID by name.
     
     Args:
@@ -814,7 +907,7 @@ def get_id_by_name(client: VASTClient, object_type: str, name: str, field: str='
         return None
 
 # Get object name by id
-def get_name_by_id(client: VASTClient, object_type: str, object_id: str, field: str='name', tenant_id: str = None, whitelist: Optional[Dict[str, List[str]]] = None) -> Optional[str]:
+def get_name_by_id(client: VASTClient, object_type: str, object_id: str, field: str='name', tenant_id: str = None, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> Optional[str]:
     """Get object name by ID.
     
     Args:
@@ -856,7 +949,7 @@ def get_name_by_id(client: VASTClient, object_type: str, object_id: str, field:
         return None
 
 # Get object by name (returns full object)
-def get_object_by_name(client: VASTClient, object_type: str, name: str, tenant_id: str = None, whitelist: Optional[Dict[str, List[str]]] = None) -> Optional[Dict[str, Any]]:
+def get_object_by_name(client: VASTClient, object_type: str, name: str, tenant_id: str = None, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> Optional[Dict[str, Any]]:
     """Get full object by name.
     
     Args:
@@ -11,14 +11,18 @@ import json
 import logging
 import subprocess
 import shutil
-import fnmatch
 import re
+import weakref
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 
 from .template_parser import TemplateParser
 from .client import create_vast_client, call_vast_api
 from .config import load_config, JQ_TIMEOUT_SECONDS
+from .data_processors import (
+    JQ_AVAILABLE, compile_jq, dumps_json_bytes, loads_json, lowercase_key_map,
+    jq_worker_supported, run_jq, run_jq_program, run_jq_worker, wildcard_to_regex
+)
 from .utils import (
     parse_filter_value, parse_capacity_value, parse_order_spec, apply_ordering, 
     format_time_delta, normalize_field_name, to_python_name, to_raw_field_name
@@ -33,6 +37,9 @@ def check_jq_available() -> bool:
 class CommandExecutor:
     """Executes templated commands with data transformation pipeline"""
     
+    # template_parser -> {(command_name, arg_name, row keys): (field_name, is_list_field)}
+    _resolve_caches = weakref.WeakKeyDictionary()
+    
     def __init__(self, template_parser: TemplateParser, cluster: Optional[str] = None, client=None):
         self.template_parser = template_parser
         self.cluster = cluster
@@ -345,11 +352,11 @@ class CommandExecutor:
             return api_data
         
         filtered_data = {}
+        match_wildcard = self._match_wildcard
         
         for endpoint, data_list in api_data.items():
-            filtered_list = data_list.copy()
-            
-            # Apply each client filter
+            # Resolve every applicable filter first, then check all of them per row in one pass
+            filter_specs = []  # (field_name, pattern, is_list_field)
             for arg_name, filter_config in self._client_filters.items():
                 # Skip computed fields - they'll be filtered after transformation
                 if filter_config.get('computed', False):
@@ -377,17 +384,20 @@ class CommandExecutor:
                 field_name = self._get_response_field_name(command_name, arg_name, api_param_name)
                 
                 # Check if field exists in the data (skip if it doesn't - might be computed)
-                if filtered_list and field_name not in filtered_list[0]:
+                if data_list and field_name not in data_list[0]:
                     logging.debug(f"Skipping client-side filter on raw API data for field '{arg_name}' (field '{field_name}' not in API response, might be computed)")
                     continue
                 
-                # Filter rows that match the wildcard pattern
-                filtered_list = [
-                    row for row in filtered_list
-                    if self._match_wildcard(row.get(field_name), pattern, is_list_field=is_list_field)
-                ]
+                filter_specs.append((field_name, pattern, is_list_field))
             
-            filtered_data[endpoint] = filtered_list
+            # Keep rows matching every wildcard pattern; a row is dropped at its first failing filter
+            filtered_data[endpoint] = [
+                row for row in data_list
+                if all(
+                    match_wildcard(row.get(field_name), pattern, is_list_field=is_list_field)
+                    for field_name, pattern, is_list_field in filter_specs
+                )
+            ]
         
         return filtered_data
     
@@ -411,9 +421,8 @@ class CommandExecutor:
         sample_row = data[0] if data else {}
         available_fields = list(sample_row.keys())
         
-        filtered_list = data.copy()
-        
-        # Apply each client filter
+        # Resolve every filter's field first, then check all of them per row in one pass
+        filter_specs = []  # (field_to_use, pattern, is_list_field)
         for arg_name, filter_config in self._client_filters.items():
             api_param_name = filter_config['field']
             pattern = filter_config['pattern']
@@ -426,20 +435,25 @@ class CommandExecutor:
                 continue
             
             field_to_use, is_list_field = field_resolution
-            
-            # Filter rows that match the wildcard pattern
-            initial_count = len(filtered_list)
-            filtered_list = [
-                row for row in filtered_list
-                if self._match_wildcard(row.get(field_to_use), pattern, is_list_field=is_list_field)
-            ]
-            
-            logging.debug(f"Applied client-side filter '{arg_name}' with pattern '{pattern}' on field '{field_to_use}': {initial_count} -> {len(filtered_list)} rows")
-            
-            # Debug: show sample values if filtering removed all results
-            if len(filtered_list) == 0 and initial_count > 0:
+            filter_specs.append((field_to_use, pattern, is_list_field))
+        
+        # Keep rows matching every wildcard pattern; a row is dropped at its first failing filter
+        match_wildcard = self._match_wildcard
+        filtered_list = [
+            row for row in data
+            if all(
+                match_wildcard(row.get(field_to_use), pattern, is_list_field=is_list_field)
+                for field_to_use, pattern, is_list_field in filter_specs
+            )
+        ]
+        
+        logging.debug(f"Applied client-side filters {[(field, pattern) for field, pattern, _ in filter_specs]} on transformed data: {len(data)} -> {len(filtered_list)} rows")
+        
+        # Debug: show sample values if filtering removed all results
+        if not filtered_list and filter_specs:
+            for field_to_use, pattern, _ in filter_specs:
                 sample_values = [str(row.get(field_to_use)) for row in data[:5] if field_to_use in row]
-                logging.debug(f"Filter '{pattern}' removed all rows. Sample values from field '{field_to_use}': {sample_values}")
+                logging.debug(f"Filters removed all rows. Sample values from field '{field_to_use}' (pattern '{pattern}'): {sample_values}")
         
         return filtered_list
     
@@ -461,10 +475,18 @@ class CommandExecutor:
         Returns:
             Tuple of (field_name, is_list_field) if found, None otherwise
         """
+        # Resolution only depends on the template and the row schema (key order included),
+        # so it is memoized per template parser - the parser is shared across clusters of one call
+        resolve_cache = self._resolve_caches.setdefault(self.template_parser, {})
+        cache_key = (command_name, arg_name, tuple(sample_row))
+        if cache_key in resolve_cache:
+            return resolve_cache[cache_key]
+        
         # Try multiple variations: space, underscore, normalized
         field_name_space = normalize_field_name(arg_name, 'to_space')
-        field_name_underscore = to_python_name(arg_name)
-        normalized_field_name = to_python_name(arg_name)
+        arg_name_normalized = to_python_name(arg_name)
+        field_name_underscore = arg_name_normalized
+        normalized_field_name = arg_name_normalized
         
         # Check what the actual field name is in the YAML template
         fields = self.template_parser.get_fields(command_name)
@@ -476,7 +498,6 @@ class CommandExecutor:
             if field_name:
                 # Normalize both for comparison
                 field_name_normalized = to_python_name(field_name)
-                arg_name_normalized = to_python_name(arg_name)
                 if (field_name == arg_name or 
                     field_name == field_name_space or
                     field_name_normalized == arg_name_normalized):
@@ -490,6 +511,7 @@ class CommandExecutor:
         # Try to find the field in the sample row
         # Check all possible variations
         field_to_use = None
+        lowercase_keys = lowercase_key_map(cache_key[2])
         candidates = [actual_field_name, field_name_space, field_name_underscore, normalized_field_name]
         # Also try case-insensitive matching
         for candidate in candidates:
@@ -501,22 +523,19 @@ class CommandExecutor:
                 logging.debug(f"Found field '{field_to_use}' in transformed data for filter '{arg_name}'")
                 break
             # Try case-insensitive match
-            for key in sample_row.keys():
-                if key.lower() == candidate.lower():
-                    field_to_use = key
-                    logging.debug(f"Found field '{field_to_use}' (case-insensitive match) in transformed data for filter '{arg_name}'")
-                    break
+            field_to_use = lowercase_keys.get(candidate.lower())
             if field_to_use:
+                logging.debug(f"Found field '{field_to_use}' (case-insensitive match) in transformed data for filter '{arg_name}'")
                 break
         
         if not field_to_use:
             # Field not found - try to find it by checking all fields with similar names
             # This handles cases where field names might be slightly different
+            arg_normalized = arg_name_normalized.lower()
+            field_space_normalized = to_python_name(field_name_space).lower()
             for key in sample_row.keys():
                 # Normalize both for comparison
                 key_normalized = to_python_name(key).lower()
-                arg_normalized = to_python_name(arg_name).lower()
-                field_space_normalized = to_python_name(field_name_space).lower()
                 
                 if (key_normalized == arg_normalized or 
                     key_normalized == field_space_normalized or
@@ -530,7 +549,8 @@ class CommandExecutor:
             logging.warning(f"Field '{arg_name}' not found in transformed data. Tried: {[actual_field_name, field_name_space, field_name_underscore, normalized_field_name]}. Available fields: {available_fields}")
             return None
         
-        return (field_to_use, is_list_field)
+        resolve_cache[cache_key] = (field_to_use, is_list_field)
+        return resolve_cache[cache_key]
     
     def _get_response_field_name(self, command_name: str, arg_name: str, api_param_name: str) -> str:
         """Get the actual field name in API response for a given argument
@@ -591,38 +611,34 @@ class CommandExecutor:
         
         # Handle list fields (comma-separated values) - check if pattern exists in the list
         if is_list_field:
-            value_str = str(value).strip()
-            if not value_str:
-                return False
-            
             # Support both "in:value" syntax and plain "value" syntax
             if pattern.startswith('in:'):
                 search_value = pattern[3:].strip()
             else:
                 search_value = pattern.strip()
+            search_lower = search_value.lower()
             
-            # Split the comma-separated list and check each entry
-            list_items = [item.strip() for item in value_str.split(',')]
-            
-            # Check for exact match (case-insensitive)
-            for item in list_items:
-                if item.lower() == search_value.lower():
-                    return True
+            # Walk the list entries lazily and stop at the first match
+            if isinstance(value, (list, tuple)):
+                if ',' in search_value:
+                    # Pattern spans entries - only the joined form can match it
+                    list_items = iter([','.join(str(item).strip() for item in value)])
+                else:
+                    list_items = (str(item).strip() for item in value)
+            else:
+                value_str = str(value).strip()
+                if not value_str:
+                    return False
+                list_items = (item.strip() for item in value_str.split(','))
             
-            # Also support wildcard matching within list items
+            # Wildcard matching within list items
             # e.g., "*user*" should match if any item in the list contains "user"
             if '*' in search_value or '?' in search_value:
-                for item in list_items:
-                    if fnmatch.fnmatch(item, search_value):
-                        return True
-                return False
-            
-            # For plain strings, also check substring match (case-insensitive)
-            for item in list_items:
-                if search_value.lower() in item.lower():
-                    return True
+                regex = wildcard_to_regex(search_value)
+                return any(item.lower() == search_lower or regex.match(item) for item in list_items)
             
-            return False
+            # For plain strings, a substring match (case-insensitive) also covers exact matches
+            return any(search_lower in item.lower() for item in list_items)
         
         # Try to parse the pattern using the same logic as parse_filter_value
         # We need to detect the filter type and apply appropriate matching
@@ -724,8 +740,8 @@ class CommandExecutor:
             # Plain string match (case-insensitive substring for backward compatibility)
             # But also support exact match if no wildcards
             if '*' in pattern or '?' in pattern or '[' in pattern:
-                # Use fnmatch for wildcard patterns
-                return fnmatch.fnmatch(value_str, pattern)
+                # Use a cached compiled regex for wildcard patterns (same semantics as fnmatch on POSIX)
+                return wildcard_to_regex(pattern).match(value_str) is not None
             else:
                 # For plain strings, do case-insensitive substring match
                 # This allows filtering by partial matches (e.g., "loc1" matches "loc1", "loc1-policy", etc.)
@@ -999,6 +1015,9 @@ class CommandExecutor:
         fields = self.template_parser.get_fields(command_name)
         transformed = []
         
+        # The template's jq expressions are fixed - compile them once for all rows
+        jq_programs = self._compile_field_jq(fields)
+        
         for row in data:
             new_row = {}
             
@@ -1133,7 +1152,7 @@ class CommandExecutor:
                 if value is not None:
                     # jq transformation
                     if 'jq' in field_config:
-                        value = self._apply_jq(value, field_config['jq'])
+                        value = self._apply_jq(value, field_config['jq'], jq_programs.get(field_config['jq']))
                     
                     # Unit conversion
                     if 'convert' in field_config:
@@ -1171,8 +1190,45 @@ class CommandExecutor:
         
         return transformed
     
-    def _apply_jq(self, value: Any, jq_expr: str) -> Any:
-        """Apply jq expression to value using the system jq command"""
+    def _compile_field_jq(self, fields: List[Dict]) -> Dict[str, Any]:
+        """Compile each distinct jq expression in the field configs once
+        
+        Returns a mapping of jq expression (as written in the template) to compiled program.
+        Empty without the jq bindings; expressions that fail to compile are left out so
+        _apply_jq reports the error per value as before.
+        """
+        programs = {}
+        if not JQ_AVAILABLE:
+            return programs
+        for field_config in fields:
+            jq_expr = field_config.get('jq')
+            if not jq_expr or jq_expr in programs:
+                continue
+            try:
+                programs[jq_expr] = compile_jq(self._unescape_jq(jq_expr))
+            except Exception:
+                continue
+        return programs
+    
+    @staticmethod
+    def _unescape_jq(jq_expr: str) -> str:
+        """Unescape a jq expression (YAML may have escaped quotes like join(\",\"))"""
+        return jq_expr.replace('\\"', '"').replace("\\'", "'")
+    
+    def _apply_jq(self, value: Any, jq_expr: str, program: Any = None) -> Any:
+        """Apply jq expression to value, in-process when the jq bindings are installed, else via the system jq command
+        
+        If program is given (precompiled by _compile_field_jq), it is run directly.
+        """
+        if JQ_AVAILABLE:
+            try:
+                if program is not None:
+                    return run_jq_program(program, value)
+                return run_jq(value, self._unescape_jq(jq_expr))
+            except Exception as e:
+                logging.warning("jq expression '%s' failed: %s. Returning original value.", jq_expr, e)
+                return value
+        
         # Check if jq is available
         if not check_jq_available():
             logging.error(
@@ -1192,21 +1248,29 @@ class CommandExecutor:
             return value
         
         try:
-            # Unescape the jq expression (YAML may have escaped quotes like join(\",\"))
-            # Replace \" with " and \' with '
-            jq_expr_unescaped = jq_expr.replace('\\"', '"').replace("\\'", "'")
+            jq_expr_unescaped = self._unescape_jq(jq_expr)
             
             # Convert value to JSON string
-            input_json = json.dumps(value)
+            input_json = dumps_json_bytes(value)
             
             # Debug logging: log jq command details
-            input_preview = input_json[:200] + "..." if len(input_json) > 200 else input_json
-            logging.debug(f"Executing jq command: expression='{jq_expr_unescaped}', input_length={len(input_json)} bytes, input_preview={input_preview}")
+            logging.debug(
+                "Executing jq command: expression='%s', input_length=%d bytes, input_preview=%.200s%s",
+                jq_expr_unescaped, len(input_json), input_json[:200].decode('utf-8', errors='ignore'), "..." if len(input_json) > 200 else ""
+            )
+            
+            if jq_worker_supported(jq_expr_unescaped):
+                # Reuse a running jq process for this expression instead of starting one per value
+                try:
+                    return run_jq_worker(jq_expr_unescaped, input_json)
+                except ValueError as e:
+                    logging.warning("jq expression '%s' failed: %s. Returning original value.", jq_expr, e)
+                    return value
             
             # Run jq command
             result = subprocess.run(
                 ["jq", jq_expr_unescaped],
-                input=input_json.encode(),
+                input=input_json,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 timeout=JQ_TIMEOUT_SECONDS
@@ -1215,16 +1279,18 @@ class CommandExecutor:
             # Debug logging: log jq command result
             if result.returncode == 0:
                 output = result.stdout.decode('utf-8', errors='ignore').strip()
-                output_preview = output[:200] + "..." if len(output) > 200 else output
-                logging.debug(f"jq command succeeded: output_length={len(output)} bytes, output_preview={output_preview}")
+                logging.debug(
+                    "jq command succeeded: output_length=%d bytes, output_preview=%.200s%s",
+                    len(output), output, "..." if len(output) > 200 else ""
+                )
             else:
                 error_msg = result.stderr.decode('utf-8', errors='ignore')
-                logging.debug(f"jq command failed: returncode={result.returncode}, stderr={error_msg}")
+                logging.debug("jq command failed: returncode=%s, stderr=%s", result.returncode, error_msg)
             
             if result.returncode != 0:
                 # jq failed, log error and return original value
                 error_msg = result.stderr.decode('utf-8', errors='ignore')
-                logging.warning(f"jq expression '{jq_expr}' failed: {error_msg}. Returning original value.")
+                logging.warning("jq expression '%s' failed: %s. Returning original value.", jq_expr, error_msg)
                 return value
             
             # Parse the output
@@ -1232,7 +1298,7 @@ class CommandExecutor:
             
             # Try to parse as JSON, fall back to string if not valid JSON
             try:
-                return json.loads(output)
+                return loads_json(output)
             except json.JSONDecodeError:
                 # If output is not valid JSON (e.g., a string), return as-is
                 # Remove surrounding quotes if present
@@ -1241,14 +1307,14 @@ class CommandExecutor:
                 return output
                 
         except subprocess.TimeoutExpired:
-            logging.warning(f"jq expression '{jq_expr}' timed out. Returning original value.")
+            logging.warning("jq expression '%s' timed out. Returning original value.", jq_expr)
             return value
         except FileNotFoundError:
             # jq command not found (shouldn't happen if check_jq_available passed)
             logging.error("jq command not found. Please install jq: https://github.com/jqlang/jq/releases")
             return value
         except Exception as e:
-            logging.warning(f"Error applying jq expression '{jq_expr}': {e}. Returning original value.")
+            logging.warning("Error applying jq expression '%s': %s. Returning original value.", jq_expr, e)
             return value
     
     def _evaluate_condition(self, condition_config: Dict, row: Dict, field_name_for_logging: str = None) -> bool:
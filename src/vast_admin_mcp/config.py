@@ -2,14 +2,31 @@
 
 import os
 import json
+import functools
 import logging
 from enum import Enum
 from pathlib import Path
+from typing import Optional
 import sys
+import tempfile
 
 # Import version from single source of truth
 from .__about__ import __version__
 
+# Try to import orjson for faster config parsing
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import msgpack for the binary config cache sidecar
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 # Constants
 VERSION = __version__  # Re-export for backward compatibility
 
@@ -56,11 +73,38 @@ DEFAULT_TEMPLATE_FILE = _DEFAULT_TEMPLATE_FILE_DEFAULT
 
 # User template modifications file (can be overridden via env var)
 _TEMPLATE_MODIFICATIONS_FILE_DEFAULT = os.path.join(os.path.expanduser("~"), '.vast-admin-mcp/mcp_list_template_modifications.yaml')
-TEMPLATE_MODIFICATIONS_FILE = os.environ.get('VAST_ADMIN_MCP_TEMPLATE_MODIFICATIONS_FILE', _TEMPLATE_MODIFICATIONS_FILE_DEFAULT)
 
 # View templates file location (can be overridden via env var)
 _VIEW_TEMPLATE_FILE_DEFAULT = os.path.join(os.path.expanduser("~"), '.vast-admin-mcp/view_templates.json')
-VIEW_TEMPLATE_FILE = os.environ.get('VAST_ADMIN_MCP_VIEW_TEMPLATE_FILE', _VIEW_TEMPLATE_FILE_DEFAULT)
+
+
+@functools.cache
+def get_template_modifications_file() -> str:
+    """Get the user template modifications file path.
+    
+    The environment override is resolved once and cached for the process lifetime.
+    
+    Returns:
+        Path to the template modifications YAML file
+    """
+    return os.environ.get('VAST_ADMIN_MCP_TEMPLATE_MODIFICATIONS_FILE') or _TEMPLATE_MODIFICATIONS_FILE_DEFAULT
+
+
+@functools.cache
+def get_view_template_file() -> str:
+    """Get the view templates file path.
+    
+    The environment override is resolved once and cached for the process lifetime.
+    
+    Returns:
+        Path to the view templates JSON file
+    """
+    return os.environ.get('VAST_ADMIN_MCP_VIEW_TEMPLATE_FILE') or _VIEW_TEMPLATE_FILE_DEFAULT
+
+
+# Deprecated: module attributes kept for backward compatibility, use the accessors above
+TEMPLATE_MODIFICATIONS_FILE = get_template_modifications_file()
+VIEW_TEMPLATE_FILE = get_view_template_file()
 
 # Log file location
 LOG_PATH = os.path.join(os.path.expanduser("~"), '.vast-admin-mcp/vast_admin_mcp.log')
@@ -81,6 +125,8 @@ METRICS_API_LIMIT = 10000  # Maximum number of metrics to retrieve from API
 GRANULARITY_THRESHOLD_SECONDS = 14400  # 4 hours - threshold for minutes granularity
 GRANULARITY_THRESHOLD_HOURS = 172800  # 2 days - threshold for hours granularity
 GRANULARITY_THRESHOLD_DAYS = 864000  # 10 days - threshold for days granularity
+PERFORMANCE_CACHE_TTL_SECONDS = {'seconds': 10, 'minutes': 60, 'hours': 300, 'days': 3600}  # How long identical list_performance results are cached, per granularity
+PERFORMANCE_CACHE_MAXSIZE = 256  # Maximum number of cached list_performance results per granularity
 
 # Excluded metric patterns for view performance
 EXCLUDED_VIEW_METRIC_PATTERNS = ['squares', 's3', 'rpc', 'time']
@@ -96,11 +142,18 @@ DATAFLOW_VALID_PROTOCOLS = ['NFS3', 'NFS4', 'S3', 'SMB', 'DATABASE', 'BLOCK']
 
 # jq command timeout
 JQ_TIMEOUT_SECONDS = 5
+JQ_WORKER_POOL_SIZE = 16  # Max long-lived jq processes (one per expression) when the jq bindings are missing
 
 # API request timeouts (in seconds)
 API_CONNECT_TIMEOUT = 5  # Connection timeout for API requests
 API_READ_TIMEOUT = 30  # Read timeout for API requests
 API_MAX_RETRIES = 1  # Maximum number of retries for failed API requests
+API_PARALLEL_WORKERS = 8  # Maximum number of independent API lookups issued concurrently
+LOOKUP_CACHE_TTL_SECONDS = 60  # How long name-to-ID lookups (tenants, policies) are cached
+DNS_CACHE_TTL_SECONDS = 300  # How long the cluster DNS domain suffix is cached
+VIP_POOL_CACHE_TTL_SECONDS = 300  # How long tenant/view policy VIP pool names are cached
+METRICS_MAP_CACHE_TTL_SECONDS = 300  # How long each cluster's metrics catalog (/metrics) is cached
+INSTANCES_CACHE_TTL_SECONDS = 60  # How long each cluster's instance lists (performance name resolution) are cached
 
 # Logging constants
 LOG_FILE_MAX_BYTES = 548576  # 0.5 MB - maximum size of log file before rotation
@@ -140,11 +193,74 @@ from .cache import get_cache_manager
 _cache_manager = get_cache_manager()
 
 
+def _stat_config_file() -> Optional[os.stat_result]:
+    """Stat the config file once, giving both its existence and its mtime.
+    
+    Returns:
+        os.stat_result of the config file, or None if it does not exist
+    """
+    try:
+        return os.stat(CONFIG_FILE)
+    except OSError:
+        return None
+
+
+def _config_signature(config_stat: os.stat_result) -> tuple:
+    """Identify a version of the config file by its nanosecond mtime and size.
+    
+    Float mtimes are too coarse on some filesystems to tell apart two edits within a second.
+    """
+    return (config_stat.st_mtime_ns, config_stat.st_size)
+
+
+def _read_config_sidecar(signature: tuple) -> Optional[dict]:
+    """Read the msgpack config cache sidecar if it matches the config file signature.
+    
+    Args:
+        signature: Current (st_mtime_ns, st_size) of the config file
+        
+    Returns:
+        Configuration dictionary, or None if the sidecar is missing, stale or unreadable
+    """
+    if not MSGPACK_AVAILABLE:
+        return None
+    try:
+        with open(CONFIG_FILE + '.cache', 'rb') as cache_file:
+            cached_signature, config = msgpack.unpackb(cache_file.read())
+        cached_signature = tuple(cached_signature)
+    except Exception:
+        return None
+    if cached_signature != signature or not isinstance(config, dict):
+        return None
+    return config
+
+
+def _write_config_sidecar(config: dict, signature: tuple) -> None:
+    """Write the parsed config to the msgpack cache sidecar, keyed by the config file signature.
+    
+    config.json stays the source of truth; failures here are logged and ignored.
+    
+    Args:
+        config: Parsed configuration dictionary
+        signature: (st_mtime_ns, st_size) of the config file the dictionary was parsed from
+    """
+    if not MSGPACK_AVAILABLE:
+        return
+    try:
+        fd = os.open(CONFIG_FILE + '.cache', os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as cache_file:
+            cache_file.write(msgpack.packb([list(signature), config]))
+    except Exception as e:
+        logging.debug(f"Could not write config cache sidecar: {e}")
+
+
 def load_config(force_reload: bool = False):
     """Load configuration from config file with caching.
     
     The configuration is cached in memory to avoid redundant file I/O operations.
-    The cache is invalidated if the file modification time changes.
+    The cache is invalidated if the file modification time or size changes.
+    When msgpack is installed, the parsed config is also kept in a
+    config.json.cache sidecar so new processes can skip JSON parsing.
     
     Args:
         force_reload: If True, bypass cache and reload from file
@@ -155,33 +271,37 @@ def load_config(force_reload: bool = False):
     Raises:
         ValueError: If config file not found or cannot be loaded
     """
-    # Check if file exists
-    if not os.path.isfile(CONFIG_FILE):
-        raise ValueError(f"config file:{CONFIG_FILE} not found. Please run setup command first.")
-    
-    # Get file modification time
-    try:
-        current_mtime = os.path.getmtime(CONFIG_FILE)
-    except OSError:
+    # One stat call gives both existence and mtime
+    config_stat = _stat_config_file()
+    if config_stat is None:
         # File might have been deleted, clear cache
         _cache_manager.clear('config')
         raise ValueError(f"config file:{CONFIG_FILE} not found. Please run setup command first.")
     
+    current_signature = _config_signature(config_stat)
+    
     # Return cached config if valid and not forcing reload
     if not force_reload:
-        cached_mtime = _cache_manager.get('config', '_file_mtime')
+        cached_signature = _cache_manager.get('config', '_file_signature')
         cached_config = _cache_manager.get('config', '_data')
-        if cached_config is not None and cached_mtime == current_mtime:
+        if cached_config is not None and cached_signature == current_signature:
             return cached_config
     
-    # Load config from file
+    # Load config from the sidecar if it is current, otherwise from the JSON file
     try:
-        with open(CONFIG_FILE, 'r') as config_file:
-            config = json.load(config_file)
+        config = None if force_reload else _read_config_sidecar(current_signature)
+        if config is None:
+            if ORJSON_AVAILABLE:
+                with open(CONFIG_FILE, 'rb') as config_file:
+                    config = orjson.loads(config_file.read())
+            else:
+                with open(CONFIG_FILE, 'r', encoding='utf-8') as config_file:
+                    config = json.load(config_file)
+            _write_config_sidecar(config, current_signature)
         
         # Update cache
         _cache_manager.set('config', '_data', config)
-        _cache_manager.set('config', '_file_mtime', current_mtime)
+        _cache_manager.set('config', '_file_signature', current_signature)
         
         return config
     except json.JSONDecodeError as e:
@@ -197,15 +317,81 @@ def clear_config_cache():
     """
     _cache_manager.clear('config')
 
-def save_config(config: dict):
-    """Save configuration to config file."""
+
+def update_config_cache(config: dict):
+    """Replace the cached configuration with a config that was just saved.
+    
+    Call after save_config() instead of clear_config_cache() so the next
+    load_config() returns this dictionary without re-reading the file.
+    
+    Args:
+        config: Configuration dictionary written by save_config()
+    """
+    config_stat = _stat_config_file()
+    if config_stat is None:
+        _cache_manager.clear('config')
+        return
+    signature = _config_signature(config_stat)
+    _write_config_sidecar(config, signature)
+    _cache_manager.set('config', '_data', config)
+    _cache_manager.set('config', '_file_signature', signature)
+
+
+def config_file_is_indented(config_file: str = CONFIG_FILE) -> bool:
+    """Check whether a config file is stored as indented JSON (e.g. by 'setup --pretty').
+    
+    Compact JSON is a single line, so any line break before the end means indented.
+    A missing or unreadable file counts as compact.
+    """
+    try:
+        with open(config_file, 'rb') as f:
+            head = f.read(4096)
+    except OSError:
+        return False
+    return b'\n' in head.strip()
+
+
+def save_config(config: dict, pretty: Optional[bool] = None):
+    """Save configuration to config file.
+    
+    The file is machine-written, so a new file is stored as compact JSON. An existing
+    file keeps its format, so automatic updates don't undo 'setup --pretty'.
+    It is written to a temporary file that then replaces the config file,
+    so readers never see a partially written config.
+    
+    Args:
+        config: Configuration dictionary
+        pretty: True for indented JSON, False for compact JSON,
+                None (default) to keep the format of the existing file
+    """
+    if pretty is None:
+        pretty = config_file_is_indented(CONFIG_FILE)
+    temp_path = None
     try:
         # Ensure directory exists
-        os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-        with open(CONFIG_FILE, 'w') as config_file:
-            json.dump(config, config_file, indent=2)
+        config_dir = os.path.dirname(CONFIG_FILE)
+        os.makedirs(config_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=config_dir, prefix='.config.', suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as config_file:
+            if pretty:
+                json.dump(config, config_file, indent=2, ensure_ascii=False)
+            else:
+                json.dump(config, config_file, separators=(',', ':'), ensure_ascii=False)
+        # Keep the permissions of the existing config file
+        try:
+            os.chmod(temp_path, os.stat(CONFIG_FILE).st_mode & 0o777)
+        except FileNotFoundError:
+            pass
+        os.replace(temp_path, CONFIG_FILE)
+        temp_path = None
     except Exception as e:
         raise ValueError(f"Error saving config file:{CONFIG_FILE}. Error: {e}")
+    finally:
+        if temp_path is not None:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
 
 
 def get_default_template_path():
@@ -6,22 +6,199 @@ import re
 import uuid
 import logging
 import os
-from typing import List, Optional, Dict, Any
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from typing import List, Optional, Dict, Any, FrozenSet
 from datetime import datetime, timezone, timedelta
 
-from vastpy import VASTClient
+from vastpy import VASTClient, RESTFailure
 
-from .config import load_config, CONFIG_FILE, VIEW_TEMPLATE_FILE, get_default_template_path
+from .config import (
+    load_config, CONFIG_FILE, get_view_template_file,
+    API_PARALLEL_WORKERS, LOOKUP_CACHE_TTL_SECONDS, DNS_CACHE_TTL_SECONDS, VIP_POOL_CACHE_TTL_SECONDS
+)
 from .utils import (
-    get_size_in_bytes, validate_path, format_simple_datetime, parse_time_duration, get_api_whitelist
+    get_size_in_bytes, validate_path, format_simple_datetime, parse_time_duration, get_api_whitelist,
+    check_api_method_allowed, parse_filter_value
 )
 from .client import (
     create_vast_client, get_id_by_name, resolve_cluster_identifier, call_vast_api
 )
 from .functions import list_dynamic
 from .template_parser import TemplateParser
-from .config import TEMPLATE_MODIFICATIONS_FILE, get_default_template_path
+from .cache import get_cache_manager
+
+# Try to import orjson for fast parsing of the view templates file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Try to import ijson for streaming the view templates file
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+
+# Shared pool for independent API lookups (vastpy is synchronous).
+# Only leaf lookups are submitted here - tasks must not wait on other tasks in this pool.
+_lookup_executor = ThreadPoolExecutor(max_workers=API_PARALLEL_WORKERS, thread_name_prefix='vast-lookup')
+
+_cache_manager = get_cache_manager()
+
 
+def _cached_id(client: VASTClient, cluster_address: str, object_type: str, name: str, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> Optional[str]:
+    """Get object ID by name, caching found IDs per cluster for LOOKUP_CACHE_TTL_SECONDS.
+    
+    Repeated create operations (e.g. create_view_from_template with count=N) resolve
+    the same tenant and policy names over and over; this collapses them to one call.
+    
+    Args:
+        client: VAST client instance
+        cluster_address: Cluster address (part of the cache key)
+        object_type: Type of object (e.g., 'tenants', 'viewpolicies')
+        name: Name of the object to find
+        whitelist: Optional API whitelist for validation
+        
+    Returns:
+        Object ID if found, None otherwise (misses are not cached)
+    """
+    cache_key = f"{cluster_address}:{object_type}:{name}"
+    object_id = _cache_manager.get('lookup_ids', cache_key)
+    if object_id is not None:
+        return object_id
+    object_id = get_id_by_name(client, object_type, name, whitelist=whitelist)
+    if object_id:
+        _cache_manager.set('lookup_ids', cache_key, object_id, ttl=LOOKUP_CACHE_TTL_SECONDS)
+    return object_id
+
+
+def invalidate_lookup_cache(cluster_address: Optional[str] = None) -> None:
+    """Drop cached name-to-ID lookups and VIP pool names.
+    
+    Call after tenants or policies are renamed, recreated or deleted, so the next
+    create operation resolves them from the cluster again.
+    
+    Args:
+        cluster_address: Only invalidate entries for this cluster (all clusters if None)
+    """
+    for cache_name in ('lookup_ids', 'vip_pools'):
+        if cluster_address is None:
+            _cache_manager.clear(cache_name)
+        else:
+            _cache_manager.delete_prefix(cache_name, f"{cluster_address}:")
+
+
+def _get_dns_domain(client: VASTClient, cluster_address: str, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> str:
+    """Get the cluster DNS domain suffix, cached per cluster for DNS_CACHE_TTL_SECONDS.
+    
+    Args:
+        client: VAST client instance
+        cluster_address: Cluster address (cache key)
+        whitelist: Optional API whitelist for validation
+        
+    Returns:
+        DNS domain suffix, or empty string if none is configured
+    """
+    dns_domain = _cache_manager.get('dns_domain', cluster_address)
+    if dns_domain is not None:
+        return dns_domain
+    dns_domain = ''
+    dns_config = call_vast_api(
+        client=client,
+        endpoint='dns',
+        method='get',
+        whitelist=whitelist
+    )
+    if dns_config and len(dns_config):
+        dns_domain = dns_config[0].get('domain_suffix', '') or ''
+    _cache_manager.set('dns_domain', cluster_address, dns_domain, ttl=DNS_CACHE_TTL_SECONDS)
+    return dns_domain
+
+
+def _policy_vip_pools(policy: Dict[str, Any]) -> List[str]:
+    # View policies carry a vip_pools list of pool names
+    return policy.get('vip_pools') or []
+
+
+def _tenant_vip_pools(tenant_obj: Dict[str, Any]) -> List[str]:
+    # Try vippool_names first (list of strings), then vippools (list of objects)
+    if tenant_obj.get('vippool_names'):
+        return tenant_obj['vippool_names']
+    if tenant_obj.get('vippools'):
+        return [vp['name'] for vp in tenant_obj['vippools']]
+    return []
+
+
+_VIP_POOL_EXTRACTORS = {
+    'viewpolicies': _policy_vip_pools,
+    'tenants': _tenant_vip_pools,
+}
+
+
+def _get_vip_pool_names(client: VASTClient, cluster_address: str, object_type: str, object_id: Any, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> List[str]:
+    """Get VIP pool names of a view policy or tenant, cached per cluster for VIP_POOL_CACHE_TTL_SECONDS.
+    
+    Args:
+        client: VAST client instance
+        cluster_address: Cluster address (part of the cache key)
+        object_type: 'viewpolicies' or 'tenants'
+        object_id: ID of the policy or tenant
+        whitelist: Optional API whitelist for validation
+        
+    Returns:
+        List of VIP pool names (empty if none are configured)
+    """
+    cache_key = f"{cluster_address}:{object_type}:{object_id}"
+    vip_pool_names = _cache_manager.get('vip_pools', cache_key)
+    if vip_pool_names is not None:
+        return vip_pool_names
+    vip_pool_names = []
+    result = call_vast_api(
+        client=client,
+        endpoint=object_type,
+        method='get',
+        params={'id': object_id},
+        whitelist=whitelist
+    )
+    if result and len(result):
+        vip_pool_names = _VIP_POOL_EXTRACTORS[object_type](result[0])
+    _cache_manager.set('vip_pools', cache_key, vip_pool_names, ttl=VIP_POOL_CACHE_TTL_SECONDS)
+    return vip_pool_names
+
+
+# Client path builders per protocol: (vip_pool_names, dns_suffix, view_path, share, bucket) -> paths
+# Only the VIP pool name varies per path; the protocol-specific parts are built once per call
+def _nfs_paths(vip_pool_names: List[str], suffix: str, view_path: str, share: str, bucket: str) -> List[str]:
+    # NFS path: <vip_pool>:<view_path>
+    nfs_tail = f"{suffix}:{view_path}"
+    return [vip_pool + nfs_tail for vip_pool in vip_pool_names]
+
+
+def _smb_paths(vip_pool_names: List[str], suffix: str, view_path: str, share: str, bucket: str) -> List[str]:
+    # SMB path: \\<vip_pool>\<share>
+    if not share:
+        return []
+    smb_tail = f"{suffix}\\{share}"
+    return ["\\\\" + vip_pool + smb_tail for vip_pool in vip_pool_names]
+
+
+def _s3_paths(vip_pool_names: List[str], suffix: str, view_path: str, share: str, bucket: str) -> List[str]:
+    # S3 path: https://<bucket>.s3.<vip_pool>
+    if not bucket:
+        return []
+    s3_head = f"https://{bucket}.s3."
+    return [s3_head + vip_pool + suffix for vip_pool in vip_pool_names]
+
+
+_PROTOCOL_PATH_BUILDERS = {
+    'NFS': _nfs_paths,
+    'SMB': _smb_paths,
+    'S3': _s3_paths,
+    'ENDPOINT': _s3_paths,
+}
 
 
 def get_user_paths(
@@ -47,8 +224,33 @@ def get_user_paths(
     # Get API whitelist
     whitelist = get_api_whitelist()
     
+    return _get_user_paths(client, cluster_address, tenant, view_path, whitelist)
+
+
+def _get_user_paths(
+    client: VASTClient,
+    cluster_address: str,
+    tenant: str,
+    view_path: str,
+    whitelist: Optional[Dict[str, FrozenSet[str]]] = None
+) -> List[Dict[str, str]]:
+    """Get user-facing access paths for a view on an already resolved cluster.
+    
+    Internal callers that already hold a client use this to skip config loading
+    and cluster resolution.
+    
+    Args:
+        client: VAST client instance
+        cluster_address: Resolved cluster address
+        tenant: Tenant name that owns the view
+        view_path: View path
+        whitelist: Optional API whitelist for validation
+        
+    Returns:
+        List of dictionaries containing protocol and client path
+    """
     # Get tenant ID
-    tenant_id = get_id_by_name(client, 'tenants', tenant, whitelist=whitelist)
+    tenant_id = _cached_id(client, cluster_address, 'tenants', tenant, whitelist=whitelist)
     if not tenant_id:
         raise ValueError(f"Tenant {tenant} not found on cluster {cluster_address}")
     
@@ -70,42 +272,28 @@ def get_user_paths(
     bucket = view.get('bucket', '')
     policy_id = view.get('policy_id')
     
+    # Policy, tenant and DNS details only depend on the view - fetch them concurrently
+    # (all three are cached per cluster, so repeated calls usually hit the cache)
+    policy_future = _lookup_executor.submit(
+        _get_vip_pool_names, client, cluster_address, 'viewpolicies', policy_id, whitelist=whitelist
+    ) if policy_id else None
+    tenant_future = _lookup_executor.submit(
+        _get_vip_pool_names, client, cluster_address, 'tenants', tenant_id, whitelist=whitelist
+    )
+    dns_future = _lookup_executor.submit(_get_dns_domain, client, cluster_address, whitelist=whitelist)
+    
     # Get VIP pool names from view policy
     vip_pool_names = []
-    if policy_id:
+    if policy_future:
         try:
-            policy = call_vast_api(
-                client=client,
-                endpoint='viewpolicies',
-                method='get',
-                params={'id': policy_id},
-                whitelist=whitelist
-            )
-            if policy and len(policy):
-                policy = policy[0]
-                # Check if policy has vip_pools field (list of pool names)
-                if 'vip_pools' in policy and policy['vip_pools']:
-                    vip_pool_names = policy['vip_pools']
+            vip_pool_names = policy_future.result()
         except Exception as e:
             logging.debug(f"Could not retrieve VIP pools from policy: {e}")
     
     # If no VIP pools in policy, get from tenant
     if not vip_pool_names:
         try:
-            tenant_obj = call_vast_api(
-                client=client,
-                endpoint='tenants',
-                method='get',
-                params={'id': tenant_id},
-                whitelist=whitelist
-            )
-            if tenant_obj and len(tenant_obj):
-                tenant_obj = tenant_obj[0]
-                # Try vippool_names first (list of strings), then vippools (list of objects)
-                if 'vippool_names' in tenant_obj and tenant_obj['vippool_names']:
-                    vip_pool_names = tenant_obj['vippool_names']
-                elif 'vippools' in tenant_obj and tenant_obj['vippools']:
-                    vip_pool_names = [vp['name'] for vp in tenant_obj['vippools']]
+            vip_pool_names = tenant_future.result()
         except Exception as e:
             logging.debug(f"Could not retrieve VIP pools from tenant: {e}")
     
@@ -117,59 +305,23 @@ def get_user_paths(
     # Get DNS domain suffix from cluster DNS configuration
     dns_domain = ''
     try:
-        dns_config = call_vast_api(
-            client=client,
-            endpoint='dns',
-            method='get',
-            whitelist=whitelist
-        )
-        if dns_config and len(dns_config):
-            dns_domain = dns_config[0].get('domain_suffix', '')
+        dns_domain = dns_future.result()
     except Exception as e:
         logging.debug(f"Could not retrieve DNS domain: {e}")
     
     # Normalize protocols to avoid duplicates (e.g., NFS and NFS4 should generate one path)
-    normalized_protocols = set()
-    for proto in protocols:
-        if proto.startswith('NFS'):
-            normalized_protocols.add('NFS')
-        else:
-            normalized_protocols.add(proto)
+    normalized_protocols = {'NFS' if proto.startswith('NFS') else proto for proto in protocols}
     
     # Build client paths
+    # DNS suffix is the same for every VIP pool - compute it once
+    suffix = f".{dns_domain}" if dns_domain else ""
     client_paths = []
     for protocol in normalized_protocols:
-        path_info = {'protocol': protocol}
-        
-        if protocol == 'NFS':
-            # NFS path: <vip_pool>:<view_path>
-            for vip_pool in vip_pool_names:
-                if dns_domain:
-                    nfs_path = f"{vip_pool}.{dns_domain}:{view_path}"
-                else:
-                    nfs_path = f"{vip_pool}:{view_path}"
-                path_info['path'] = nfs_path
-                client_paths.append(path_info.copy())
-        elif protocol == 'SMB':
-            # SMB path: \\<vip_pool>\<share>
-            if share:
-                for vip_pool in vip_pool_names:
-                    if dns_domain:
-                        smb_path = f"\\\\{vip_pool}.{dns_domain}\\{share}"
-                    else:
-                        smb_path = f"\\\\{vip_pool}\\{share}"
-                    path_info['path'] = smb_path
-                    client_paths.append(path_info.copy())
-        elif protocol in ['S3', 'ENDPOINT']:
-            # S3 path: https://<bucket>.s3.<vip_pool> or https://<vip_pool>/<bucket>
-            if bucket:
-                for vip_pool in vip_pool_names:
-                    if dns_domain:
-                        s3_path = f"https://{bucket}.s3.{vip_pool}.{dns_domain}"
-                    else:
-                        s3_path = f"https://{bucket}.s3.{vip_pool}"
-                    path_info['path'] = s3_path
-                    client_paths.append(path_info.copy())
+        builder = _PROTOCOL_PATH_BUILDERS.get(protocol)
+        if builder is None:
+            continue
+        for client_path in builder(vip_pool_names, suffix, view_path, share, bucket):
+            client_paths.append({'protocol': protocol, 'path': client_path})
     
     return client_paths
 
@@ -208,6 +360,32 @@ def create_view(
     # Use shared resolution function
     cluster_address, cluster_config, _ = resolve_cluster_identifier(cluster, config)
     
+    return _create_view(
+        cluster_address, tenant=tenant, path=path, hard_quota=hard_quota, protocols=protocols,
+        bucket=bucket, share=share, policy=policy, bucket_owner=bucket_owner, qos_policy=qos_policy
+    )
+
+
+def _create_view(
+    cluster_address: str,
+    tenant: str = 'default',
+    path: Optional[str] = None,
+    hard_quota: Optional[str] = None,
+    protocols: Optional[str] = None,
+    bucket: Optional[str] = None,
+    share: Optional[str] = None,
+    policy: Optional[str] = None,
+    bucket_owner: Optional[str] = None,
+    qos_policy: Optional[str] = None
+) -> List[Dict[str, str]]:
+    """Create a view on an already resolved cluster address.
+    
+    Lets batch callers (create_view_from_template) resolve the cluster once.
+    Arguments are the same as create_view, with cluster replaced by its address.
+    
+    Returns:
+        A list of client paths for the new view
+    """
     # Default tenant to 'default' if not provided
     if not tenant:
         tenant = 'default'
@@ -223,53 +401,57 @@ def create_view(
         raise ValueError("path is required for view creation")
     validate_path(path)
     
-    client = create_vast_client(cluster_address)
-    
-    # Get API whitelist
-    whitelist = get_api_whitelist()
-    
-    tenant_id = get_id_by_name(client, 'tenants', tenant, whitelist=whitelist)
-    if not tenant_id:
-        raise ValueError(f"Tenant {tenant} not found on cluster {cluster_address}.")
-    
     if not protocols:
         protocols = 'NFS'
-    proto_list = [p.strip().upper() for p in protocols.split(',') if p and p.strip()]
+    # dict.fromkeys drops duplicates but keeps the caller's order for the API payload
+    proto_list = list(dict.fromkeys(p.strip().upper() for p in protocols.split(',') if p.strip()))
+    proto_set = set(proto_list)
 
     # Check if bucket is specified and bucket owner is provided for S3 or ENDPOINT protocols 
-    if bucket and (not bucket_owner or ('S3' not in proto_list and 'ENDPOINT' not in proto_list)):
+    if bucket and (not bucket_owner or not proto_set & {'S3', 'ENDPOINT'}):
         raise ValueError(f"Bucket {bucket} is specified, but bucket owner or S3 protocol is not provided.")
-    if share and 'SMB' not in proto_list:
+    if share and 'SMB' not in proto_set:
         raise ValueError(f"Share {share} is specified, but SMB protocol is not provided.")
     
     hard_quota_bytes = None
     if hard_quota:
         hard_quota_bytes = get_size_in_bytes(hard_quota)
 
-    # Get policy id by name
-    policy_id = get_id_by_name(client, 'viewpolicies', policy, whitelist=whitelist)
+    client = create_vast_client(cluster_address)
+    
+    # Get API whitelist
+    whitelist = get_api_whitelist()
+    
+    # Resolve tenant, view policy and QoS policy IDs concurrently - the lookups are independent
+    tenant_future = _lookup_executor.submit(_cached_id, client, cluster_address, 'tenants', tenant, whitelist=whitelist)
+    policy_future = _lookup_executor.submit(_cached_id, client, cluster_address, 'viewpolicies', policy, whitelist=whitelist)
+    qos_future = _lookup_executor.submit(_cached_id, client, cluster_address, 'qospolicies', qos_policy, whitelist=whitelist) if qos_policy else None
+    wait([f for f in (tenant_future, policy_future, qos_future) if f is not None])
+    
+    tenant_id = tenant_future.result()
+    if not tenant_id:
+        raise ValueError(f"Tenant {tenant} not found on cluster {cluster_address}.")
+    
+    policy_id = policy_future.result()
     if not policy_id:
         raise ValueError(f"Policy {policy} not found on cluster {cluster_address}.")
     
+    qos_policy_id = qos_future.result() if qos_future else None
+    if qos_policy and not qos_policy_id:
+        raise ValueError(f"QoS Policy {qos_policy} not found on cluster {cluster_address}.")
+    
+    # Optional fields are merged in only when set
     payload: Dict[str, Any] = {
         'tenant_id': tenant_id,
         'path': path,
         'create_dir': True,
         'protocols': proto_list,
         'policy_id': policy_id,
+        **({'qos_policy_id': qos_policy_id} if qos_policy_id else {}),
+        **({'share': share} if share else {}),
+        **({'bucket': bucket, 'bucket_owner': bucket_owner} if bucket else {}),
     }
     
-    qos_policy_id = get_id_by_name(client, 'qospolicies', qos_policy, whitelist=whitelist) if qos_policy else None
-    if qos_policy and not qos_policy_id:
-        raise ValueError(f"QoS Policy {qos_policy} not found on cluster {cluster_address}.")
-    if qos_policy_id:
-        payload['qos_policy_id'] = qos_policy_id
-    if share:
-        payload['share'] = share
-    if bucket:
-        payload['bucket'] = bucket
-        payload['bucket_owner'] = bucket_owner
-    
     try:
         logging.info(f"Creating view on cluster={cluster_address} tenant={tenant}, path={path} policy: {policy} {'Hard quota: ' + hard_quota if hard_quota else ''}")
 
@@ -301,7 +483,7 @@ def create_view(
         raise
     
     try:
-        client_paths = get_user_paths(cluster=cluster_address, tenant=tenant, view_path=path)
+        client_paths = _get_user_paths(client, cluster_address, tenant, path, whitelist)
     except Exception as e:
         logging.error(f"Failed to get client paths for the new view {path}. Error: {e}")
         raise
@@ -326,23 +508,34 @@ def create_view_from_template(
     
     # Default template file location
     if not view_template_file:
-        view_template_file = VIEW_TEMPLATE_FILE
+        view_template_file = get_view_template_file()
     
-    # Load view templates from file
+    # Load the requested template from file
+    # Prefer orjson (fastest full parse), then ijson (streams and stops at the first match), then json
     try:
         if not os.path.exists(view_template_file):
             raise FileNotFoundError(f"View template file not found: {view_template_file}")
-        with open(view_template_file, 'r') as f:
-            templates = json.load(f)
+        template_info = None
+        if ORJSON_AVAILABLE:
+            with open(view_template_file, 'rb') as f:
+                templates = orjson.loads(f.read())
+            template_info = next((t for t in templates if t.get('name') == template), None)
+        elif IJSON_AVAILABLE:
+            with open(view_template_file, 'rb') as f:
+                for t in ijson.items(f, 'item', use_float=True):
+                    if t.get('name') == template:
+                        template_info = t
+                        break
+        else:
+            with open(view_template_file, 'r') as f:
+                templates = json.load(f)
+            template_info = next((t for t in templates if t.get('name') == template), None)
     except Exception as e:
         logging.error(f"Failed to load view templates from {view_template_file}. Error: {e}")
         raise
 
-    # Look for the specified template within the loaded templates
-    template_info = [t for t in templates if t.get('name') == template]
-    if not len(template_info):
+    if template_info is None:
         raise ValueError(f"Template {template} not found in {view_template_file}.")
-    template_info = template_info[0]
 
     # Validate template parameters
     required_params = ['cluster', 'tenant', 'path_prefix', 'view_policy', 'hard_quota', 'protocols']
@@ -353,6 +546,8 @@ def create_view_from_template(
     config = load_config()
     if template_info['cluster'] not in [c['cluster'] for c in config['clusters']]:
         raise ValueError(f"Cluster {template_info['cluster']} in template {template} not found in cluster config file: {CONFIG_FILE}")
+    # Template clusters are config addresses, so the nested create calls can skip resolution
+    cluster_address = template_info['cluster']
     
     # List current views using list_dynamic
     current_views = list_dynamic(
@@ -363,38 +558,65 @@ def create_view_from_template(
     )
     created_views = []
 
-    # Find the next available index based on existing views
-    existing_indices = []
+    # Find the next available index based on existing views (<path_prefix><digits>)
+    path_prefix = template_info['path_prefix']
+    prefix_len = len(path_prefix)
+    max_index = 0
     for v in current_views:
         view_path = v.get('Path') or v.get('path', '')
-        match = re.match(rf"{re.escape(template_info['path_prefix'])}(\d+)$", view_path)
-        if match:
-            existing_indices.append(int(match.group(1)))
+        if not view_path.startswith(path_prefix):
+            continue
+        suffix = view_path[prefix_len:]
+        if suffix.isdecimal():
+            index = int(suffix)
+            if index > max_index:
+                max_index = index
     
-    start = 1
-    if existing_indices:
-        start = max(existing_indices) + 1
+    start = max_index + 1
     
-    for i in range(start, count + start):
+    def _create_indexed_view(i: int) -> List[Dict[str, str]]:
         # Customize template parameters if needed (e.g., append index to path)
         view_params = template_info.copy()
         view_params['path'] = f"{template_info['path_prefix']}{i}"
-        try:
-            created_view = create_view(
-                cluster=view_params.get('cluster'),
-                tenant=view_params.get('tenant') if view_params.get('tenant') else '',
-                path=view_params.get('path') if view_params.get('path') else '',
-                hard_quota=view_params.get('hard_quota') if view_params.get('hard_quota') else None,
-                protocols=view_params.get('protocols') if view_params.get('protocols') else None,
-                bucket=f"{view_params.get('bucket_prefix')}{i}" if view_params.get('bucket_prefix') else None,
-                share=f"{view_params.get('share_prefix')}{i}" if view_params.get('share_prefix') else None,
-                policy=view_params.get('policy') if view_params.get('policy') else None,
-                bucket_owner=view_params.get('bucket_owner') if view_params.get('bucket_owner') else None
-            )
-            created_views.extend(created_view)
-        except Exception as e:
-            logging.error(f"Failed to create view from template {template} instance {i}. Error: {e}")
-            raise
+        return _create_view(
+            cluster_address,
+            tenant=view_params.get('tenant') if view_params.get('tenant') else '',
+            path=view_params.get('path') if view_params.get('path') else '',
+            hard_quota=view_params.get('hard_quota') if view_params.get('hard_quota') else None,
+            protocols=view_params.get('protocols') if view_params.get('protocols') else None,
+            bucket=f"{view_params.get('bucket_prefix')}{i}" if view_params.get('bucket_prefix') else None,
+            share=f"{view_params.get('share_prefix')}{i}" if view_params.get('share_prefix') else None,
+            policy=view_params.get('policy') if view_params.get('policy') else None,
+            bucket_owner=view_params.get('bucket_owner') if view_params.get('bucket_owner') else None
+        )
+    
+    # Each instance has a distinct path/bucket/share, so views are created in parallel.
+    # A dedicated pool is used because _create_view itself submits lookups to _lookup_executor.
+    indices = range(start, count + start)
+    with ThreadPoolExecutor(max_workers=max(1, min(count, API_PARALLEL_WORKERS)), thread_name_prefix='vast-create-view') as executor:
+        futures = [executor.submit(_create_indexed_view, i) for i in indices]
+        # On the first failure don't start more views; leaving the pool waits for those in flight
+        wait(futures, return_when=FIRST_EXCEPTION)
+        for pending in futures:
+            pending.cancel()
+    
+    # Collect in index order so the returned paths keep the serial ordering
+    failure = None
+    created_paths = []
+    for i, future in zip(indices, futures):
+        if future.cancelled():
+            continue
+        error = future.exception()
+        if error is None:
+            created_views.extend(future.result())
+            created_paths.append(f"{path_prefix}{i}")
+        elif failure is None:
+            failure = (i, error)
+    if failure is not None:
+        i, e = failure
+        created = ', '.join(created_paths) if created_paths else 'none'
+        logging.error(f"Failed to create view from template {template} instance {i}. Error: {e}. Views already created: {created}")
+        raise ValueError(f"Failed to create view from template {template} instance {i}: {e}. Views already created: {created}") from e
     return created_views
 
 
@@ -448,7 +670,7 @@ def create_snapshot(
     # Validate path structure
     validate_path(path)
     client = create_vast_client(cluster_address)
-    tenant_id = get_id_by_name(client, 'tenants', tenant, whitelist=whitelist)
+    tenant_id = _cached_id(client, cluster_address, 'tenants', tenant, whitelist=whitelist)
     if not tenant_id:
         raise ValueError(f"Tenant {tenant} not found on cluster {cluster_address}.")
 
@@ -464,16 +686,14 @@ def create_snapshot(
         except Exception as e:
             raise ValueError(f"Invalid expiry time format '{expiry_time}': {e}")
 
-    # Prepare payload for snapshot creation
+    # Prepare payload for snapshot creation (optional fields are merged in only when set)
     payload: Dict[str, Any] = {
         'path': path,
         'name': snapshot_name,
-        'tenant_id': tenant_id
+        'tenant_id': tenant_id,
+        **({'expiration_time': expiration_time} if expiration_time else {}),
+        **({'indestructible': True} if indestructible else {}),
     }
-    if expiration_time:
-        payload['expiration_time'] = expiration_time
-    if indestructible:
-        payload['indestructible'] = True
     
     try:
         logging.info(f"Creating snapshot '{snapshot_name}' for path '{path}' on cluster {cluster_address} tenant {tenant}")
@@ -560,38 +780,64 @@ def create_clone(
     # Get API whitelist
     whitelist = get_api_whitelist()
 
-    # Get tenant IDs
-    source_tenant_id = get_id_by_name(client, 'tenants', source_tenant, whitelist=whitelist)
+    # Get tenant IDs (concurrently, a single lookup when source and destination match)
+    source_future = _lookup_executor.submit(_cached_id, client, cluster_address, 'tenants', source_tenant, whitelist=whitelist)
+    if destination_tenant == source_tenant:
+        destination_future = source_future
+    else:
+        destination_future = _lookup_executor.submit(_cached_id, client, cluster_address, 'tenants', destination_tenant, whitelist=whitelist)
+    wait([source_future, destination_future])
+    
+    source_tenant_id = source_future.result()
     if not source_tenant_id:
         raise ValueError(f"Source tenant {source_tenant} not found on cluster {cluster_address}.")
-    destination_tenant_id = get_id_by_name(client, 'tenants', destination_tenant, whitelist=whitelist)
+    destination_tenant_id = destination_future.result()
     if not destination_tenant_id:
         raise ValueError(f"Destination tenant {destination_tenant} not found on cluster {cluster_address}.")
 
-    # Handle snapshot name with wildcard (find newest snapshot with prefix)
-    snapshots = list_dynamic(
-        command_name='snapshots',
-        cluster=cluster_address,
-        tenant=source_tenant,
-        path=source_path,
-        snapshot_name=source_snapshot
-    )
+    # API expects paths to end with /; validate_path already rejected trailing slashes,
+    # so the plain paths are used as-is for view lookups
+    source_path_slash = source_path + '/'
+    destination_path_slash = destination_path + '/'
+
+    # Filter snapshot names on the cluster, the same way list_dynamic maps name patterns:
+    # 'name' for an exact name, 'name__startswith' for 'prefix*', and so on.
+    # The response carries the id, so no second lookup is needed.
+    snapshot_params = {
+        'path': source_path_slash,
+        'tenant_id': source_tenant_id
+    }
+    name_filter_type, name_filter_value, name_api_suffix = parse_filter_value(source_snapshot, 'str')
+    name_regex = None
+    if name_filter_type == 'equals' and '*' in source_snapshot:
+        # '*' inside the name (e.g. 'daily*-prod') has no API filter - narrow by the
+        # literal prefix on the cluster and match the full pattern here
+        name_prefix = source_snapshot.split('*', 1)[0]
+        if name_prefix:
+            snapshot_params['name__startswith'] = name_prefix
+        name_regex = re.compile('.*'.join(re.escape(part) for part in source_snapshot.split('*')) + r'\Z', re.DOTALL)
+    else:
+        snapshot_params[f'name{name_api_suffix}'] = name_filter_value
+    try:
+        snapshots = call_vast_api(
+            client=client,
+            endpoint='snapshots',
+            method='get',
+            params=snapshot_params,
+            whitelist=whitelist
+        )
+    except Exception as e:
+        logging.error(f"Failed to retrieve snapshots for {source_path_slash} on {source_tenant}. Error: {e}")
+        raise
+    if name_regex is not None:
+        snapshots = [s for s in snapshots if name_regex.match(s.get('name') or '')]
     if not len(snapshots):
-        raise ValueError(f"No matching snapshot found for path {source_path} on tenant {source_tenant}.")
-    
-    # Get snapshot name from result (could be 'Snapshot Name' or 'snapshot_name' or 'name')
-    actual_snapshot_name = None
-    for key in ['Snapshot Name', 'snapshot_name', 'name', 'Name']:
-        if key in snapshots[0]:
-            actual_snapshot_name = snapshots[0][key]
-            break
+        raise ValueError(f"No matching snapshot found for path {source_path_slash} on tenant {source_tenant}.")
     
-    if not actual_snapshot_name:
-        raise ValueError(f"Could not determine snapshot name from results")
-
-    # API expects paths to end with /
-    source_path += '/'
-    destination_path += '/'
+    # Newest first: creation time, with the (monotonic) id as tie-breaker
+    snapshot = max(snapshots, key=lambda s: (s.get('created') or '', s.get('id') or 0))
+    actual_snapshot_name = snapshot['name']
+    snapshot_id = snapshot['id']
 
     # Check if destination already exists and handle refresh
     refresh_performed = False
@@ -602,71 +848,38 @@ def create_clone(
                 client=client,
                 endpoint='globalsnapstreams',
                 method='get',
-                params={'loanee_root_path': destination_path},
+                params={'loanee_root_path': destination_path_slash},
                 whitelist=whitelist
             )
             if len(existing_clone):
                 existing_clone = existing_clone[0]
                 if existing_clone['loanee_tenant']['name'] != destination_tenant:
-                    raise ValueError(f"Existing clone at {destination_path} belongs to tenant {existing_clone['loanee_tenant']['name']}. Cannot refresh.")
-                if existing_clone['owner_tenant']['name'] != source_tenant or existing_clone['source_path'] != source_path:
-                    raise ValueError(f"Existing clone at {destination_path} is based on: {existing_clone['owner_tenant']['name']}:{existing_clone['source_path']}. Cannot refresh.")
+                    raise ValueError(f"Existing clone at {destination_path_slash} belongs to tenant {existing_clone['loanee_tenant']['name']}. Cannot refresh.")
+                if existing_clone['owner_tenant']['name'] != source_tenant or existing_clone['source_path'] != source_path_slash:
+                    raise ValueError(f"Existing clone at {destination_path_slash} is based on: {existing_clone['owner_tenant']['name']}:{existing_clone['source_path']}. Cannot refresh.")
                 else:
                     if existing_clone['state'] != 'Completed':
                         logging.info(f"Stopping existing clone synchronization to be able to delete it.")
                         # Note: stop.patch() and delete() are sub-endpoints that call_vast_api doesn't support
                         # We validate whitelist manually for these special cases
                         if whitelist is not None:
-                            if 'globalsnapstreams' not in whitelist:
-                                raise ValueError(
-                                    f"Access denied: API endpoint 'globalsnapstreams' is not whitelisted. "
-                                    f"Please contact your administrator to add it to the api_whitelist section."
-                                )
-                            allowed_methods = whitelist.get('globalsnapstreams', [])
-                            if allowed_methods and 'patch' not in allowed_methods:
-                                raise ValueError(
-                                    f"Access denied: HTTP method 'PATCH' is not allowed for endpoint 'globalsnapstreams'."
-                                )
+                            check_api_method_allowed('globalsnapstreams', 'patch')
                         client.globalsnapstreams[existing_clone['id']].stop.patch()
-                    logging.info(f"Deleting existing clone at {destination_path}")
+                    logging.info(f"Deleting existing clone at {destination_path_slash}")
                     if whitelist is not None:
-                        allowed_methods = whitelist.get('globalsnapstreams', [])
-                        if allowed_methods and 'delete' not in allowed_methods:
-                            raise ValueError(
-                                f"Access denied: HTTP method 'DELETE' is not allowed for endpoint 'globalsnapstreams'."
-                            )
+                        check_api_method_allowed('globalsnapstreams', 'delete')
                     client.globalsnapstreams[existing_clone['id']].delete(remove_dir=True)
                     refresh_performed = True
         except Exception as e:
             # If getting clones fails, it might not exist, which is fine
-            raise ValueError(f"Delete of {destination_path} path failed. Error: {e}")
+            raise ValueError(f"Delete of {destination_path_slash} path failed. Error: {e}")
 
-    # Get snapshot id for the actual snapshot name
-    try:
-        snapshot_info = call_vast_api(
-            client=client,
-            endpoint='snapshots',
-            method='get',
-            params={
-                'name': actual_snapshot_name,
-                'path': source_path,
-                'tenant_id': source_tenant_id
-            },
-            whitelist=whitelist
-        )
-        if not len(snapshot_info):
-            raise ValueError(f"Snapshot {actual_snapshot_name} not found on tenant {source_tenant}.")
-        snapshot_id = snapshot_info[0]['id']
-    except Exception as e:
-        logging.error(f"Failed to retrieve snapshot info for {actual_snapshot_name} on {source_tenant}. Error: {e}")
-        raise
-    
     try:
-        logging.info(f"Creating local clone on cluster: {cluster_address} clone from: '{source_tenant}:{source_path}' snapshot: {actual_snapshot_name}' to '{destination_tenant}:{destination_path}'")
+        logging.info(f"Creating local clone on cluster: {cluster_address} clone from: '{source_tenant}:{source_path_slash}' snapshot: {actual_snapshot_name}' to '{destination_tenant}:{destination_path_slash}'")
         payload = {
-            'loanee_root_path': destination_path,
+            'loanee_root_path': destination_path_slash,
             'loanee_tenant_id': destination_tenant_id,
-            'name': f"clone_of_{source_path.replace('/', '_')}{uuid.uuid4().hex[:8]}",
+            'name': f"clone_of_{source_path_slash.replace('/', '_')}{uuid.uuid4().hex[:8]}",
             'enabled': True
         }
 
@@ -675,18 +888,7 @@ def create_clone(
         # We validate whitelist manually for this special case
         if whitelist is not None:
             # Check if snapshots endpoint is whitelisted for POST
-            if 'snapshots' not in whitelist:
-                raise ValueError(
-                    f"Access denied: API endpoint 'snapshots' is not whitelisted. "
-                    f"Please contact your administrator to add it to the api_whitelist section "
-                    f"in the YAML configuration file."
-                )
-            allowed_methods = whitelist.get('snapshots', [])
-            if allowed_methods and 'post' not in allowed_methods:
-                raise ValueError(
-                    f"Access denied: HTTP method 'POST' is not allowed for endpoint 'snapshots'. "
-                    f"Allowed methods: {allowed_methods}"
-                )
+            check_api_method_allowed('snapshots', 'post')
         result = client.snapshots[snapshot_id].clone.post(**payload)
 
         # Check if view exists on the view path
@@ -694,15 +896,15 @@ def create_clone(
             command_name='views',
             cluster=cluster_address,
             tenant=destination_tenant,
-            view=destination_path.rstrip('/')  # Remove trailing slash for view lookup
+            view=destination_path
         )
         if not len(view_info):
-            logging.info(f"Clone created successfully, no view exists on destination path {destination_path}")
+            logging.info(f"Clone created successfully, no view exists on destination path {destination_path_slash}")
             return []
-        else:
-            client_paths = get_user_paths(cluster=cluster_address, tenant=destination_tenant, view_path=destination_path.rstrip('/'))
-            logging.info(f"Clone created successfully, view already exists at {destination_path} and linked to the clone")
-            return client_paths
+        # Resolve access paths with the client we already hold (no config reload)
+        client_paths = _get_user_paths(client, cluster_address, destination_tenant, destination_path, whitelist)
+        logging.info(f"Clone created successfully, view already exists at {destination_path_slash} and linked to the clone")
+        return client_paths
     except Exception as e:
         logging.error(f"Failed to create clone on {cluster_address}. Error: {e}")
         raise
@@ -753,7 +955,7 @@ def create_quota(
     whitelist = get_api_whitelist()
 
     # Get tenant ID
-    tenant_id = get_id_by_name(client, 'tenants', tenant, whitelist=whitelist)
+    tenant_id = _cached_id(client, cluster_address, 'tenants', tenant, whitelist=whitelist)
     if not tenant_id:
         raise ValueError(f"Tenant {tenant} not found on cluster {cluster_address}.")
 
@@ -777,76 +979,113 @@ def create_quota(
     if grace_period is not None:
         payload['grace_period'] = grace_period
     
-    logging.info(f"Creating/updating quota on cluster: {cluster_address}, tenant: {tenant}, path: {path}")
-    if hard_limit:
-        logging.info(f"Hard limit: {hard_limit}")
-    if soft_limit:
-        logging.info(f"Soft limit: {soft_limit}")
-    if files_hard_limit is not None:
-        logging.info(f"Files hard limit: {files_hard_limit}")
-    if files_soft_limit is not None:
-        logging.info(f"Files soft limit: {files_soft_limit}")
+    # Lazy %-formatting: nothing is formatted when INFO is disabled
+    logging.info(
+        "Creating/updating quota on cluster: %s, tenant: %s, path: %s, hard limit: %s, soft limit: %s, "
+        "files hard limit: %s, files soft limit: %s",
+        cluster_address, tenant, path, hard_limit, soft_limit, files_hard_limit, files_soft_limit
+    )
+    
+    # Quota IDs seen on earlier calls let repeat updates skip the existence lookup
+    quota_cache_key = f"{cluster_address}:{tenant_id}:{path}"
     
     try:
-        # Check if quota already exists
-        existing_quotas = call_vast_api(
-            client=client,
-            endpoint='quotas',
-            method='get',
-            params={'path': path},
-            tenant_id=tenant_id,
-            whitelist=whitelist
-        )
-        if existing_quotas:
+        quota_id = _cache_manager.get('quota_ids', quota_cache_key)
+        if quota_id is None:
+            # Check if quota already exists
+            quota_id = _find_quota_id(client, tenant_id, path, whitelist)
+        
+        if quota_id is not None:
             # Update existing quota
-            quota_id = existing_quotas[0]['id']
-            logging.info(f"Updating existing quota (ID: {quota_id})")
+            logging.info("Updating existing quota (ID: %s)", quota_id)
             # Note: quotas[quota_id].patch() is a sub-endpoint that call_vast_api doesn't support
             # We validate whitelist manually for this special case
             if whitelist is not None:
-                if 'quotas' not in whitelist:
-                    raise ValueError(
-                        f"Access denied: API endpoint 'quotas' is not whitelisted. "
-                        f"Please contact your administrator to add it to the api_whitelist section."
-                    )
-                allowed_methods = whitelist.get('quotas', [])
-                if allowed_methods and 'patch' not in allowed_methods:
-                    raise ValueError(
-                        f"Access denied: HTTP method 'PATCH' is not allowed for endpoint 'quotas'."
-                    )
-            updated = client.quotas[quota_id].patch(**payload)
-            result = updated[0] if isinstance(updated, list) else updated
-        else:
+                check_api_method_allowed('quotas', 'patch')
+            try:
+                updated = client.quotas[quota_id].patch(**payload)
+                result = updated[0] if isinstance(updated, list) else updated
+            except RESTFailure as e:
+                if e.status != 404:
+                    raise
+                # Cached quota was deleted in the meantime - create it again
+                logging.info("Quota ID %s no longer exists", quota_id)
+                _cache_manager.delete('quota_ids', quota_cache_key)
+                quota_id = None
+        existing_quota = quota_id is not None
+        if not existing_quota:
             # Create new quota
             logging.info("Creating new quota")
-            created = call_vast_api(
-                client=client,
-                endpoint='quotas',
-                method='post',
-                params=payload,
-                whitelist=whitelist
-            )
-            result = created[0] if isinstance(created, list) else created
+            try:
+                created = call_vast_api(
+                    client=client,
+                    endpoint='quotas',
+                    method='post',
+                    params=payload,
+                    whitelist=whitelist
+                )
+                result = created[0] if isinstance(created, list) else created
+            except RESTFailure as e:
+                if not _is_duplicate_error(e):
+                    raise
+                # Someone created the same quota since our lookup - update it instead
+                quota_id = _find_quota_id(client, tenant_id, path, whitelist)
+                if quota_id is None:
+                    raise
+                existing_quota = True
+                logging.info("Quota was created concurrently, updating it instead (ID: %s)", quota_id)
+                if whitelist is not None:
+                    check_api_method_allowed('quotas', 'patch')
+                updated = client.quotas[quota_id].patch(**payload)
+                result = updated[0] if isinstance(updated, list) else updated
         
-        logging.info(f"Quota {'updated' if existing_quotas else 'created'} successfully")
+        if result and result.get('id') is not None:
+            _cache_manager.set('quota_ids', quota_cache_key, result['id'], ttl=LOOKUP_CACHE_TTL_SECONDS)
+        logging.info("Quota %s successfully", 'updated' if existing_quota else 'created')
         
-        from .utils import pretty_size
-        return {
-            'Cluster': cluster_address,
-            'Tenant': tenant,
-            'Path': path,
-            'Name': quota_name,
-            'Hard Limit': pretty_size(str(result.get('hard_limit', 0))) if result.get('hard_limit') else 'Unlimited',
-            'Soft Limit': pretty_size(str(result.get('soft_limit', 0))) if result.get('soft_limit') else 'Unlimited',
-            'Files Hard Limit': result.get('inodes_hard_limit', 'Unlimited') if result.get('inodes_hard_limit') else 'Unlimited',
-            'Files Soft Limit': result.get('inodes_soft_limit', 'Unlimited') if result.get('inodes_soft_limit') else 'Unlimited',
-            'Grace Period': result.get('grace_period', 'N/A')
-        }
+        return _format_quota(cluster_address, tenant, path, quota_name, result)
     except Exception as e:
-        logging.error(f"Failed to create/update quota on {cluster_address}. Error: {e}")
+        logging.error("Failed to create/update quota on %s. Error: %s", cluster_address, e)
         raise
 
 
+def _find_quota_id(client: VASTClient, tenant_id: Any, path: str, whitelist: Optional[Dict[str, FrozenSet[str]]] = None) -> Optional[Any]:
+    """Look up the ID of the quota on a path, fetching only the ID of the first match."""
+    existing_quotas = call_vast_api(
+        client=client,
+        endpoint='quotas',
+        method='get',
+        params={'path': path, 'fields': 'id'},
+        tenant_id=tenant_id,
+        whitelist=whitelist,
+        max_results=1
+    )
+    return existing_quotas[0]['id'] if existing_quotas else None
+
+
+def _is_duplicate_error(error: RESTFailure) -> bool:
+    """Check whether a failed create was rejected because the object already exists."""
+    if error.status == 409:
+        return True
+    return 'already exists' in str(error).lower()
+
+
+def _format_quota(cluster_address: str, tenant: str, path: str, quota_name: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Format a quota API result as returned by create_quota."""
+    from .utils import pretty_size
+    return {
+        'Cluster': cluster_address,
+        'Tenant': tenant,
+        'Path': path,
+        'Name': quota_name,
+        'Hard Limit': pretty_size(str(result.get('hard_limit', 0))) if result.get('hard_limit') else 'Unlimited',
+        'Soft Limit': pretty_size(str(result.get('soft_limit', 0))) if result.get('soft_limit') else 'Unlimited',
+        'Files Hard Limit': result.get('inodes_hard_limit', 'Unlimited') if result.get('inodes_hard_limit') else 'Unlimited',
+        'Files Soft Limit': result.get('inodes_soft_limit', 'Unlimited') if result.get('inodes_soft_limit') else 'Unlimited',
+        'Grace Period': result.get('grace_period', 'N/A')
+    }
+
+
 VALID_SUPPORT_BUNDLE_PRESETS = {
     'standard', 'default', 'debug', 'micro', 'mini', 'management',
     'performance', 'traces_and_metrics', 'nfsv3', 'nfsv4', 'smb', 's3',
@@ -1,16 +1,195 @@
 """Data processing classes extracted from CommandExecutor for better separation of concerns."""
 
+import atexit
+import functools
+import json
 import logging
+import os
+import re
+import select
+import shutil
 import subprocess
+import threading
 import fnmatch
-from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+from typing import Callable, Dict, List, Any, Optional, Tuple
 
 from .template_parser import TemplateParser
-from .config import JQ_TIMEOUT_SECONDS
+from .config import JQ_TIMEOUT_SECONDS, JQ_WORKER_POOL_SIZE
 from .utils import (
     parse_filter_value, parse_capacity_value, normalize_field_name, to_python_name
 )
 
+# Try to import the jq bindings for in-process jq evaluation (no subprocess per value)
+try:
+    import jq
+    JQ_AVAILABLE = True
+except ImportError:
+    JQ_AVAILABLE = False
+
+# Try to import orjson for faster JSON encoding around the jq command line
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if JQ_AVAILABLE:
+    # Templates use a small, fixed set of expressions - compile each one once
+    compile_jq = functools.lru_cache(maxsize=256)(jq.compile)
+
+
+def dumps_json_bytes(value: Any) -> bytes:
+    """Encode a value as JSON bytes for jq's stdin, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson rejects a few values json accepts (e.g. integers over 64 bits)
+            pass
+    return json.dumps(value).encode()
+
+
+def loads_json(data: Any) -> Any:
+    """Decode JSON text or bytes, using orjson when available.
+    
+    Raises json.JSONDecodeError in both cases (orjson's error subclasses it).
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _jq_output(results: List[Any]) -> Any:
+    """Shape jq results like the jq command line: a single result as-is, otherwise one JSON text per line."""
+    if len(results) == 1:
+        return results[0]
+    return '\n'.join(json.dumps(r) for r in results)
+
+
+def run_jq_program(program: Any, value: Any) -> Any:
+    """Run an already compiled jq program (from compile_jq) against a Python value."""
+    return _jq_output(program.input_value(value).all())
+
+
+# select() only works on pipes on POSIX - elsewhere the jq command runs once per value
+JQ_WORKERS_SUPPORTED = os.name != 'nt'
+
+# 'input'/'inputs' builtins (not '.input' fields or '$input' variables)
+_JQ_READS_INPUT_RE = re.compile(r'(?<![.$\w])inputs?\b')
+
+
+@functools.lru_cache(maxsize=256)
+def jq_worker_supported(jq_expr: str) -> bool:
+    """Whether a jq expression can run on a long-lived worker (run_jq_worker).
+    
+    A worker reads one value per line from a shared stdin, so expressions that read
+    further inputs with 'input' or 'inputs' would consume the values of later calls.
+    Those have to run the jq command once per value instead.
+    """
+    return JQ_WORKERS_SUPPORTED and not _JQ_READS_INPUT_RE.search(jq_expr)
+
+
+class _JqWorker:
+    """A jq process kept running for one expression, fed one JSON value per line.
+    
+    The expression is wrapped so every input yields exactly one output line -
+    {"r": [results...]} or {"e": "error message"} - which keeps requests and
+    responses in step without restarting jq for each value.
+    """
+    
+    def __init__(self, jq_expr: str):
+        wrapped_expr = f'try ([(\n{jq_expr}\n)] | {{"r": .}}) catch {{"e": .}}'
+        self.lock = threading.Lock()
+        self.process = subprocess.Popen(
+            ['jq', '--unbuffered', '-cM', wrapped_expr],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+    
+    def run(self, json_bytes: bytes) -> List[Any]:
+        """Send one JSON value and return the list of results jq produced for it."""
+        with self.lock:
+            process = self.process
+            if process.poll() is not None:
+                raise ValueError(f"jq exited with status {process.returncode}")
+            process.stdin.write(json_bytes + b'\n')
+            process.stdin.flush()
+            ready, _, _ = select.select([process.stdout], [], [], JQ_TIMEOUT_SECONDS)
+            if not ready:
+                process.kill()
+                # Reap it so the next call sees the exit and starts a new worker
+                process.wait()
+                raise subprocess.TimeoutExpired(process.args, JQ_TIMEOUT_SECONDS)
+            line = process.stdout.readline()
+        if not line:
+            # jq exited - usually the expression does not compile
+            raise ValueError(f"jq exited with status {process.wait()}")
+        response = loads_json(line)
+        if 'e' in response:
+            raise ValueError(response['e'])
+        return response['r']
+    
+    def close(self) -> None:
+        """Stop the jq process."""
+        with self.lock:
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout=JQ_TIMEOUT_SECONDS)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process.stdout.close()
+
+
+# jq expression -> running worker, least recently used first
+_jq_workers: "OrderedDict[str, _JqWorker]" = OrderedDict()
+_jq_workers_lock = threading.Lock()
+
+
+def run_jq_worker(jq_expr: str, json_bytes: bytes) -> Any:
+    """Evaluate a jq expression on one JSON-encoded value with a long-lived jq process.
+    
+    Only for expressions accepted by jq_worker_supported. Results are shaped like
+    run_jq's. Raises ValueError when jq reports an error, subprocess.TimeoutExpired
+    on timeout and FileNotFoundError when jq is missing.
+    """
+    if not jq_worker_supported(jq_expr):
+        raise ValueError("jq expressions reading 'input'/'inputs' cannot run on a jq worker")
+    evicted = None
+    with _jq_workers_lock:
+        worker = _jq_workers.get(jq_expr)
+        if worker is None or worker.process.poll() is not None:
+            worker = _JqWorker(jq_expr)
+            _jq_workers[jq_expr] = worker
+            if len(_jq_workers) > JQ_WORKER_POOL_SIZE:
+                _, evicted = _jq_workers.popitem(last=False)
+        _jq_workers.move_to_end(jq_expr)
+    if evicted is not None:
+        evicted.close()
+    return _jq_output(worker.run(json_bytes))
+
+
+@atexit.register
+def close_jq_workers() -> None:
+    """Stop all long-lived jq processes."""
+    with _jq_workers_lock:
+        workers = list(_jq_workers.values())
+        _jq_workers.clear()
+    for worker in workers:
+        worker.close()
+
+
+def run_jq(value: Any, jq_expr: str) -> Any:
+    """Evaluate a jq expression against a Python value in-process.
+    
+    Requires the jq bindings (JQ_AVAILABLE). Compile and runtime errors are raised
+    as ValueError so callers can decide how to fall back.
+    """
+    return run_jq_program(compile_jq(jq_expr), value)
+
 
 class DataTransformer:
     """Handles field transformations (jq, unit conversion, expressions)."""
@@ -30,52 +209,136 @@ class DataTransformer:
     
     def apply_jq(self, value: Any, jq_expr: str) -> Any:
         """Apply jq expression to a value."""
-        import shutil
-        import json
+        # jq sees dicts and lists as-is and any other value as a JSON string, in-process and via the command
+        jq_input = value if isinstance(value, (dict, list)) else str(value)
+        if JQ_AVAILABLE:
+            try:
+                return run_jq(jq_input, jq_expr)
+            except Exception as e:
+                logging.warning("Error applying jq expression: %s", e)
+                return value
         
+        # Fall back to the jq command line
         if not shutil.which("jq"):
             logging.warning("jq not available, skipping jq transformation")
             return value
         
         try:
             # Convert value to JSON string
-            if isinstance(value, (dict, list)):
-                json_str = json.dumps(value)
-            else:
-                json_str = json.dumps(str(value))
+            json_bytes = dumps_json_bytes(jq_input)
+            
+            if jq_worker_supported(jq_expr):
+                try:
+                    return run_jq_worker(jq_expr, json_bytes)
+                except ValueError as e:
+                    logging.warning("jq command failed: %s", e)
+                    return value
             
             # Run jq command
             result = subprocess.run(
                 ['jq', jq_expr],
-                input=json_str,
+                input=json_bytes,
                 capture_output=True,
-                text=True,
                 timeout=JQ_TIMEOUT_SECONDS
             )
             
             if result.returncode == 0:
                 # Parse result
+                output = result.stdout.strip()
                 try:
-                    return json.loads(result.stdout.strip())
+                    return loads_json(output)
                 except json.JSONDecodeError:
                     # Return as string if not valid JSON
-                    return result.stdout.strip()
+                    return output.decode('utf-8', errors='ignore')
             else:
-                logging.warning(f"jq command failed: {result.stderr}")
+                logging.warning("jq command failed: %s", result.stderr.decode('utf-8', errors='ignore'))
                 return value
         except subprocess.TimeoutExpired:
-            logging.warning(f"jq command timed out after {JQ_TIMEOUT_SECONDS}s")
+            logging.warning("jq command timed out after %ss", JQ_TIMEOUT_SECONDS)
             return value
         except Exception as e:
-            logging.warning(f"Error applying jq expression: {e}")
+            logging.warning("Error applying jq expression: %s", e)
             return value
 
 
+@functools.lru_cache(maxsize=1024)
+def wildcard_to_regex(pattern: str) -> re.Pattern:
+    """Translate a shell-style wildcard pattern (*, ?, [...]) to a compiled regex, once per pattern.
+    
+    Use .match() on the result - fnmatch.translate already anchors the end.
+    """
+    return re.compile(fnmatch.translate(pattern))
+
+
+@functools.lru_cache(maxsize=256)
+def lowercase_key_map(keys: Tuple[str, ...]) -> Dict[str, str]:
+    """Map each lowercased row key to its original spelling, shared per row schema.
+    
+    The first key wins when two keys differ only by case, like a scan in key order would.
+    Callers must not modify the returned dict.
+    """
+    key_map: Dict[str, str] = {}
+    for key in keys:
+        key_map.setdefault(key.lower(), key)
+    return key_map
+
+
+@functools.lru_cache(maxsize=1024)
+def _star_pattern_regex(pattern: str) -> re.Pattern:
+    """Compile a filter pattern whose only wildcard is '*' (any text); everything else is literal.
+    
+    Use .match() on the result.
+    """
+    return re.compile('.*'.join(re.escape(part) for part in pattern.split('*')) + r'\Z', re.DOTALL)
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Callable[[str], bool]:
+    """Compile a wildcard filter pattern into a predicate over lowercased values.
+    
+    The pattern is parsed once; the returned closure only does the final comparison.
+    Substring, prefix and suffix patterns use plain string checks, which beat a regex;
+    patterns with wildcards in the middle (e.g. 'vol*-prod') use a compiled regex.
+    """
+    if pattern.startswith('in:'):
+        # 'in:value' syntax - check if value contains the substring
+        search_value = pattern[3:].lower()
+        return lambda value_lower: search_value in value_lower
+    if pattern.startswith('!*') and pattern.endswith('*') and '*' not in pattern[2:-1]:
+        # '!*value*' syntax - value should NOT contain the substring
+        search_value = pattern[2:-1].lower()
+        return lambda value_lower: search_value not in value_lower
+    if pattern.startswith('!*') and pattern.endswith('*'):
+        regex = _star_pattern_regex(pattern[1:].lower())
+        return lambda value_lower: regex.match(value_lower) is None
+    if len(pattern) > 1 and '*' in pattern[1:-1]:
+        # '*' inside the pattern (e.g. 'vol*-prod') - full match via regex
+        regex = _star_pattern_regex(pattern.lower())
+        return lambda value_lower: regex.match(value_lower) is not None
+    if pattern.startswith('*') and pattern.endswith('*'):
+        # '*value*' syntax - value should contain the substring
+        search_value = pattern[1:-1].lower()
+        return lambda value_lower: search_value in value_lower
+    if pattern.startswith('*'):
+        # '*value' syntax - value should end with the substring
+        search_value = pattern[1:].lower()
+        return lambda value_lower: value_lower.endswith(search_value)
+    if pattern.endswith('*'):
+        # 'value*' syntax - value should start with the substring
+        search_value = pattern[:-1].lower()
+        return lambda value_lower: value_lower.startswith(search_value)
+    # Exact match (case-insensitive)
+    pattern_lower = pattern.lower()
+    return lambda value_lower: value_lower == pattern_lower
+
+
 class DataFilter:
     """Handles data filtering logic."""
     
     def __init__(self, template_parser: TemplateParser):
         self.template_parser = template_parser
+        # (command_name, arg_name, row keys) -> (field_name, is_list_field)
+        self._resolve_cache: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[str, bool]] = {}
     
     def apply_client_filters(self, command_name: str, api_data: Dict[str, List[Dict]], client_filters: Dict) -> Dict[str, List[Dict]]:
         """Apply client-side filters to API data.
@@ -100,10 +363,17 @@ class DataFilter:
         
         This method was already extracted from CommandExecutor in a previous refactoring.
         """
+        # Resolution only depends on the template and the row schema (key order included) - memoize it
+        resolve_cache = self._resolve_cache
+        cache_key = (command_name, arg_name, tuple(sample_row))
+        if cache_key in resolve_cache:
+            return resolve_cache[cache_key]
+        
         # Try multiple variations: space, underscore, normalized
         field_name_space = normalize_field_name(arg_name, 'to_space')
-        field_name_underscore = to_python_name(arg_name)
-        normalized_field_name = to_python_name(arg_name)
+        arg_name_normalized = to_python_name(arg_name)
+        field_name_underscore = arg_name_normalized
+        normalized_field_name = arg_name_normalized
         
         # Check what the actual field name is in the YAML template
         fields = self.template_parser.get_fields(command_name)
@@ -115,7 +385,6 @@ class DataFilter:
             if field_name:
                 # Normalize both for comparison
                 field_name_normalized = to_python_name(field_name)
-                arg_name_normalized = to_python_name(arg_name)
                 if (field_name == arg_name or 
                     field_name == field_name_space or
                     field_name_normalized == arg_name_normalized):
@@ -129,6 +398,7 @@ class DataFilter:
         # Try to find the field in the sample row
         # Check all possible variations
         field_to_use = None
+        lowercase_keys = lowercase_key_map(cache_key[2])
         candidates = [actual_field_name, field_name_space, field_name_underscore, normalized_field_name]
         # Also try case-insensitive matching
         for candidate in candidates:
@@ -140,22 +410,19 @@ class DataFilter:
                 logging.debug(f"Found field '{field_to_use}' in transformed data for filter '{arg_name}'")
                 break
             # Try case-insensitive match
-            for key in sample_row.keys():
-                if key.lower() == candidate.lower():
-                    field_to_use = key
-                    logging.debug(f"Found field '{field_to_use}' (case-insensitive match) in transformed data for filter '{arg_name}'")
-                    break
+            field_to_use = lowercase_keys.get(candidate.lower())
             if field_to_use:
+                logging.debug(f"Found field '{field_to_use}' (case-insensitive match) in transformed data for filter '{arg_name}'")
                 break
         
         if not field_to_use:
             # Field not found - try to find it by checking all fields with similar names
             # This handles cases where field names might be slightly different
+            arg_normalized = arg_name_normalized.lower()
+            field_space_normalized = to_python_name(field_name_space).lower()
             for key in sample_row.keys():
                 # Normalize both for comparison
                 key_normalized = to_python_name(key).lower()
-                arg_normalized = to_python_name(arg_name).lower()
-                field_space_normalized = to_python_name(field_name_space).lower()
                 
                 if (key_normalized == arg_normalized or 
                     key_normalized == field_space_normalized or
@@ -169,52 +436,27 @@ class DataFilter:
             logging.warning(f"Field '{arg_name}' not found in transformed data. Tried: {[actual_field_name, field_name_space, field_name_underscore, normalized_field_name]}. Available fields: {available_fields}")
             return None
         
-        return (field_to_use, is_list_field)
+        resolve_cache[cache_key] = (field_to_use, is_list_field)
+        return resolve_cache[cache_key]
     
     def match_wildcard(self, value: Any, pattern: str, is_list_field: bool = False) -> bool:
         """Match a value against a wildcard pattern."""
+        return self._match_compiled(value, _compile_pattern(pattern))
+    
+    @staticmethod
+    def _match_compiled(value: Any, matcher: Callable[[str], bool]) -> bool:
+        """Match a value with a predicate from _compile_pattern."""
         if value is None:
             return False
         
-        # Convert value to string for matching
+        # Convert value to string for matching (lists are joined, whether or not it is a list field)
         if isinstance(value, list):
-            if is_list_field:
-                # For list fields, check if any item matches
-                value_str = ','.join(str(v) for v in value)
-            else:
-                # For non-list fields that happen to be lists, join them
-                value_str = ','.join(str(v) for v in value)
+            value_str = ','.join(str(v) for v in value)
         else:
             value_str = str(value)
         
         # Case-insensitive matching
-        value_str_lower = value_str.lower()
-        pattern_lower = pattern.lower()
-        
-        # Check for special filter syntax
-        if pattern.startswith('in:'):
-            # 'in:value' syntax - check if value contains the substring
-            search_value = pattern[3:].lower()
-            return search_value in value_str_lower
-        elif pattern.startswith('!*') and pattern.endswith('*'):
-            # '!*value*' syntax - value should NOT contain the substring
-            search_value = pattern[2:-1].lower()
-            return search_value not in value_str_lower
-        elif pattern.startswith('*') and pattern.endswith('*'):
-            # '*value*' syntax - value should contain the substring
-            search_value = pattern[1:-1].lower()
-            return search_value in value_str_lower
-        elif pattern.startswith('*'):
-            # '*value' syntax - value should end with the substring
-            search_value = pattern[1:].lower()
-            return value_str_lower.endswith(search_value)
-        elif pattern.endswith('*'):
-            # 'value*' syntax - value should start with the substring
-            search_value = pattern[:-1].lower()
-            return value_str_lower.startswith(search_value)
-        else:
-            # Exact match (case-insensitive)
-            return value_str_lower == pattern_lower
+        return matcher(value_str.lower())
 
 
 class DataJoiner:
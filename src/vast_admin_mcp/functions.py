@@ -3,35 +3,57 @@
 import logging
 import numpy as np
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, Optional, Dict, Any, Tuple
 import os
 import tempfile
 from datetime import datetime, timezone
 import time
+import copy
 import fnmatch
+import functools
+import inspect
+from bisect import bisect_left
 import itertools
 import re
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 from .config import (
-    load_config, REST_PAGE_SIZE, PERFORMANCE_AGGREGATION_FUNCTION, TEMPLATE_MODIFICATIONS_FILE, get_default_template_path,
-    MAX_VIEW_TIMEFRAME_SECONDS, METRICS_API_LIMIT,
-    GRANULARITY_THRESHOLD_SECONDS, GRANULARITY_THRESHOLD_HOURS, GRANULARITY_THRESHOLD_DAYS,
-    EXCLUDED_VIEW_METRIC_PATTERNS, QUERY_USERS_DEFAULT_TOP, QUERY_USERS_MAX_TOP,
+    load_config, REST_PAGE_SIZE, API_PARALLEL_WORKERS, PERFORMANCE_AGGREGATION_FUNCTION, get_template_modifications_file, get_default_template_path,
+    MAX_VIEW_TIMEFRAME_SECONDS, METRICS_API_LIMIT, METRICS_MAP_CACHE_TTL_SECONDS, INSTANCES_CACHE_TTL_SECONDS,
+    GRANULARITY_THRESHOLD_SECONDS, GRANULARITY_THRESHOLD_HOURS, GRANULARITY_THRESHOLD_DAYS, PERFORMANCE_CACHE_TTL_SECONDS,
+    PERFORMANCE_CACHE_MAXSIZE, EXCLUDED_VIEW_METRIC_PATTERNS, QUERY_USERS_DEFAULT_TOP, QUERY_USERS_MAX_TOP,
     GRAPH_TEMP_DIR, GRAPH_CLEANUP_AGE_HOURS,
     DATAFLOW_DEFAULT_RESULTS_NUM, DATAFLOW_DEFAULT_SORT_BY, DATAFLOW_DEFAULT_SORT_TYPE,
     DATAFLOW_DEFAULT_LIMIT, DATAFLOW_DEFAULT_TOP_N_DIAGRAM, DATAFLOW_VALID_PROTOCOLS,
-    DATAFLOW_DIAGRAM_MERMAID_THEME
+    DATAFLOW_DIAGRAM_MERMAID_THEME, save_config, clear_config_cache, update_config_cache
 )
 from .utils import (
     pretty_size, parse_time_duration, parse_order_spec, apply_ordering, normalize_field_name, get_api_whitelist,
-    convert_docker_path_to_host
+    convert_docker_path_to_host, is_vast_version_legacy
 )
 from .client import (
-    create_vast_client, get_id_by_name, get_name_by_id, resolve_cluster_identifier, get_or_create_client, call_vast_api
+    create_vast_client, get_id_by_name, resolve_cluster_identifier, get_or_create_client, call_vast_api
 )
 from .template_parser import TemplateParser
+from .cache import get_cache_manager
 from .command_executor import CommandExecutor
-from vastpy import VASTClient
+from vastpy import VASTClient, RESTFailure
+
+# Shared pool for independent REST calls fanned out across tenants (vastpy is synchronous).
+# Only leaf calls are submitted here - tasks must not wait on other tasks in this pool.
+_api_executor = ThreadPoolExecutor(max_workers=API_PARALLEL_WORKERS, thread_name_prefix='vast-list')
+
+_cache_manager = get_cache_manager()
+
+# Clients of clusters that rejected the views tenant_id__in filter (HTTP 400)
+_views_tenant_id_in_supported = weakref.WeakKeyDictionary()
+
+# All excluded view metric patterns as one regex, so each metric name is checked in a single search
+_EXCLUDED_VIEW_METRIC_RE = (
+    re.compile('|'.join(re.escape(pattern) for pattern in EXCLUDED_VIEW_METRIC_PATTERNS))
+    if EXCLUDED_VIEW_METRIC_PATTERNS else None
+)
 
 
 def _get_metrics (client: VASTClient) -> List[Dict]:
@@ -110,15 +132,33 @@ def _get_monitor_by_name (client: VASTClient, monitor_name: str) -> Dict[str, An
     return None
 
 
-def _build_metrics_map(client: VASTClient) -> Dict[str, Dict[str, Dict]]:
+def _build_metrics_map(client: VASTClient, cluster_address: Optional[str] = None) -> Dict[str, Dict[str, Dict]]:
     """Build metrics map dynamically using the metrics API.
     
+    The metrics catalog rarely changes, so with a cluster_address the map is cached
+    per cluster for METRICS_MAP_CACHE_TTL_SECONDS. Callers must not modify it.
+    
     Args:
         client: VAST client instance
+        cluster_address: Cluster address used as cache key (no caching if omitted)
         
     Returns:
         Dictionary mapping object types to their available metrics
     """
+    if cluster_address is None:
+        return _load_metrics_map(client)
+    return _cache_manager.get_or_set(
+        'metrics_map', cluster_address, lambda: _load_metrics_map(client), ttl=METRICS_MAP_CACHE_TTL_SECONDS
+    )
+
+
+def clear_metrics_map_cache() -> None:
+    """Clear the cached metrics maps of all clusters."""
+    _cache_manager.clear('metrics_map')
+
+
+def _load_metrics_map(client: VASTClient) -> Dict[str, Dict[str, Dict]]:
+    """Fetch the metrics catalog and organize it by object type (see _build_metrics_map)."""
     try:
         # Get all available metrics from the API using unified function
         all_metrics = _get_metrics(client)
@@ -167,6 +207,79 @@ def _build_metrics_map(client: VASTClient) -> Dict[str, Dict[str, Dict]]:
         raise
 
 
+def _has_glob(pattern: str) -> bool:
+    """Check whether a pattern contains fnmatch wildcard characters."""
+    return '*' in pattern or '?' in pattern or '[' in pattern
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Callable[[str], Any]:
+    """Return a matcher for a wildcard pattern (case-sensitive, as fnmatchcase); truthy on match.
+    
+    Patterns without wildcard characters are compared with plain string equality.
+    """
+    if not _has_glob(pattern):
+        return pattern.__eq__
+    return re.compile(fnmatch.translate(pattern)).match
+
+
+def _match_by_name(items: List[Dict], pattern: str) -> List[Dict]:
+    """Return the items whose 'name' matches a wildcard pattern, keeping their order.
+    
+    fnmatch.filter compiles the pattern once for the whole list; '*' skips matching entirely.
+    """
+    if pattern == '*':
+        return list(items)
+    matched_names = set(fnmatch.filter([item.get('name', '') for item in items], pattern))
+    return [item for item in items if item.get('name', '') in matched_names]
+
+
+def _get_views_by_tenant(client: VASTClient, tenants: List[Dict], whitelist: Dict[str, Any]) -> List[List[Dict]]:
+    """Get the views (id, name) of several tenants, as one list per tenant in the given order.
+    
+    Multiple tenants are fetched with a single tenant_id__in query. Clusters rejecting
+    that filter (HTTP 400) are remembered and queried per tenant, concurrently.
+    """
+    tenant_ids = [tenant_info['id'] for tenant_info in tenants]
+    if len(tenants) > 1 and _views_tenant_id_in_supported.get(client, True):
+        try:
+            views = call_vast_api(
+                client=client,
+                endpoint='views',
+                method='get',
+                params={
+                    'page_size': REST_PAGE_SIZE,
+                    'fields': 'id,name,tenant_id',
+                    'tenant_id__in': ','.join(str(tenant_id) for tenant_id in tenant_ids)
+                },
+                whitelist=whitelist
+            )
+            # Partition locally - this also drops other tenants' views if the filter was ignored
+            views_by_tenant = {tenant_id: [] for tenant_id in tenant_ids}
+            for view in views:
+                tenant_views = views_by_tenant.get(view.get('tenant_id'))
+                if tenant_views is not None:
+                    tenant_views.append(view)
+            return [views_by_tenant[tenant_id] for tenant_id in tenant_ids]
+        except RESTFailure as e:
+            if e.status != 400:
+                raise
+            logging.debug(f"tenant_id__in filter not supported for views, querying per tenant: {e}")
+            _views_tenant_id_in_supported[client] = False
+    
+    def _get_tenant_views(tenant_id):
+        return call_vast_api(
+            client=client,
+            endpoint='views',
+            method='get',
+            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name', 'tenant_id': tenant_id},
+            whitelist=whitelist
+        )
+    
+    # Results keep tenant order
+    return list(_api_executor.map(_get_tenant_views, tenant_ids))
+
+
 def _get_instance_ids(client: VASTClient, object_name: str, instances: str, default_tenant: str) -> List[str]:
     """Get instance IDs for specified instances, supporting wildcards.
     
@@ -180,8 +293,6 @@ def _get_instance_ids(client: VASTClient, object_name: str, instances: str, defa
     Returns:
         List of instance IDs
     """
-    import fnmatch
-    
     instance_ids = []
     if not instances:
         return instance_ids
@@ -190,8 +301,26 @@ def _get_instance_ids(client: VASTClient, object_name: str, instances: str, defa
     whitelist = get_api_whitelist()
     object_name_lower = object_name.lower()
     
-    # Get all instances for wildcard matching
-    all_instances_list = _get_all_instances(client, object_name)
+    # All instances for wildcard matching - fetched on first use, only non-view wildcards need them
+    all_instances_list = None
+    
+    # Tenants (id, name) - listed once on first use and shared by every instance spec
+    all_tenants_list = None
+    tenant_ids_by_name = {}
+    
+    def _get_tenants():
+        nonlocal all_tenants_list
+        if all_tenants_list is None:
+            all_tenants_list = call_vast_api(
+                client=client,
+                endpoint='tenants',
+                method='get',
+                params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
+                whitelist=whitelist
+            )
+            for tenant_info in all_tenants_list:
+                tenant_ids_by_name.setdefault(tenant_info['name'], tenant_info['id'])
+        return all_tenants_list
     
     for instance_spec in instances.split(','):
         instance_spec = instance_spec.strip()
@@ -214,103 +343,52 @@ def _get_instance_ids(client: VASTClient, object_name: str, instances: str, defa
         if has_wildcard:
             # Handle wildcard matching
             if object_name_lower == 'view':
-                # For views, we need to match against tenant:path combinations
-                matching_ids = []
-                
-                # Get all tenants if tenant pattern has wildcard or is "*"
-                if tenant_pattern and '*' in tenant_pattern:
-                    # Need to check all tenants
-                    all_tenants = call_vast_api(
-                        client=client,
-                        endpoint='tenants',
-                        method='get',
-                        params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
-                        whitelist=whitelist
-                    )
-                elif tenant_pattern == '*':
-                    # All tenants
-                    all_tenants = call_vast_api(
+                if instance_pattern == '*' and (not tenant_pattern or tenant_pattern == '*'):
+                    # Every view of every tenant - no tenant lookup or per-view matching needed
+                    all_views = call_vast_api(
                         client=client,
-                        endpoint='tenants',
+                        endpoint='views',
                         method='get',
-                        params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
+                        params={'page_size': REST_PAGE_SIZE, 'fields': 'id'},
                         whitelist=whitelist
                     )
-                elif tenant_pattern:
-                    # Specific tenant (no wildcard)
-                    tenant_id = get_id_by_name(client, 'tenants', tenant_pattern, whitelist=whitelist)
-                    if tenant_id:
-                        all_tenants = [{'id': tenant_id, 'name': tenant_pattern}]
-                    else:
-                        all_tenants = []
+                    instance_ids.extend(view.get('id') for view in all_views)
+                    continue
+                
+                # For views, we need to match against tenant:path combinations
+                matching_ids = []
+                
+                all_tenants = _get_tenants()
+                if tenant_pattern and '*' in tenant_pattern:
+                    # Check which tenants match the pattern (pattern compiled once for all names)
+                    if tenant_pattern != '*':
+                        matched_tenants = set(fnmatch.filter(tenant_ids_by_name, tenant_pattern))
+                        all_tenants = [t for t in all_tenants if t['name'] in matched_tenants]
                 else:
-                    # No tenant specified
-                    # If instance_pattern is "*", get all views from all tenants
-                    # Otherwise, use default tenant
-                    if instance_pattern == '*':
-                        # Get all tenants for "*" pattern
-                        all_tenants = call_vast_api(
-                            client=client,
-                            endpoint='tenants',
-                            method='get',
-                            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
-                            whitelist=whitelist
-                        )
-                    else:
-                        # Use default tenant for specific patterns
-                        tenant_id = get_id_by_name(client, 'tenants', default_tenant, whitelist=whitelist)
-                        if tenant_id:
-                            all_tenants = [{'id': tenant_id, 'name': default_tenant}]
-                        else:
-                            all_tenants = []
+                    # Specific tenant (no wildcard), or the default tenant when none was given
+                    tenant_name = tenant_pattern or default_tenant
+                    tenant_id = tenant_ids_by_name.get(tenant_name)
+                    all_tenants = [{'id': tenant_id, 'name': tenant_name}] if tenant_id else []
                 
-                # Match views across all relevant tenants
-                for tenant_info in all_tenants:
-                    tenant_id = tenant_info['id']
-                    tenant_name = tenant_info['name']
-                    
-                    # Check if tenant matches pattern
-                    if tenant_pattern and tenant_pattern != '*':
-                        if not fnmatch.fnmatch(tenant_name, tenant_pattern):
-                            continue
-                    
-                    # Get views for this tenant
-                    views = call_vast_api(
-                        client=client,
-                        endpoint='views',
-                        method='get',
-                        params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name', 'tenant_id': tenant_id},
-                        whitelist=whitelist
-                    )
-                    
-                    for view in views:
-                        view_name = view.get('name', '')
-                        view_id = view.get('id')
-                        
-                        # Match against instance pattern (use name only)
-                        if instance_pattern == '*':
-                            # Match all views
-                            matching_ids.append(view_id)
-                        elif fnmatch.fnmatch(view_name, instance_pattern):
-                            matching_ids.append(view_id)
+                for views in _get_views_by_tenant(client, all_tenants, whitelist):
+                    # Match against instance pattern (use name only)
+                    matching_ids.extend(view.get('id') for view in _match_by_name(views, instance_pattern))
                 
                 instance_ids.extend(matching_ids)
             else:
                 # For non-view objects, match against instance names
-                matching_ids = []
-                for inst in all_instances_list:
-                    inst_name = inst.get('name', '')
-                    if instance_pattern == '*':
-                        matching_ids.append(inst['id'])
-                    elif fnmatch.fnmatch(inst_name, instance_pattern):
-                        matching_ids.append(inst['id'])
-                instance_ids.extend(matching_ids)
+                if all_instances_list is None:
+                    all_instances_list = _get_all_instances(client, object_name)
+                instance_ids.extend(
+                    inst['id'] for inst in _match_by_name(all_instances_list, instance_pattern)
+                )
         else:
             # No wildcard - use original logic
             instance = instance_pattern
             tenant = tenant_pattern if tenant_pattern else default_tenant
             
-            tenant_id = get_id_by_name(client, 'tenants', tenant, whitelist=whitelist)
+            _get_tenants()
+            tenant_id = tenant_ids_by_name.get(tenant)
             if not tenant_id:
                 raise ValueError(f"Tenant {tenant} not found.")
             
@@ -324,24 +402,24 @@ def _get_instance_ids(client: VASTClient, object_name: str, instances: str, defa
             if not instance_id and object_name_lower == 'view' and not tenant_explicitly_specified:
                 try:
                     # Try to find in other tenants
-                    all_tenants = call_vast_api(
+                    # One cross-tenant query finds the view in every tenant that has it
+                    candidates = call_vast_api(
                         client=client,
-                        endpoint='tenants',
+                        endpoint='views',
                         method='get',
-                        params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
+                        params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name,tenant_id', 'name': instance},
                         whitelist=whitelist
                     )
-                    matches = []
-                    for t_info in all_tenants:
-                        t_id = t_info['id']
-                        t_name = t_info['name']
-                        if t_id == tenant_id:
-                            continue  # Skip default tenant, already tried
-                        
-                        found_id = get_id_by_name(client, 'views', instance, field='name', tenant_id=t_id, whitelist=whitelist)
-                        
-                        if found_id:
-                            matches.append({'tenant': t_name, 'tenant_id': t_id, 'view_id': found_id})
+                    all_tenants = _get_tenants()
+                    view_id_by_tenant = {}
+                    for candidate in candidates:
+                        view_id_by_tenant.setdefault(candidate.get('tenant_id'), candidate['id'])
+                    # Keep tenant order and skip default tenant, already tried
+                    matches = [
+                        {'tenant': t_info['name'], 'tenant_id': t_info['id'], 'view_id': view_id_by_tenant[t_info['id']]}
+                        for t_info in all_tenants
+                        if t_info['id'] != tenant_id and view_id_by_tenant.get(t_info['id'])
+                    ]
                     
                     if len(matches) == 1:
                         # Single match - use it and log suggestion
@@ -384,16 +462,51 @@ def _get_instance_ids(client: VASTClient, object_name: str, instances: str, defa
     return instance_ids
 
 
-def _get_all_instances(client: VASTClient, object_name: str) -> List[Dict]:
+# Endpoint and fields used to list instances of each (non-view) object type
+_INSTANCE_LOOKUPS = {
+    'tenant': ('tenants', 'id,name'),
+    'cnode': ('cnodes', 'id,name'),
+    'host': ('hosts', 'id,name'),
+    'user': ('monitoredusers', 'id,title'),
+    'vippool': ('vippools', 'id,name'),
+}
+
+
+def _get_all_instances(client: VASTClient, object_name: str, cluster_address: Optional[str] = None, refresh: bool = False) -> List[Dict]:
     """Get all instances of an object type for name resolution.
     
+    With a cluster_address the list is cached per cluster and object type for
+    INSTANCES_CACHE_TTL_SECONDS. Callers must not modify it.
+    
     Args:
         client: VAST client instance
         object_name: Object type name
+        cluster_address: Cluster address used as cache key (no caching if omitted)
+        refresh: Reload the list from the cluster and replace the cached copy
         
     Returns:
         List of instance dictionaries with 'id' and 'name' keys
     """
+    if cluster_address is None:
+        return _load_all_instances(client, object_name)
+    cache_key = f"{cluster_address}:{object_name.lower()}"
+    if refresh:
+        all_instances = _load_all_instances(client, object_name)
+        _cache_manager.set('instances', cache_key, all_instances, ttl=INSTANCES_CACHE_TTL_SECONDS)
+        return all_instances
+    return _cache_manager.get_or_set(
+        'instances', cache_key,
+        lambda: _load_all_instances(client, object_name), ttl=INSTANCES_CACHE_TTL_SECONDS
+    )
+
+
+def clear_instances_cache() -> None:
+    """Clear the cached instance lists of all clusters."""
+    _cache_manager.clear('instances')
+
+
+def _load_all_instances(client: VASTClient, object_name: str) -> List[Dict]:
+    """Fetch all instances of an object type (see _get_all_instances)."""
     # Get whitelist once at the start to avoid repeated calls
     whitelist = get_api_whitelist()
     object_name_lower = object_name.lower()
@@ -421,48 +534,18 @@ def _get_all_instances(client: VASTClient, object_name: str) -> List[Dict]:
             d["name"] = d.get('name', '')
             d["tenant_id"] = d.get('tenant_id')
             d["tenant_name"] = tenant_map.get(d.get('tenant_id'), 'unknown')
-    elif object_name_lower == 'tenant':
-        all_instances = call_vast_api(
-            client=client,
-            endpoint='tenants',
-            method='get',
-            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
-            whitelist=whitelist
-        )
-    elif object_name_lower == 'cnode':
+    elif object_name_lower in _INSTANCE_LOOKUPS:
+        endpoint, fields = _INSTANCE_LOOKUPS[object_name_lower]
         all_instances = call_vast_api(
             client=client,
-            endpoint='cnodes',
-            method='get',
-            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
-            whitelist=whitelist
-        )
-    elif object_name_lower == 'host':
-        all_instances = call_vast_api(
-            client=client,
-            endpoint='hosts',
-            method='get',
-            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
-            whitelist=whitelist
-        )
-    elif object_name_lower == 'user':
-        all_instances = call_vast_api(
-            client=client,
-            endpoint='monitoredusers',
-            method='get',
-            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,title'},
-            whitelist=whitelist
-        )
-        for d in all_instances:
-            d["name"] = d['title']
-    elif object_name_lower == 'vippool':
-        all_instances = call_vast_api(
-            client=client,
-            endpoint='vippools',
+            endpoint=endpoint,
             method='get',
-            params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
+            params={'page_size': REST_PAGE_SIZE, 'fields': fields},
             whitelist=whitelist
         )
+        if object_name_lower == 'user':
+            for d in all_instances:
+                d["name"] = d['title']
     else:
         all_instances = []
     
@@ -483,10 +566,10 @@ def _filter_metrics_for_object_type(prop_list: List[str], object_name: str) -> L
     
     if object_name_lower == 'view':
         # Filter for view-specific metrics (only rate metrics, exclude certain patterns)
-        filtered = [key for key in prop_list if '__rate' in key]
-        for pattern in EXCLUDED_VIEW_METRIC_PATTERNS:
-            filtered = [key for key in filtered if pattern not in key]
-        return filtered
+        if _EXCLUDED_VIEW_METRIC_RE is None:
+            return [key for key in prop_list if '__rate' in key]
+        excluded = _EXCLUDED_VIEW_METRIC_RE.search
+        return [key for key in prop_list if '__rate' in key and not excluded(key)]
     elif object_name_lower == 'tenant':
         # Filter for tenant-specific metrics (averages only)
         return [key for key in prop_list if key.endswith('_avg')]
@@ -495,6 +578,11 @@ def _filter_metrics_for_object_type(prop_list: List[str], object_name: str) -> L
         return [key for key in prop_list if key.endswith((',bw', ',iops', ',latency'))]
 
 
+# Ascending timeframe thresholds and the granularity used up to each of them
+_GRANULARITY_THRESHOLDS = (GRANULARITY_THRESHOLD_SECONDS, GRANULARITY_THRESHOLD_HOURS, GRANULARITY_THRESHOLD_DAYS)
+_GRANULARITY_NAMES = ('seconds', 'minutes', 'hours', 'days')
+
+
 def _get_granularity(timeframe_in_seconds: int) -> str:
     """Determine granularity based on timeframe.
     
@@ -504,14 +592,19 @@ def _get_granularity(timeframe_in_seconds: int) -> str:
     Returns:
         Granularity string: 'seconds', 'minutes', 'hours', or 'days'
     """
-    if timeframe_in_seconds > GRANULARITY_THRESHOLD_DAYS:
-        return "days"
-    elif timeframe_in_seconds > GRANULARITY_THRESHOLD_HOURS:
-        return "hours"
-    elif timeframe_in_seconds > GRANULARITY_THRESHOLD_SECONDS:
-        return "minutes"
-    else:
-        return "seconds"
+    # A timeframe strictly above a threshold moves to the next granularity
+    return _GRANULARITY_NAMES[bisect_left(_GRANULARITY_THRESHOLDS, timeframe_in_seconds)]
+
+
+# Lookup tables for _normalize_metric_display
+_METRIC_DISPLAY_OVERRIDES = {
+    "ViewMetrics,read_latency__rate": "Read Latency",
+    "ViewMetrics,write_latency__rate": "Write Latency",
+}
+_METRIC_AGGREGATION_SUFFIX_RE = re.compile(r' \((?:Rate|Sum)\)')
+_METRIC_DISPLAY_UNIT_SUFFIXES = ('IOPS', 'BANDWIDTH', 'BW', 'LATENCY')
+_METRIC_UNIT_MAP = {'ms': 'latency', 'IOPS': 'iops'}
+_METRIC_GENERIC_DISPLAY_NAMES = frozenset(['iops', 'latency', 'bandwidth'])
 
 
 def _normalize_metric_display(display_name: str, units: str, metric_name: str) -> Tuple[str, str]:
@@ -526,48 +619,83 @@ def _normalize_metric_display(display_name: str, units: str, metric_name: str) -
         Tuple of (normalized_display_name, normalized_units)
     """
     # Normalize display name
-    if display_name == "ViewMetrics,read_latency__rate":
-        display_name = "Read Latency"
-    if display_name == "ViewMetrics,write_latency__rate":
-        display_name = "Write Latency"
-    display_name = display_name.replace(' (Rate)', '')
-    display_name = display_name.replace(' (Sum)', '')
-    if display_name.upper().endswith('IOPS'):
-        display_name = display_name.rsplit(" ", 1)[0]
-    if display_name.upper().endswith('BANDWIDTH'):
-        display_name = display_name.rsplit(" ", 1)[0]
-    if display_name.upper().endswith('BW'):
-        display_name = display_name.rsplit(" ", 1)[0]
-    if display_name.upper().endswith('LATENCY'):
-        display_name = display_name.rsplit(" ", 1)[0]
+    display_name = _METRIC_DISPLAY_OVERRIDES.get(display_name, display_name)
+    display_name = _METRIC_AGGREGATION_SUFFIX_RE.sub('', display_name)
+    # Strip trailing unit words in order; a stripped name is checked against the remaining suffixes
+    display_name_upper = display_name.upper()
+    for suffix in _METRIC_DISPLAY_UNIT_SUFFIXES:
+        if display_name_upper.endswith(suffix):
+            display_name = display_name.rsplit(" ", 1)[0]
+            display_name_upper = display_name.upper()
     
     # Normalize units
     if not units:
-        if 'iops' in metric_name.lower():
+        metric_name_lower = metric_name.lower()
+        if 'iops' in metric_name_lower:
             units = 'iops'
-        elif 'latency' in metric_name.lower():
+        elif 'latency' in metric_name_lower:
             units = 'latency'
         else:
             units = 'bw'
     elif 'MB/Sec' in units:
         units = 'bw'
-    elif units == 'ms':
-        units = 'latency'
-    elif units == 'IOPS':
-        units = 'iops'
+    else:
+        units = _METRIC_UNIT_MAP.get(units, units)
     
     # Remove spaces from units
     units = units.replace(" ", "")
     
     # Handle empty display name
-    if display_name == '':
-        display_name = 'All Protocols'
-    if display_name.lower() in ['iops', 'latency', 'bandwidth']:
+    if display_name == '' or display_name.lower() in _METRIC_GENERIC_DISPLAY_NAMES:
         display_name = 'All Protocols'
     
     return display_name, units
 
 
+def _partition_p95_max(values: np.ndarray) -> Tuple[Any, Any]:
+    """Return the 95th percentile and max of values along axis 0 from one partition.
+    
+    Partitions values in place around the 95th percentile rank. The percentile uses
+    the same linear interpolation as np.percentile, and the max lies above that rank.
+    """
+    rank = (len(values) - 1) * 0.95
+    rank_low = int(rank)
+    rank_high = min(rank_low + 1, len(values) - 1)
+    weight = rank - rank_low
+    values.partition((rank_low, rank_high), axis=0)
+    low, high = values[rank_low], values[rank_high]
+    diff = high - low
+    # Interpolate from the nearer neighbour, as np.percentile does
+    p95 = high - diff * (1 - weight) if weight >= 0.5 else low + diff * weight
+    return p95, values[rank_high:].max(axis=0)
+
+
+def _unwrap_metrics_response(metrics_list: Any) -> Dict:
+    """Return the metrics dict of a monitor query response.
+    
+    The monitor query endpoints return a single dict, which may come back wrapped in a list.
+    """
+    if isinstance(metrics_list, list) and len(metrics_list) == 1 and isinstance(metrics_list[0], dict):
+        return metrics_list[0]
+    if isinstance(metrics_list, dict):
+        return metrics_list
+    return {}
+
+
+def _integer_object_id(object_id: Any) -> Optional[int]:
+    """Return a data point's object_id as an int, or None if it is not an integer id."""
+    if isinstance(object_id, (int, np.integer)) and not isinstance(object_id, bool):
+        return int(object_id)
+    if isinstance(object_id, float) and object_id.is_integer():
+        return int(object_id)
+    if isinstance(object_id, str):
+        try:
+            return int(object_id)
+        except ValueError:
+            return None
+    return None
+
+
 def _process_performance_data(
     metrics: Dict,
     metrics_map: Dict[str, Dict[str, Dict]],
@@ -594,53 +722,85 @@ def _process_performance_data(
     data_points = metrics['data']
     object_ids = metrics['object_ids']
     
+    # Convert all rows once and group them by object ID, instead of rescanning the rows per object
+    # Each row is [timestamp, object_id, metric values...]
+    data_points_np = np.asarray(data_points, dtype=object)
+    if data_points_np.ndim != 2 or data_points_np.shape[0] == 0:
+        data_points_np = np.empty((0, len(prop_list_response)), dtype=object)
+    # Drop rows whose object_id is not an integer id (e.g. None), as the graph path does
+    row_ids = [_integer_object_id(object_id) for object_id in data_points_np[:, 1]]
+    if None in row_ids:
+        kept_rows = [i for i, object_id in enumerate(row_ids) if object_id is not None]
+        logging.warning(f"Skipping {len(row_ids) - len(kept_rows)} {object_name} data points without an integer object_id")
+        data_points_np = data_points_np[kept_rows]
+        row_ids = [row_ids[i] for i in kept_rows]
+    ids_all = np.array(row_ids, dtype=np.int64)
+    values_all = data_points_np[:, 2:].astype(np.float64)  # Exclude timestamp and object_id columns
+    valid = ~np.isnan(values_all).any(axis=1)  # Remove NaN rows
+    
+    # Sort valid rows by object ID so each object's rows form one contiguous group
+    # (a single gather of the valid rows in sorted order - no intermediate copy)
+    rows_valid = np.flatnonzero(valid)
+    rows_sorted = rows_valid[np.argsort(ids_all[rows_valid], kind='stable')]
+    ids_sorted = ids_all[rows_sorted]
+    values_sorted = values_all[rows_sorted]
+    # Groups start where the (already sorted) ID changes - no second sort as in np.unique
+    group_starts = np.flatnonzero(np.diff(ids_sorted, prepend=ids_sorted[:1] - 1))
+    group_ids = ids_sorted[group_starts]
+    group_ends = np.append(group_starts[1:], len(ids_sorted))
+    if len(group_ids):
+        group_avg = np.add.reduceat(values_sorted, group_starts, axis=0) / (group_ends - group_starts)[:, None]
+    group_index = {int(object_id): i for i, object_id in enumerate(group_ids)}
+    ids_present = set(ids_all.tolist())
+    
+    # Instance names by ID (built in reverse so the first instance with an ID wins)
+    id_to_name = {v['id']: v.get('name', '') for v in reversed(all_instances)}
+    
+    # Display name and units only depend on the metric - resolve them once for all objects
+    object_metrics_map = metrics_map.get(object_name.lower(), {})
+    metric_labels = []
+    metric_scale = np.ones(len(prop_list_response) - 2)
+    for i, metric_name in enumerate(prop_list_response[2:]):
+        metric_info = object_metrics_map.get(metric_name, {})
+        display_name, units = _normalize_metric_display(metric_info.get('title', ''), metric_info.get('units', ''), metric_name)
+        metric_labels.append((display_name, units))
+        # Convert MB/s to bytes/s for bandwidth if needed
+        if units == 'bw' and not metric_info.get('units'):
+            metric_scale[i] = 1024 * 1024
+    if len(group_ids):
+        group_avg *= metric_scale
+    
     for object_id in object_ids:
         # Resolve instance name from ID
-        instance_name = next((v['name'] for v in all_instances if v['id'] == object_id), '')
-        data_points_np = np.array([d for d in data_points if d[1] == object_id])
+        instance_name = id_to_name.get(object_id, '')
         
-        if data_points_np.size == 0:
+        if object_id not in ids_present:
             logging.warning(f"No data points found for {object_name} instance: {instance_name} (ID: {object_id})")
             continue
         
-        data_points_np = data_points_np[:, 2:]  # Exclude timestamp and object_id columns
-        data_points_np = data_points_np.astype(np.float64)
-        data_points_np = data_points_np[~np.isnan(data_points_np).any(axis=1)]  # Remove NaN rows
-        
-        # Check if array is empty after removing NaN rows
-        if data_points_np.size == 0 or len(data_points_np) == 0:
+        # Check if the object has rows left after removing NaN rows
+        i_group = group_index.get(object_id)
+        if i_group is None:
             logging.warning(f"No valid data points found for {object_name} instance: {instance_name} (ID: {object_id}) after filtering NaN values")
             continue
         
-        summarized_metrics_percentile = np.percentile(data_points_np, 95, axis=0)
-        summarized_metrics_avg = np.mean(data_points_np, axis=0)
-        summarized_metrics_max = np.max(data_points_np, axis=0)
-        
-        # Map metrics to values
-        for i, metric_name in enumerate(prop_list_response[2:]):
-            metric_info = metrics_map.get(object_name.lower(), {}).get(metric_name, {})
-            display_name = metric_info.get('title', '')
-            units = metric_info.get('units', '')
-            
-            display_name, units = _normalize_metric_display(display_name, units, metric_name)
-            
-            # Convert MB/s to bytes/s for bandwidth if needed
-            if units == 'bw' and not metric_info.get('units'):
-                summarized_metrics_avg[i] *= 1024 * 1024
-                summarized_metrics_percentile[i] *= 1024 * 1024
-                summarized_metrics_max[i] *= 1024 * 1024
-            
-            # Populate performance table
-            if instance_name not in performance_table:
-                performance_table[instance_name] = {}
-            if display_name not in performance_table[instance_name]:
-                performance_table[instance_name][display_name] = {}
-            if units not in performance_table[instance_name][display_name]:
-                performance_table[instance_name][display_name][units] = {}
-            
-            performance_table[instance_name][display_name][units]['Average'] = summarized_metrics_avg[i]
-            performance_table[instance_name][display_name][units]['95th Percentile'] = summarized_metrics_percentile[i]
-            performance_table[instance_name][display_name][units]['Max'] = summarized_metrics_max[i]
+        # values_sorted is our own gathered copy and the averages are already taken,
+        # so the group's slice (a view) is partitioned in place instead of copied
+        summarized_metrics_percentile, summarized_metrics_max = _partition_p95_max(
+            values_sorted[group_starts[i_group]:group_ends[i_group]]
+        )
+        summarized_metrics_percentile = summarized_metrics_percentile * metric_scale
+        summarized_metrics_avg = group_avg[i_group]
+        summarized_metrics_max = summarized_metrics_max * metric_scale
+        
+        # Populate performance table
+        instance_table = performance_table.setdefault(instance_name, {})
+        for i, (display_name, units) in enumerate(metric_labels):
+            instance_table.setdefault(display_name, {})[units] = {
+                'Average': summarized_metrics_avg[i],
+                '95th Percentile': summarized_metrics_percentile[i],
+                'Max': summarized_metrics_max[i],
+            }
     
     return performance_table
 
@@ -693,6 +853,44 @@ def _format_performance_table(
     return printable_performance_table
 
 
+# Known connection failures and their display text, in priority order
+_CONNECTION_ERROR_DISPLAYS = (
+    (re.compile(r'Connection refused'), "Connection refused"),
+    (re.compile(r'timed out|timeout', re.IGNORECASE), "Connection timeout"),
+    (re.compile(r'Max retries exceeded'), "Connection failed (max retries exceeded)"),
+)
+
+
+def _short_connection_error(error_message: str) -> str:
+    """Return a short display form of a cluster connection error."""
+    for pattern, display in _CONNECTION_ERROR_DISPLAYS:
+        if pattern.search(error_message):
+            return display
+    # Use first part of error message, limit length
+    return error_message.split('\n')[0][:50] + "..." if len(error_message) > 50 else error_message
+
+
+def _short_sw_version(sw_version: Any) -> Any:
+    """Shorten a cluster sw_version to its first four components (e.g. 5.3.1.2.123 -> 5.3.1.2)."""
+    if isinstance(sw_version, str):
+        parts = sw_version.split(".", 4)
+        if len(parts) >= 4:
+            return ".".join(parts[:4])
+    return sw_version
+
+
+def _get_cluster_details(cluster: str, whitelist: Dict[str, Any]) -> List[Dict]:
+    """Fetch the clusters endpoint of one configured cluster (runs on the shared API pool)."""
+    client = create_vast_client(cluster)
+    return call_vast_api(
+        client=client,
+        endpoint='clusters',
+        method='get',
+        params={'page_size': REST_PAGE_SIZE},
+        whitelist=whitelist
+    )
+
+
 def list_clusters(clusters: str = None):
     """List clusters with status and general info."""
     config = load_config()
@@ -714,6 +912,7 @@ def list_clusters(clusters: str = None):
 
     #return list of clusters with status and general info
     clusters_table = []
+    eligible_clusters = []
     for cluster_info in config['clusters']:
 
         # display information only for the specified clusters
@@ -725,7 +924,6 @@ def list_clusters(clusters: str = None):
                 continue
         
         # Check if this is a legacy version (< 5.3) - treat as SUPER_ADMIN
-        from .utils import is_vast_version_legacy
         vast_version = cluster_info.get('vast_version', '')
         is_legacy = is_vast_version_legacy(vast_version)
         
@@ -733,93 +931,100 @@ def list_clusters(clusters: str = None):
         if not is_legacy and cluster_info.get('user_type') != 'SUPER_ADMIN':
             logging.info(f"Skipping cluster: {cluster_info['cluster']} since credentials are not for a super admin user")
         else:
-            try:
-                cluster = cluster_info['cluster']
-                client = create_vast_client(cluster)
-                whitelist = get_api_whitelist()
-                all_clusters_dict = call_vast_api(
-                    client=client,
-                    endpoint='clusters',
-                    method='get',
-                    params={'page_size': REST_PAGE_SIZE},
-                    whitelist=whitelist
-                )
-                # Convert to dict format expected by code
-                all_clusters = {'results': all_clusters_dict}
-                
-                # Update config with cluster_name for this cluster address
-                # This supports cluster renames and allows searching by cluster name
-                config_updated = False
-                for c in all_clusters['results']:
-                    cluster_name_from_api = c.get('name')
-                    if cluster_name_from_api:
-                        # Find the cluster config entry by address
-                        for cfg_cluster in config['clusters']:
-                            if cfg_cluster['cluster'] == cluster:
-                                # Update cluster_name if it's different or missing
-                                if cfg_cluster.get('cluster_name') != cluster_name_from_api:
-                                    cfg_cluster['cluster_name'] = cluster_name_from_api
-                                    config_updated = True
-                                    logging.debug(f"Updated cluster_name for {cluster}: {cluster_name_from_api}")
-                                break
-                    
-                    cl = {
-                        'Cluster': c['name'],
-                        'State': c['state'],
-                        'Version': ".".join(c['sw_version'].split(".")[:4]) if isinstance(c['sw_version'], str) and "." in c['sw_version'] and len(c['sw_version'].split(".")) >= 4 else c['sw_version'],
-                        'Uptime': c['uptime'],
-                        'Logical Used': pretty_size(c['logical_space_in_use']),
-                        'Physical Used': pretty_size(c['physical_space_in_use']),
-                        'Logical Free': pretty_size(c['free_logical_space']),
-                        'Physical Free': pretty_size(c['free_physical_space']),
-                        #'Logical Total': pretty_size(c['logical_space']),
-                        #'Physical Total': pretty_size(c['physical_space']),
-                        'IOPS': c['rd_iops'] + c['wr_iops'],
-                        'Throughput': pretty_size(c['rd_bw'] + c['wr_bw']) + '/s'
-                        }
-                    clusters_table.append(cl)
-                
-                # Save updated config if cluster_name was added/updated
-                if config_updated:
-                    from .config import save_config, clear_config_cache
-                    save_config(config)
-                    clear_config_cache()  # Clear cache so next load gets updated config
-            except Exception as e:
-                cluster = cluster_info['cluster']
-                logging.error(f"Failed to list cluster: {cluster}. Error: {e}")
-                # Add error entry instead of raising - continue with other clusters
-                error_message = str(e)
-                # Extract a shorter error message for display
-                if "Connection refused" in error_message or "Connection refused" in str(e):
-                    error_display = "Connection refused"
-                elif "timed out" in error_message.lower() or "timeout" in error_message.lower():
-                    error_display = "Connection timeout"
-                elif "Max retries exceeded" in error_message:
-                    error_display = "Connection failed (max retries exceeded)"
-                else:
-                    # Use first part of error message, limit length
-                    error_display = error_message.split('\n')[0][:50] + "..." if len(error_message) > 50 else error_message
+            eligible_clusters.append(cluster_info)
+    
+    # Config entries by address (first entry wins, as a scan of the list would)
+    cfg_by_addr = {}
+    for cfg_cluster in config['clusters']:
+        cfg_by_addr.setdefault(cfg_cluster['cluster'], cfg_cluster)
+    
+    # Query the eligible clusters concurrently (independent REST calls); results keep config order
+    whitelist = get_api_whitelist()
+    futures = [
+        _api_executor.submit(_get_cluster_details, cluster_info['cluster'], whitelist)
+        for cluster_info in eligible_clusters
+    ]
+    config_updated = False
+    for cluster_info, future in zip(eligible_clusters, futures):
+        try:
+            cluster = cluster_info['cluster']
+            all_clusters_dict = future.result()
+            # Convert to dict format expected by code
+            all_clusters = {'results': all_clusters_dict}
+            
+            # Update config with cluster_name for this cluster address
+            # This supports cluster renames and allows searching by cluster name
+            cfg_cluster = cfg_by_addr.get(cluster)
+            for c in all_clusters['results']:
+                cluster_name_from_api = c['name']
+                # Update cluster_name of the config entry if it's different or missing
+                if cluster_name_from_api and cfg_cluster is not None and cfg_cluster.get('cluster_name') != cluster_name_from_api:
+                    cfg_cluster['cluster_name'] = cluster_name_from_api
+                    config_updated = True
+                    logging.debug(f"Updated cluster_name for {cluster}: {cluster_name_from_api}")
                 
-                # Add error entry with cluster address/name
-                error_cluster = {
-                    'Cluster': cluster,
-                    'State': 'ERROR',
-                    'Version': 'N/A',
-                    'Uptime': 'N/A',
-                    'Logical Used': 'N/A',
-                    'Physical Used': 'N/A',
-                    'Logical Free': 'N/A',
-                    'Physical Free': 'N/A',
-                    #'Logical Total': 'N/A',
-                    #'Physical Total': 'N/A',
-                    'IOPS': 'N/A',
-                    'Throughput': error_display  # Use this field to show error
-                }
-                clusters_table.append(error_cluster)
-                # Continue with next cluster instead of raising   
+                cl = {
+                    'Cluster': cluster_name_from_api,
+                    'State': c['state'],
+                    'Version': _short_sw_version(c['sw_version']),
+                    'Uptime': c['uptime'],
+                    'Logical Used': pretty_size(c['logical_space_in_use']),
+                    'Physical Used': pretty_size(c['physical_space_in_use']),
+                    'Logical Free': pretty_size(c['free_logical_space']),
+                    'Physical Free': pretty_size(c['free_physical_space']),
+                    #'Logical Total': pretty_size(c['logical_space']),
+                    #'Physical Total': pretty_size(c['physical_space']),
+                    'IOPS': c['rd_iops'] + c['wr_iops'],
+                    'Throughput': pretty_size(c['rd_bw'] + c['wr_bw']) + '/s'
+                    }
+                clusters_table.append(cl)
+        except Exception as e:
+            cluster = cluster_info['cluster']
+            logging.error(f"Failed to list cluster: {cluster}. Error: {e}")
+            # Add error entry instead of raising - continue with other clusters
+            error_message = str(e)
+            # Extract a shorter error message for display
+            error_display = _short_connection_error(error_message)
+            
+            # Add error entry with cluster address/name
+            error_cluster = {
+                'Cluster': cluster,
+                'State': 'ERROR',
+                'Version': 'N/A',
+                'Uptime': 'N/A',
+                'Logical Used': 'N/A',
+                'Physical Used': 'N/A',
+                'Logical Free': 'N/A',
+                'Physical Free': 'N/A',
+                #'Logical Total': 'N/A',
+                #'Physical Total': 'N/A',
+                'IOPS': 'N/A',
+                'Throughput': error_display  # Use this field to show error
+            }
+            clusters_table.append(error_cluster)
+            # Continue with next cluster instead of raising   
+    
+    # Save updated config once if any cluster_name was added/updated
+    if config_updated:
+        try:
+            save_config(config)
+            update_config_cache(config)  # Next load returns the saved config without re-reading it
+        except Exception as e:
+            logging.error(f"Failed to save updated cluster names to config: {e}")
+            clear_config_cache()  # Drop the unsaved changes; next load re-reads the file
     return clusters_table
 
 
+# Protocols reported by list_view_instances
+_VIEW_INSTANCE_PROTOCOLS = ('NFS', 'SMB', 'S3')
+
+
+def _reported_view_protocols(view_protocols: Optional[List[str]]) -> List[str]:
+    """Return the reported protocols enabled on a view, in NFS, SMB, S3 order."""
+    enabled = set(view_protocols or ())
+    return [protocol for protocol in _VIEW_INSTANCE_PROTOCOLS if protocol in enabled]
+
+
 def list_view_instances(cluster: str, tenant: str = None, name: str = None, path: str = None) -> List[Dict]:
     """
     List view instances to help discover available views.
@@ -847,19 +1052,17 @@ def list_view_instances(cluster: str, tenant: str = None, name: str = None, path
         - Find views with "pvc" in name: list_view_instances(cluster="vast3115-var", name="*pvc*")
         - Find views in /data path: list_view_instances(cluster="vast3115-var", path="*/data/*")
     """
-    import fnmatch
-    
     if not cluster:
         raise ValueError("cluster parameter is required")
     
     config = load_config()
     cluster_address, cluster_config, _ = resolve_cluster_identifier(cluster, config)
     client = create_vast_client(cluster_address)
+    whitelist = get_api_whitelist()
     
     # Get all tenants if tenant filter is specified
     tenant_id = None
     if tenant:
-        whitelist = get_api_whitelist()
         tenant_id = get_id_by_name(client, 'tenants', tenant, whitelist=whitelist)
         if not tenant_id:
             raise ValueError(f"Tenant '{tenant}' not found.")
@@ -869,16 +1072,15 @@ def list_view_instances(cluster: str, tenant: str = None, name: str = None, path
     if tenant_id:
         views_params['tenant_id'] = tenant_id
     
-    # Log API request with all parameters for debugging
-    import urllib.parse
-    query_parts = []
-    for key, value in sorted(views_params.items()):
-        if value is not None:
-            query_parts.append(f"{key}={urllib.parse.quote(str(value))}")
-    query_string = "&".join(query_parts)
-    logging.debug(f"API Request: GET /api/views/?{query_string}")
-    
-    whitelist = get_api_whitelist()
+    # Tenant names for all views come from one tenants query, fetched alongside the views
+    tenants_future = _api_executor.submit(
+        call_vast_api,
+        client=client,
+        endpoint='tenants',
+        method='get',
+        params={'page_size': REST_PAGE_SIZE, 'fields': 'id,name'},
+        whitelist=whitelist
+    )
     all_views_list = call_vast_api(
         client=client,
         endpoint='views',
@@ -895,55 +1097,70 @@ def list_view_instances(cluster: str, tenant: str = None, name: str = None, path
     else:
         views = []
     
-    # Get tenant information for each view
-    all_tenants = {}
-    if views:
-        tenant_ids = set(v.get('tenant_id') for v in views if v.get('tenant_id'))
-        for tid in tenant_ids:
-            tenant_name = get_name_by_id(client, 'tenants', tid)
-            if tenant_name:
-                all_tenants[tid] = tenant_name
+    # Get tenant information for each view (views are still listed if tenant names cannot be read)
+    try:
+        all_tenants = {t['id']: t['name'] for t in tenants_future.result() if t.get('name')}
+    except ValueError:
+        # Re-raise ValueError (whitelist validation errors)
+        raise
+    except Exception as e:
+        logging.error(f"Error retrieving tenant names on {cluster_address}. Error: {e}")
+        all_tenants = {}
+    
+    # Filter matchers (each pattern compiled once; None when the filter is not given)
+    tenant_match = _compile_glob(tenant) if tenant else None
+    name_match = _compile_glob(name) if name else None
+    path_match = _compile_glob(path) if path else None
     
-    # Build result list with filtering
+    # Build result list with filtering - each view field is read once
+    tenant_name_of = all_tenants.get
     result = []
+    append_row = result.append
     for view in views:
-        view_tenant_id = view.get('tenant_id')
-        view_tenant = all_tenants.get(view_tenant_id, '')
-        view_name = view.get('name', '')
-        view_path = view.get('path', '')
+        view_get = view.get
+        view_tenant = tenant_name_of(view_get('tenant_id'), '')
+        view_name = view_get('name', '')
+        view_path = view_get('path', '')
         
         # Apply filters
-        if tenant and not fnmatch.fnmatch(view_tenant, tenant):
+        if tenant_match and not tenant_match(view_tenant):
             continue
-        if name and not fnmatch.fnmatch(view_name, name):
+        if name_match and not name_match(view_name):
             continue
-        if path and not fnmatch.fnmatch(view_path, path):
+        if path_match and not path_match(view_path):
             continue
         
-        # Extract protocols
-        protocols = []
-        if view.get('protocols'):
-            if 'NFS' in view.get('protocols', []):
-                protocols.append('NFS')
-            if 'SMB' in view.get('protocols', []):
-                protocols.append('SMB')
-            if 'S3' in view.get('protocols', []):
-                protocols.append('S3')
-        
-        # Check if bucket is configured
-        has_bucket = bool(view.get('bucket'))
-        
-        result.append({
+        append_row({
             'tenant': view_tenant,
             'name': view_name,
             'path': view_path,
-            'protocols': protocols,
-            'has_bucket': has_bucket
+            'protocols': _reported_view_protocols(view_get('protocols')),
+            'has_bucket': bool(view_get('bucket'))  # Check if bucket is configured
         })
     
     return result
 
 
+def _file_mtime(path: Optional[str]) -> Optional[int]:
+    """Return a file's modification time in nanoseconds, or None if it does not exist."""
+    try:
+        return os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
+def _load_template_parser(template_path: str, default_template_path: Optional[str], mtimes: Tuple) -> TemplateParser:
+    """Build a TemplateParser; mtimes is only part of the cache key."""
+    return TemplateParser(template_path, default_template_path=default_template_path)
+
+
+def _get_template_parser(template_path: str, default_template_path: Optional[str]) -> TemplateParser:
+    """Get a (read-only) TemplateParser for the template files, reparsed only after either file changes."""
+    mtimes = (_file_mtime(template_path), _file_mtime(default_template_path))
+    return _load_template_parser(template_path, default_template_path, mtimes)
+
+
 def list_fields(command_name: str) -> Dict:
     """
     Get available fields for a command with metadata.
@@ -970,12 +1187,12 @@ def list_fields(command_name: str) -> Dict:
         - Get fields for views: list_fields("views")
         - Get fields for tenants: list_fields("tenants")
     """
-    template_path = TEMPLATE_MODIFICATIONS_FILE
+    template_path = get_template_modifications_file()
     default_template_path = get_default_template_path()
     if not template_path or (not Path(template_path).exists() and not default_template_path):
         raise ValueError(f"Template modifications file not found: {template_path}")
     
-    parser = TemplateParser(template_path, default_template_path=default_template_path)
+    parser = _get_template_parser(template_path, default_template_path)
     
     # Check if command exists
     if command_name not in parser.get_command_names():
@@ -1035,6 +1252,74 @@ def list_fields(command_name: str) -> Dict:
     }
 
 
+# describe_tool examples and accepted formats: (examples, accepted_formats)
+# Template (dynamic) tool arguments, by argument type
+_TEMPLATE_ARG_EXAMPLES = {
+    'str': (('value', '*value*', 'value*'),
+            ('exact match', 'wildcard: *value*', 'starts with: value*', 'ends with: *value')),
+    'int': (('100', '>100', '>=100', '<100', '<=100'),
+            ('exact: 100', 'greater: >100', 'greater or equal: >=100', 'less: <100', 'less or equal: <=100')),
+    'capacity': (('1TB', '>500GB', '>=1M', '<100KB'),
+                 ('exact: 1TB', 'greater: >1TB', 'greater or equal: >=500GB', 'less: <100KB', 'less or equal: <=1M')),
+    'bool': (('true', 'false', 'True', 'False', '1', '0'),
+             ('boolean: true/false', 'case-insensitive', 'numeric: 1/0')),
+}
+_CLUSTER_EXAMPLES = (('vast3115-var', 'cluster1'), ('cluster address or name',))
+_TENANT_EXAMPLES = (('default', 'tenant1'), ('tenant name (defaults to "default")',))
+_PATH_EXAMPLES = (('/nfs/myshare', '/s3/mybucket'), ('absolute path starting with /',))
+_SIZE_EXAMPLES = (('10GB', '1TB', '500GB'), ('size with unit: B, KB, MB, GB, TB, PB',))
+# Create tool parameters, by parameter name (falling back to the parameter type)
+_CREATE_PARAM_EXAMPLES = {
+    'cluster': _CLUSTER_EXAMPLES,
+    'tenant': _TENANT_EXAMPLES,
+    'source_tenant': _TENANT_EXAMPLES,
+    'path': _PATH_EXAMPLES,
+    'source_path': _PATH_EXAMPLES,
+    'destination_path': _PATH_EXAMPLES,
+    'hard_quota': _SIZE_EXAMPLES,
+    'hard_limit': _SIZE_EXAMPLES,
+    'soft_limit': _SIZE_EXAMPLES,
+    'expiry_time': (('2d', '3w', '1d6h', '30m'), ('duration: d (days), h (hours), m (minutes), w (weeks)',)),
+    'protocols': (('NFS', 'NFS,S3', 'S3,SMB'), ('comma-separated list: NFS, S3, SMB, ENDPOINT',)),
+}
+_CREATE_TYPE_EXAMPLES = {
+    'bool': (('true', 'false'), ('boolean: true/false',)),
+}
+
+@functools.lru_cache(maxsize=64)
+def _get_signature_and_doc(func) -> Tuple[inspect.Signature, str]:
+    """Return a tool function's signature and docstring (cached - tool functions don't change)."""
+    return inspect.signature(func), inspect.getdoc(func) or ""
+
+
+_DOC_ARG_LINE_RE = re.compile(r'(\w+)(?::| \()')
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_docstring_args(doc: str) -> Dict[str, str]:
+    """Map parameter names to their descriptions from a docstring's Args section (cached, read-only).
+    
+    Accepts "name: desc" and "name (type): desc" lines, or a bare "name" line
+    followed by its description. The first non-empty description of a name wins.
+    """
+    param_docs = {}
+    if 'Args:' not in doc:
+        return param_docs
+    lines = doc.split('Args:', 1)[1].split('Returns:', 1)[0].split('\n')
+    for i, line in enumerate(lines):
+        line_stripped = line.strip()
+        match = _DOC_ARG_LINE_RE.match(line_stripped)
+        if match and ':' in line_stripped:
+            desc = line_stripped.split(':', 1)[1].strip()
+            if desc:
+                param_docs.setdefault(match.group(1), desc)
+        elif line_stripped.isidentifier() and i + 1 < len(lines):
+            next_line = lines[i + 1].strip()
+            if next_line and not next_line.startswith(line_stripped):
+                param_docs.setdefault(line_stripped, next_line)
+    return param_docs
+
+
 def describe_tool(tool_name: str) -> Dict:
     """
     Get tool schema with examples and accepted formats.
@@ -1067,6 +1352,14 @@ def describe_tool(tool_name: str) -> Dict:
         - Describe performance tool: describe_tool("list_performance_vast")
         - Describe create view tool: describe_tool("create_view_vast")
     """
+    # The description only depends on the tool and the template files - cached per template version
+    mtimes = (_file_mtime(get_template_modifications_file()), _file_mtime(get_default_template_path()))
+    return copy.deepcopy(_describe_tool_cached(tool_name, mtimes))
+
+
+@functools.lru_cache(maxsize=32)
+def _describe_tool_cached(tool_name: str, mtimes: Tuple) -> Dict:
+    """Build describe_tool's result; mtimes (of the template files) is only part of the cache key."""
     # Map tool names to their implementations
     tool_mappings = {
         'list_views_vast': {
@@ -1149,12 +1442,12 @@ def describe_tool(tool_name: str) -> Dict:
     if tool_info['type'] == 'dynamic':
         # Handle dynamic tools (from YAML templates)
         command_name = tool_info['command']
-        template_path = TEMPLATE_MODIFICATIONS_FILE
+        template_path = get_template_modifications_file()
         default_template_path = get_default_template_path()
         if not template_path or (not Path(template_path).exists() and not default_template_path):
             raise ValueError(f"Template file not found: {template_path}")
         
-        parser = TemplateParser(template_path, default_template_path=default_template_path)
+        parser = _get_template_parser(template_path, default_template_path)
         template = parser.get_command_template(command_name)
         if not template:
             raise ValueError(f"Command '{command_name}' not found in template")
@@ -1176,22 +1469,9 @@ def describe_tool(tool_name: str) -> Dict:
             }
             
             # Add examples based on type
-            arg_type = arg.get('type', 'str')
-            if arg_type == 'str':
-                arg_dict['examples'] = ['value', '*value*', 'value*']
-                arg_dict['accepted_formats'] = ['exact match', 'wildcard: *value*', 'starts with: value*', 'ends with: *value']
-            elif arg_type == 'int':
-                arg_dict['examples'] = ['100', '>100', '>=100', '<100', '<=100']
-                arg_dict['accepted_formats'] = ['exact: 100', 'greater: >100', 'greater or equal: >=100', 'less: <100', 'less or equal: <=100']
-            elif arg_type == 'capacity':
-                arg_dict['examples'] = ['1TB', '>500GB', '>=1M', '<100KB']
-                arg_dict['accepted_formats'] = ['exact: 1TB', 'greater: >1TB', 'greater or equal: >=500GB', 'less: <100KB', 'less or equal: <=1M']
-            elif arg_type == 'bool':
-                arg_dict['examples'] = ['true', 'false', 'True', 'False', '1', '0']
-                arg_dict['accepted_formats'] = ['boolean: true/false', 'case-insensitive', 'numeric: 1/0']
-            else:
-                arg_dict['examples'] = []
-                arg_dict['accepted_formats'] = []
+            examples, accepted_formats = _TEMPLATE_ARG_EXAMPLES.get(arg.get('type', 'str'), ((), ()))
+            arg_dict['examples'] = list(examples)
+            arg_dict['accepted_formats'] = list(accepted_formats)
             
             arguments.append(arg_dict)
         
@@ -1230,14 +1510,13 @@ def describe_tool(tool_name: str) -> Dict:
     elif tool_info['type'] == 'create':
         # Handle create tools (use introspection similar to static tools but with better parsing)
         func = tool_info['function']
-        import inspect
-        sig = inspect.signature(func)
-        doc = inspect.getdoc(func) or ""
+        sig, doc = _get_signature_and_doc(func)
         
         # Parse docstring for description
         description = doc.split('\n\n')[0] if doc else f"Tool: {tool_name}"
         
-        # Build arguments from function signature
+        # Build arguments from function signature (docstring Args parsed once for all of them)
+        param_docs = _parse_docstring_args(doc)
         arguments = []
         for param_name, param in sig.parameters.items():
             if param_name == 'mcp' or param_name == 'view_template_file':  # Skip internal parameters
@@ -1273,52 +1552,14 @@ def describe_tool(tool_name: str) -> Dict:
                 'accepted_formats': []
             }
             
-            # Try to extract description from docstring
-            if doc:
-                # Look for Args section
-                if 'Args:' in doc:
-                    args_section = doc.split('Args:')[1].split('Returns:')[0] if 'Returns:' in doc else doc.split('Args:')[1]
-                    # Split by lines and look for the parameter
-                    lines = args_section.split('\n')
-                    for i, line in enumerate(lines):
-                        line_stripped = line.strip()
-                        # Match parameter name at start of line (with possible indentation)
-                        if line_stripped.startswith(param_name + ':') or line_stripped.startswith(param_name + ' ('):
-                            # Extract description after colon
-                            if ':' in line_stripped:
-                                desc = line_stripped.split(':', 1)[1].strip()
-                                if desc:
-                                    arg_dict['description'] = desc
-                                    break
-                        # Also check if this line contains just the param name and next line has description
-                        elif line_stripped == param_name and i + 1 < len(lines):
-                            next_line = lines[i + 1].strip()
-                            if next_line and not next_line.startswith(param_name):
-                                arg_dict['description'] = next_line
-                                break
+            # Description from the docstring's Args section
+            arg_dict['description'] = param_docs.get(param_name, '')
             
-            # Add examples based on parameter name and type
-            if param_name == 'cluster':
-                arg_dict['examples'] = ['vast3115-var', 'cluster1']
-                arg_dict['accepted_formats'] = ['cluster address or name']
-            elif param_name == 'tenant' or param_name == 'source_tenant':
-                arg_dict['examples'] = ['default', 'tenant1']
-                arg_dict['accepted_formats'] = ['tenant name (defaults to "default")']
-            elif param_name == 'path' or param_name == 'source_path' or param_name == 'destination_path':
-                arg_dict['examples'] = ['/nfs/myshare', '/s3/mybucket']
-                arg_dict['accepted_formats'] = ['absolute path starting with /']
-            elif param_name == 'hard_quota' or param_name == 'hard_limit' or param_name == 'soft_limit':
-                arg_dict['examples'] = ['10GB', '1TB', '500GB']
-                arg_dict['accepted_formats'] = ['size with unit: B, KB, MB, GB, TB, PB']
-            elif param_name == 'expiry_time':
-                arg_dict['examples'] = ['2d', '3w', '1d6h', '30m']
-                arg_dict['accepted_formats'] = ['duration: d (days), h (hours), m (minutes), w (weeks)']
-            elif param_name == 'protocols':
-                arg_dict['examples'] = ['NFS', 'NFS,S3', 'S3,SMB']
-                arg_dict['accepted_formats'] = ['comma-separated list: NFS, S3, SMB, ENDPOINT']
-            elif param_type == 'bool':
-                arg_dict['examples'] = ['true', 'false']
-                arg_dict['accepted_formats'] = ['boolean: true/false']
+            # Add examples based on parameter name, then type
+            param_examples = _CREATE_PARAM_EXAMPLES.get(param_name) or _CREATE_TYPE_EXAMPLES.get(param_type)
+            if param_examples:
+                arg_dict['examples'] = list(param_examples[0])
+                arg_dict['accepted_formats'] = list(param_examples[1])
             
             arguments.append(arg_dict)
         
@@ -1364,14 +1605,13 @@ def describe_tool(tool_name: str) -> Dict:
     else:
         # Handle static tools
         func = tool_info['function']
-        import inspect
-        sig = inspect.signature(func)
-        doc = inspect.getdoc(func) or ""
+        sig, doc = _get_signature_and_doc(func)
         
         # Parse docstring for description
         description = doc.split('\n\n')[0] if doc else f"Tool: {tool_name}"
         
-        # Build arguments from function signature
+        # Build arguments from function signature (docstring Args parsed once for all of them)
+        param_docs = _parse_docstring_args(doc)
         arguments = []
         for param_name, param in sig.parameters.items():
             if param_name == 'mcp':  # Skip internal mcp parameter
@@ -1399,15 +1639,8 @@ def describe_tool(tool_name: str) -> Dict:
                 'accepted_formats': []
             }
             
-            # Try to extract description from docstring
-            if doc:
-                # Look for Args section
-                if 'Args:' in doc:
-                    args_section = doc.split('Args:')[1].split('Returns:')[0] if 'Returns:' in doc else doc.split('Args:')[1]
-                    for line in args_section.split('\n'):
-                        if param_name in line and ':' in line:
-                            arg_dict['description'] = line.split(':', 1)[1].strip()
-                            break
+            # Description from the docstring's Args section
+            arg_dict['description'] = param_docs.get(param_name, '')
             
             arguments.append(arg_dict)
         
@@ -1429,7 +1662,7 @@ def describe_tool(tool_name: str) -> Dict:
     }
 
 
-def list_performance(object_name: str, cluster: str, timeframe: str = "5m", instances: str = None):
+def list_performance(object_name: str, cluster: str, timeframe: str = "5m", instances: str = None, refresh: bool = False):
     """
     List performance metrics for cluster objects using ad_hoc_query API.
     
@@ -1450,6 +1683,9 @@ def list_performance(object_name: str, cluster: str, timeframe: str = "5m", inst
                      Use view name, NOT view path. Example: "tenant1:view1,tenant2:view2".
                    - Leave empty to get metrics for all instances of the object type.
                    - If object_name is "view" and you want specific views, instances is REQUIRED in "tenant:view_name" format.
+        refresh: Query the cluster even if the same request was answered recently (results are cached
+                 briefly, from 10 seconds for short timeframes up to an hour for day-granularity ones).
+                 The cached instance names used for the rows are reloaded as well.
         
     Returns:
         Dict where each key is the instance name which contains a list of performance metrics.
@@ -1504,19 +1740,33 @@ def list_performance(object_name: str, cluster: str, timeframe: str = "5m", inst
             f"Use list_view_instances_vast() to discover available instances."
         )
     
+    # Repeated questions within the same time bucket are answered from cache (views use seconds resolution)
+    cache_granularity = 'seconds' if object_name_lower == 'view' else _get_granularity(timeframe_in_seconds)
+    # One cache per granularity - CacheManager keeps a single TTL per cache name
+    cache_name = f"performance:{cache_granularity}"
+    cache_key = f"{cluster_address}|{object_name_lower}|{timeframe}|{instances or ''}"
+    cached_table = None if refresh else _cache_manager.get(cache_name, cache_key)
+    if cached_table is not None:
+        return copy.deepcopy(cached_table)
+    
     # Create client
     client = create_vast_client(cluster_address)
     
+    # The name-resolution instances and the metrics map are independent lookups - fetch them
+    # alongside the instance ID resolution (which fans out on the pool itself, so it stays here)
+    all_instances_future = _api_executor.submit(_get_all_instances, client, object_name_lower, cluster_address, refresh)
+    metrics_map_future = _api_executor.submit(_build_metrics_map, client, cluster_address)
+    
     # Get instance IDs if specified
     instance_ids = _get_instance_ids(client, object_name_lower, instances, default_tenant) if instances else []
     
     # Get all instances for name resolution
-    all_instances = _get_all_instances(client, object_name_lower)
+    all_instances = all_instances_future.result()
     
     logging.info(f"Preparing to retrieve performance metrics for object: {object_name}, instances: {instances if instances else 'ALL'}, timeframe: {timeframe} on cluster: {cluster_address}")
     
     # Build metrics map dynamically
-    metrics_map = _build_metrics_map(client)
+    metrics_map = metrics_map_future.result()
     
     if object_name_lower not in metrics_map:
         raise ValueError(f"Object type '{object_name}' not recognized. Can be only one of: {', '.join(metrics_map.keys())}")
@@ -1539,50 +1789,25 @@ def list_performance(object_name: str, cluster: str, timeframe: str = "5m", inst
         
         # Query performance metrics using ad_hoc_query API
         whitelist = get_api_whitelist()
-        if object_name_lower == 'view':
-            metrics_list = call_vast_api(
-                client=client,
-                endpoint='monitors.ad_hoc_query',
-                method='get',
-                params={
-                    'object_type': object_name_lower,
-                    'time_frame': timeframe,
-                    'prop_list': prop_list,
-                    'object_ids': instance_ids if instance_ids else []
-                },
-                whitelist=whitelist
-            )
-            # monitors.ad_hoc_query returns a single dict, not a list
-            # Extract from list if it was wrapped
-            if isinstance(metrics_list, list) and len(metrics_list) == 1 and isinstance(metrics_list[0], dict):
-                metrics = metrics_list[0]
-            elif isinstance(metrics_list, dict):
-                metrics = metrics_list
-            else:
-                metrics = {}
-        else:
-            metrics_list = call_vast_api(
-                client=client,
-                endpoint='monitors.ad_hoc_query',
-                method='get',
-                params={
-                    'object_type': object_name_lower,
-                    'time_frame': timeframe,
-                    'prop_list': prop_list,
-                    'granularity': granularity,
-                    'aggregation': PERFORMANCE_AGGREGATION_FUNCTION,
-                    'object_ids': instance_ids if instance_ids else []
-                },
-                whitelist=whitelist
-            )
-            # monitors.ad_hoc_query returns a single dict, not a list
-            # Extract from list if it was wrapped
-            if isinstance(metrics_list, list) and len(metrics_list) == 1 and isinstance(metrics_list[0], dict):
-                metrics = metrics_list[0]
-            elif isinstance(metrics_list, dict):
-                metrics = metrics_list
-            else:
-                metrics = {}
+        params = {
+            'object_type': object_name_lower,
+            'time_frame': timeframe,
+            'prop_list': prop_list,
+        }
+        # Views only support seconds resolution and no aggregation
+        if object_name_lower != 'view':
+            params['granularity'] = granularity
+            params['aggregation'] = PERFORMANCE_AGGREGATION_FUNCTION
+        params['object_ids'] = instance_ids if instance_ids else []
+        metrics_list = call_vast_api(
+            client=client,
+            endpoint='monitors.ad_hoc_query',
+            method='get',
+            params=params,
+            whitelist=whitelist
+        )
+        # monitors.ad_hoc_query returns a single dict, not a list
+        metrics = _unwrap_metrics_response(metrics_list)
         
         # Process the metrics response
         performance_table = _process_performance_data(metrics, metrics_map, object_name_lower, all_instances)
@@ -1590,6 +1815,10 @@ def list_performance(object_name: str, cluster: str, timeframe: str = "5m", inst
         # Format into printable table
         printable_performance_table = _format_performance_table(performance_table, object_name_lower)
         
+        _cache_manager.set(
+            cache_name, cache_key, copy.deepcopy(printable_performance_table),
+            ttl=PERFORMANCE_CACHE_TTL_SECONDS[cache_granularity], maxsize=PERFORMANCE_CACHE_MAXSIZE
+        )
         return printable_performance_table
         
     except Exception as e:
@@ -1597,6 +1826,19 @@ def list_performance(object_name: str, cluster: str, timeframe: str = "5m", inst
         raise
 
 
+# Read/write direction and metric type of a metric name, in priority order
+_METRIC_LABEL_DIRECTIONS = (
+    (re.compile(r'rd_|(?i:read)'), 'Read'),
+    (re.compile(r'wr_|(?i:write)'), 'Write'),
+)
+_METRIC_LABEL_TYPES = (
+    (re.compile(r'iops', re.IGNORECASE), 'IOPS'),
+    (re.compile(r'bw|bandwidth', re.IGNORECASE), 'Bandwidth'),
+    (re.compile(r'lat', re.IGNORECASE), 'Latency'),
+)
+
+
+@functools.lru_cache(maxsize=1024)
 def _extract_metric_label(prop_string: str) -> str:
     """Extract a readable label from a prop_list string.
     
@@ -1627,22 +1869,11 @@ def _extract_metric_label(prop_string: str) -> str:
     # Build readable label
     if proto_name and metric_name:
         # Extract read/write and metric type from metric_name
-        if 'rd_' in metric_name or 'read' in metric_name.lower():
-            direction = 'Read'
-        elif 'wr_' in metric_name or 'write' in metric_name.lower():
-            direction = 'Write'
-        else:
-            direction = ''
-        
-        # Extract metric type
-        if 'iops' in metric_name.lower():
-            metric_type = 'IOPS'
-        elif 'bw' in metric_name.lower() or 'bandwidth' in metric_name.lower():
-            metric_type = 'Bandwidth'
-        elif 'latency' in metric_name.lower() or 'lat' in metric_name.lower():
-            metric_type = 'Latency'
-        else:
-            metric_type = metric_name.replace('_', ' ').title()
+        direction = next((label for pattern, label in _METRIC_LABEL_DIRECTIONS if pattern.search(metric_name)), '')
+        metric_type = next(
+            (label for pattern, label in _METRIC_LABEL_TYPES if pattern.search(metric_name)),
+            None
+        ) or metric_name.replace('_', ' ').title()
         
         if direction:
             return f"{proto_name} {direction} {metric_type}"
@@ -1656,6 +1887,82 @@ def _extract_metric_label(prop_string: str) -> str:
         return prop_string.split(',')[-1].replace('_', ' ').title()
 
 
+@functools.lru_cache(maxsize=1024)
+def _detect_unit_type(prop_string: str) -> Tuple[str, str]:
+    """Detect unit type and label from prop string.
+    
+    Returns:
+        Tuple of (unit_type, y_label) where unit_type is 'iops', 'bw', 'latency', or 'unknown'
+    """
+    prop_lower = prop_string.lower()
+    if 'iops' in prop_lower:
+        return ('iops', 'IOPS')
+    elif 'bw' in prop_lower or 'bandwidth' in prop_lower:
+        return ('bw', 'MB/s')
+    elif 'latency' in prop_lower or 'lat' in prop_lower:
+        return ('latency', 'ms')
+    else:
+        return ('unknown', 'Value')
+
+
+def _graph_data_matrix(data_points: List[List], min_width: int = 2) -> np.ndarray:
+    """Convert monitor data rows [timestamp, object_id, metric values...] to a float matrix.
+    
+    Missing, None or non-numeric cells become NaN, and short rows are padded with NaN
+    up to the longest row or min_width columns (e.g. the length of the response prop_list).
+    The timestamp column is not needed for statistics and is left as NaN.
+    """
+    width = max(min_width, 2, max(len(row) for row in data_points))
+    data_matrix = np.full((len(data_points), width), np.nan)
+    try:
+        rows = np.array(data_points, dtype=object)
+        if rows.ndim == 2:
+            cells = rows[:, 1:]
+            cells[np.equal(cells, None)] = np.nan  # missing values are common - keep them on the bulk path
+            data_matrix[:, 1:rows.shape[1]] = cells.astype(np.float64)
+            return data_matrix
+    except (ValueError, TypeError):
+        pass
+    # Ragged rows or non-numeric cells - convert cell by cell
+    for i, row in enumerate(data_points):
+        for j in range(1, len(row)):
+            try:
+                data_matrix[i, j] = float(row[j])
+            except (ValueError, TypeError):
+                continue
+    return data_matrix
+
+
+def _build_prop_to_index(prop_list_response: List[str], monitor_prop_list: List[str]) -> Dict[str, int]:
+    """Map monitor prop_list items to their indices in a monitor query response prop_list.
+    
+    Each response prop goes to the first still unmatched monitor prop that equals it, has the
+    same last part (the actual metric name), or contains or is contained in the other.
+    
+    Args:
+        prop_list_response: Response prop_list: [timestamp, object_id, metric1, metric2, ...]
+        monitor_prop_list: The monitor's prop_list items
+        
+    Returns:
+        Dictionary mapping monitor prop_list items to their index in prop_list_response
+    """
+    prop_to_index = {}
+    # Unmatched monitor props with their last part, in monitor order - matched ones are removed
+    # so the usual same-order response matches the first pending item right away
+    pending = [(monitor_prop, monitor_prop.split(',')[-1]) for monitor_prop in dict.fromkeys(monitor_prop_list)]
+    for i, prop_name in enumerate(prop_list_response[2:], start=2):  # Skip timestamp (0) and object_id (1)
+        if not pending:
+            break
+        prop_last = prop_name.split(',')[-1]
+        for position, (monitor_prop, monitor_last) in enumerate(pending):
+            if (prop_name == monitor_prop or monitor_last == prop_last
+                    or monitor_last in prop_name or prop_last in monitor_prop):
+                prop_to_index[monitor_prop] = i
+                del pending[position]
+                break
+    return prop_to_index
+
+
 def _process_performance_graph_stats(
     data_points: List[List],
     prop_list_response: List[str],
@@ -1678,122 +1985,60 @@ def _process_performance_graph_stats(
         - summary: Aggregated statistics across all instances (always present)
     """
     # Map monitor_prop_list items to their indices in prop_list_response
-    # prop_list_response format: [timestamp, object_id, metric1, metric2, ...]
-    prop_to_index = {}  # monitor_prop_item -> index in prop_list_response
-    
-    for i, prop_name in enumerate(prop_list_response[2:], start=2):  # Skip timestamp (0) and object_id (1)
-        # Try to match prop_name with items in monitor_prop_list
-        for monitor_prop in monitor_prop_list:
-            if monitor_prop in prop_to_index:
-                continue  # Already matched
-            # Try exact match first
-            if prop_name == monitor_prop:
-                prop_to_index[monitor_prop] = i
-                break
-            # Try matching by the last part (metric name)
-            monitor_prop_parts = monitor_prop.split(',')
-            prop_name_parts = prop_name.split(',')
-            if len(monitor_prop_parts) > 0 and len(prop_name_parts) > 0:
-                # Match by last part (the actual metric name)
-                if monitor_prop_parts[-1] == prop_name_parts[-1]:
-                    prop_to_index[monitor_prop] = i
-                    break
-                # Or check if one contains the other
-                if monitor_prop_parts[-1] in prop_name or prop_name_parts[-1] in monitor_prop:
-                    prop_to_index[monitor_prop] = i
-                    break
+    prop_to_index = _build_prop_to_index(prop_list_response, monitor_prop_list)
     
     if not prop_to_index:
         logging.warning(f"Could not match monitor prop_list items to API response. Monitor props: {monitor_prop_list}, API props: {prop_list_response[2:]}")
         return {"summary": {"metrics": []}}
     
-    # Determine unit type for each prop_list item
-    def _detect_unit_type(prop_string: str) -> str:
-        """Detect unit type from prop string."""
-        prop_lower = prop_string.lower()
-        if 'iops' in prop_lower:
-            return 'iops'
-        elif 'bw' in prop_lower or 'bandwidth' in prop_lower:
-            return 'bw'
-        elif 'latency' in prop_lower or 'lat' in prop_lower:
-            return 'latency'
-        else:
-            return 'unknown'
-    
-    # Convert data_points to numpy array for easier processing
     if not data_points:
         return {"summary": {"metrics": []}}
     
-    # Determine if we have multiple distinct instances
-    unique_object_ids = set()
-    for dp in data_points:
-        if len(dp) > 1:
-            try:
-                unique_object_ids.add(int(dp[1]))  # object_id is at index 1
-            except (ValueError, TypeError):
-                continue
+    # Convert all rows to one float matrix once; missing or non-numeric cells become NaN
+    data_matrix = _graph_data_matrix(data_points, len(prop_list_response))
+    metric_props = [(monitor_prop, prop_to_index[monitor_prop]) for monitor_prop in monitor_prop_list if monitor_prop in prop_to_index]
+    
+    def _metric_stats(monitor_prop: str, values_array: np.ndarray) -> Optional[Dict[str, Any]]:
+        # Filter out NaN and Inf values (a fresh copy, so it may be partitioned in place)
+        values_array = values_array[np.isfinite(values_array)]
+        if len(values_array) == 0:
+            return None
+        avg = float(np.mean(values_array))  # before partitioning reorders the values
+        p95, max_value = _partition_p95_max(values_array)
+        return {
+            "metric_name": _extract_metric_label(monitor_prop),
+            "prop": monitor_prop,
+            "avg": avg,
+            "p95": float(p95),
+            "max": float(max_value),
+            "unit": _detect_unit_type(monitor_prop)[0]
+        }
+    
+    # Rows with a usable object_id (index 1), grouped by object_id in one stable sort
+    # so each instance's rows are one contiguous slice, still in data order
+    object_id_column = data_matrix[:, 1]
+    rows_with_id = np.flatnonzero(np.isfinite(object_id_column))
+    rows_by_id = rows_with_id[np.argsort(object_id_column[rows_with_id].astype(np.int64), kind='stable')]
+    ids_sorted = object_id_column[rows_by_id].astype(np.int64)
+    group_starts = np.flatnonzero(np.diff(ids_sorted, prepend=ids_sorted[:1] - 1))
+    group_ends = np.append(group_starts[1:], len(ids_sorted))
     
     # Process per-instance statistics (only if multiple distinct instances exist)
     instances_stats = []
-    instances_specified = len(unique_object_ids) > 1
+    instances_specified = len(group_starts) > 1
     
     if instances_specified:
-        for object_id in unique_object_ids:
+        instance_matrix = data_matrix[rows_by_id]
+        for group_start, group_end in zip(group_starts, group_ends):
+            object_id = int(ids_sorted[group_start])
             instance_name = instance_data.get(object_id, f"Unknown-{object_id}")
-            # Filter data points for this specific object_id
-            instance_data_points = []
-            for d in data_points:
-                if len(d) > 1:
-                    try:
-                        if int(d[1]) == object_id:
-                            instance_data_points.append(d)
-                    except (ValueError, TypeError):
-                        continue
-            
-            if not instance_data_points:
-                continue
+            instance_rows = instance_matrix[group_start:group_end]
             
             instance_metrics = []
-            
-            for monitor_prop in monitor_prop_list:
-                if monitor_prop not in prop_to_index:
-                    continue
-                
-                prop_index = prop_to_index[monitor_prop]
-                # Extract values for this prop across all data points for this instance
-                values = []
-                for dp in instance_data_points:
-                    if len(dp) > prop_index:
-                        try:
-                            val = float(dp[prop_index])
-                            if not np.isnan(val):
-                                values.append(val)
-                        except (ValueError, TypeError):
-                            continue
-                
-                if not values:
-                    continue
-                
-                values_array = np.array(values, dtype=np.float64)
-                # Filter out NaN and Inf values
-                values_array = values_array[np.isfinite(values_array)]
-                
-                if len(values_array) == 0:
-                    continue
-                
-                metric_name = _extract_metric_label(monitor_prop)
-                unit = _detect_unit_type(monitor_prop)
-                
-                # Calculate statistics
-                stats = {
-                    "metric_name": metric_name,
-                    "prop": monitor_prop,
-                    "avg": float(np.mean(values_array)),
-                    "p95": float(np.percentile(values_array, 95)),
-                    "max": float(np.max(values_array)),
-                    "unit": unit
-                }
-                instance_metrics.append(stats)
+            for monitor_prop, prop_index in metric_props:
+                stats = _metric_stats(monitor_prop, instance_rows[:, prop_index])
+                if stats:
+                    instance_metrics.append(stats)
             
             if instance_metrics:
                 instances_stats.append({
@@ -1803,46 +2048,10 @@ def _process_performance_graph_stats(
     
     # Calculate summary statistics (aggregate across all instances)
     summary_metrics = []
-    
-    for monitor_prop in monitor_prop_list:
-        if monitor_prop not in prop_to_index:
-            continue
-        
-        prop_index = prop_to_index[monitor_prop]
-        # Extract values for this prop across ALL data points (all instances)
-        values = []
-        for dp in data_points:
-            if len(dp) > prop_index:
-                try:
-                    val = float(dp[prop_index])
-                    if not np.isnan(val):
-                        values.append(val)
-                except (ValueError, TypeError):
-                    continue
-        
-        if not values:
-            continue
-        
-        values_array = np.array(values, dtype=np.float64)
-        # Filter out NaN and Inf values
-        values_array = values_array[np.isfinite(values_array)]
-        
-        if len(values_array) == 0:
-            continue
-        
-        metric_name = _extract_metric_label(monitor_prop)
-        unit = _detect_unit_type(monitor_prop)
-        
-        # Calculate statistics
-        stats = {
-            "metric_name": metric_name,
-            "prop": monitor_prop,
-            "avg": float(np.mean(values_array)),
-            "p95": float(np.percentile(values_array, 95)),
-            "max": float(np.max(values_array)),
-            "unit": unit
-        }
-        summary_metrics.append(stats)
+    for monitor_prop, prop_index in metric_props:
+        stats = _metric_stats(monitor_prop, data_matrix[:, prop_index])
+        if stats:
+            summary_metrics.append(stats)
     
     result = {
         "summary": {
@@ -1857,6 +2066,52 @@ def _process_performance_graph_stats(
     return result
 
 
+def _parse_graph_timestamp(ts: Any) -> Optional[datetime]:
+    """Convert a monitor data timestamp to a timezone-aware datetime.
+    
+    Args:
+        ts: ISO 8601 string (e.g., "2025-12-25T11:45:12Z") or epoch seconds/milliseconds
+        
+    Returns:
+        Datetime (UTC if the timestamp has no timezone), or None if it cannot be parsed
+    """
+    try:
+        # Handle ISO 8601 format strings (e.g., "2025-12-25T11:45:12Z")
+        if isinstance(ts, str):
+            if 'T' in ts or 'Z' in ts or '+' in ts or ts.count('-') >= 2:
+                ts_clean = ts.replace('Z', '+00:00')
+                if '+' not in ts_clean and ts_clean.count(':') >= 2:
+                    if ts_clean.endswith(':'):
+                        ts_clean = ts_clean.rstrip(':')
+                    if not ('+' in ts_clean or ts_clean.count('-') > 2):
+                        ts_clean = ts_clean + '+00:00'
+                try:
+                    dt = datetime.fromisoformat(ts_clean)
+                except ValueError:
+                    match = re.match(r'(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})', ts)
+                    if not match:
+                        return None
+                    date_part, time_part = match.groups()
+                    dt = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M:%S")
+                    dt = dt.replace(tzinfo=timezone.utc)
+            else:
+                ts = float(ts)
+                if ts > 1e10:
+                    ts = ts / 1000.0
+                dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+        elif isinstance(ts, (int, float)):
+            if ts > 1e10:
+                ts = ts / 1000.0
+            dt = datetime.fromtimestamp(ts, tz=timezone.utc)
+        else:
+            return None
+    except (ValueError, TypeError, OSError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
 def _create_performance_graph(
     data_points: List[List],
     prop_list_response: List[str],
@@ -1892,53 +2147,11 @@ def _create_performance_graph(
         raise ImportError("matplotlib is required for graph generation. Install it with: pip install matplotlib>=3.5.0")
     
     # Map monitor_prop_list items to their indices in prop_list_response
-    # prop_list_response format: [timestamp, object_id, metric1, metric2, ...]
-    # We need to find which index in prop_list_response corresponds to each monitor_prop_list item
-    prop_to_index = {}  # monitor_prop_item -> index in prop_list_response
-    
-    for i, prop_name in enumerate(prop_list_response[2:], start=2):  # Skip timestamp (0) and object_id (1)
-        # Try to match prop_name with items in monitor_prop_list
-        for monitor_prop in monitor_prop_list:
-            if monitor_prop in prop_to_index:
-                continue  # Already matched
-            # The prop_name from API might be the full prop string or just the metric part
-            # Try exact match first, then check if prop_name contains the monitor_prop or vice versa
-            if prop_name == monitor_prop:
-                prop_to_index[monitor_prop] = i
-                break
-            # Try matching by the last part (metric name)
-            monitor_prop_parts = monitor_prop.split(',')
-            prop_name_parts = prop_name.split(',')
-            if len(monitor_prop_parts) > 0 and len(prop_name_parts) > 0:
-                # Match by last part (the actual metric name)
-                if monitor_prop_parts[-1] == prop_name_parts[-1]:
-                    prop_to_index[monitor_prop] = i
-                    break
-                # Or check if one contains the other
-                if monitor_prop_parts[-1] in prop_name or prop_name_parts[-1] in monitor_prop:
-                    prop_to_index[monitor_prop] = i
-                    break
+    prop_to_index = _build_prop_to_index(prop_list_response, monitor_prop_list)
     
     if not prop_to_index:
         raise ValueError(f"Could not match monitor prop_list items to API response. Monitor props: {monitor_prop_list}, API props: {prop_list_response[2:]}")
     
-    # Determine unit type for each prop_list item
-    def _detect_unit_type(prop_string: str) -> Tuple[str, str]:
-        """Detect unit type and label from prop string.
-        
-        Returns:
-            Tuple of (unit_type, y_label) where unit_type is 'iops', 'bw', 'latency', or 'unknown'
-        """
-        prop_lower = prop_string.lower()
-        if 'iops' in prop_lower:
-            return ('iops', 'IOPS')
-        elif 'bw' in prop_lower or 'bandwidth' in prop_lower:
-            return ('bw', 'MB/s')
-        elif 'latency' in prop_lower or 'lat' in prop_lower:
-            return ('latency', 'ms')
-        else:
-            return ('unknown', 'Value')
-    
     # Map each prop to its unit type
     prop_units = {}  # monitor_prop -> (unit_type, y_label)
     for monitor_prop in monitor_prop_list:
@@ -1952,28 +2165,31 @@ def _create_performance_graph(
     # Structure: prop_label -> {timestamps: [], values: []}
     plot_data = {}
     
+    # Rows with at least one metric value and a usable object_id
+    usable_points = []
     for data_point in data_points:
         if len(data_point) < 3:
             continue
         
-        timestamp = data_point[0]
+        # A string object_id must be an integer id
         object_id = data_point[1]
-        
-        # Convert object_id to int if it's a string (for dictionary lookup)
         if isinstance(object_id, str):
             try:
-                object_id = int(object_id)
+                int(object_id)
             except (ValueError, TypeError):
                 logging.warning(f"Could not convert object_id to int: {object_id}")
                 continue
+        usable_points.append(data_point)
+    
+    if usable_points:
+        # Convert all metric cells to floats at once; missing or non-numeric cells become NaN
+        data_matrix = _graph_data_matrix(usable_points)
+        timestamps = [data_point[0] for data_point in usable_points]
         
         # Process each prop_list item
         for monitor_prop in monitor_prop_list:
-            if monitor_prop not in prop_to_index:
-                continue
-            
-            idx = prop_to_index[monitor_prop]
-            if idx >= len(data_point):
+            idx = prop_to_index.get(monitor_prop)
+            if idx is None or idx >= data_matrix.shape[1]:
                 continue
             
             # Extract readable label for this prop
@@ -1989,25 +2205,18 @@ def _create_performance_graph(
                     'y_label': y_label
                 }
             
-            # Get the value
-            val = data_point[idx]
-            try:
-                if isinstance(val, str):
-                    val = float(val)
-                elif not isinstance(val, (int, float)):
-                    val = float(val)
-                
-                if not np.isnan(val):
-                    # Convert units based on detected unit type
-                    if unit_type == 'bw' and val > 1000:  # Likely bytes/s, convert to MB/s
-                        val = val / (1024 * 1024)
-                    elif unit_type == 'latency' and val > 1000:  # Likely microseconds, convert to ms
-                        val = val / 1000.0
-                    
-                    plot_data[prop_label]['timestamps'].append(timestamp)
-                    plot_data[prop_label]['values'].append(val)
-            except (ValueError, TypeError):
-                continue
+            values = data_matrix[:, idx]
+            valid_rows = np.flatnonzero(~np.isnan(values))
+            values = values[valid_rows]
+            
+            # Convert units based on detected unit type
+            if unit_type == 'bw':  # Likely bytes/s above 1000, convert to MB/s
+                values = np.where(values > 1000, values / (1024 * 1024), values)
+            elif unit_type == 'latency':  # Likely microseconds above 1000, convert to ms
+                values = np.where(values > 1000, values / 1000.0, values)
+            
+            plot_data[prop_label]['timestamps'].extend(timestamps[row] for row in valid_rows)
+            plot_data[prop_label]['values'].extend(values.tolist())
     
     if not plot_data or all(not data['timestamps'] for data in plot_data.values()):
         raise ValueError(f"No valid data points found for monitor prop_list items")
@@ -2067,6 +2276,8 @@ def _create_performance_graph(
         title = "Performance Graph"
     
     # Convert timestamps to datetime for each prop
+    # The same timestamps repeat for every prop and instance, so each is parsed once
+    parsed_timestamps = {}  # raw timestamp -> datetime (None if unparseable)
     processed_plot_data = {}
     for prop_label, data in plot_data.items():
         if not data['timestamps'] or not data['values']:
@@ -2076,47 +2287,15 @@ def _create_performance_graph(
         values_processed = []
         
         for ts, val in zip(data['timestamps'], data['values']):
-            try:
-                dt = None
-                # Handle ISO 8601 format strings (e.g., "2025-12-25T11:45:12Z")
-                if isinstance(ts, str):
-                    if 'T' in ts or 'Z' in ts or '+' in ts or ts.count('-') >= 2:
-                        ts_clean = ts.replace('Z', '+00:00')
-                        if '+' not in ts_clean and ts_clean.count(':') >= 2:
-                            if ts_clean.endswith(':'):
-                                ts_clean = ts_clean.rstrip(':')
-                            if not ('+' in ts_clean or ts_clean.count('-') > 2):
-                                ts_clean = ts_clean + '+00:00'
-                        try:
-                            dt = datetime.fromisoformat(ts_clean)
-                        except ValueError:
-                            import re
-                            match = re.match(r'(\d{4}-\d{2}-\d{2})T(\d{2}:\d{2}:\d{2})', ts)
-                            if match:
-                                date_part, time_part = match.groups()
-                                dt = datetime.strptime(f"{date_part} {time_part}", "%Y-%m-%d %H:%M:%S")
-                                dt = dt.replace(tzinfo=timezone.utc)
-                            else:
-                                continue
-                    else:
-                        ts = float(ts)
-                        if ts > 1e10:
-                            ts = ts / 1000.0
-                        dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-                elif isinstance(ts, (int, float)):
-                    if ts > 1e10:
-                        ts = ts / 1000.0
-                    dt = datetime.fromtimestamp(ts, tz=timezone.utc)
-                else:
-                    continue
-                
-                if dt:
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    timestamps_dt.append(dt)
-                    values_processed.append(val)
-            except (ValueError, TypeError, OSError):
+            if not isinstance(ts, (str, int, float)):
                 continue
+            if ts in parsed_timestamps:
+                dt = parsed_timestamps[ts]
+            else:
+                dt = parsed_timestamps[ts] = _parse_graph_timestamp(ts)
+            if dt is not None:
+                timestamps_dt.append(dt)
+                values_processed.append(val)
         
         if timestamps_dt:
             processed_plot_data[prop_label] = {
@@ -2390,7 +2569,7 @@ def list_performance_graph(
     
     # Get all instances for name resolution
     if object_type_for_instances:
-        all_instances = _get_all_instances(client, object_type_for_instances.lower())
+        all_instances = _get_all_instances(client, object_type_for_instances.lower(), cluster_address)
     else:
         all_instances = []
     
@@ -2424,12 +2603,7 @@ def list_performance_graph(
         )
         
         # Extract metrics dict
-        if isinstance(metrics_list, list) and len(metrics_list) == 1 and isinstance(metrics_list[0], dict):
-            metrics = metrics_list[0]
-        elif isinstance(metrics_list, dict):
-            metrics = metrics_list
-        else:
-            metrics = {}
+        metrics = _unwrap_metrics_response(metrics_list)
         
         if not (metrics and isinstance(metrics, dict) and 'data' in metrics and 'prop_list' in metrics):
             raise ValueError(f"No performance data available for monitor '{monitor_name}' on cluster {cluster_name}")
@@ -3033,7 +3207,7 @@ def list_dynamic(command_name: str, **kwargs) -> List[Dict]:
     If mcp=True in kwargs, returns debug information about the MCP tool structure.
     """
     default_template_path = get_default_template_path()
-    template_parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+    template_parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
     
     # Check if command exists
     if not template_parser.get_command_template(command_name):
@@ -3049,7 +3223,7 @@ def list_dynamic(command_name: str, **kwargs) -> List[Dict]:
     import os
     
     # Load template file
-    template_path = TEMPLATE_MODIFICATIONS_FILE
+    template_path = get_template_modifications_file()
     default_template_path = get_default_template_path()
     if not os.path.exists(template_path) and not default_template_path:
         raise ValueError(f"Template modifications file not found: {template_path}")
@@ -3170,7 +3344,7 @@ def list_merged(command_name: str, **kwargs) -> List[Dict]:
     If mcp=True in kwargs, returns debug information about the MCP tool structure.
     """
     default_template_path = get_default_template_path()
-    template_parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+    template_parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
     
     # Check if merged command exists
     merged_template = template_parser.get_merged_command_template(command_name)
@@ -32,7 +32,7 @@ from .functions import (
     list_clusters, list_performance, list_performance_graph, list_monitors, list_dynamic, list_view_instances, list_fields, describe_tool, query_users,
     list_dataflow
 )
-from .config import TEMPLATE_MODIFICATIONS_FILE, get_default_template_path, DATAFLOW_DEFAULT_TOP_N_DIAGRAM
+from .config import get_template_modifications_file, get_default_template_path, DATAFLOW_DEFAULT_TOP_N_DIAGRAM
 from .template_parser import TemplateParser
 
 # Import create functions (only used when read_write=True)
@@ -267,7 +267,8 @@ def start_mcp(
         object_name: str,
         cluster: str,
         timeframe: Optional[str] = '5m',
-        instances: str = ''
+        instances: str = '',
+        refresh: bool = False
     ):
         """
         Use this tool to retrieve performance metrics for VAST cluster objects using the ad_hoc_query API.
@@ -291,6 +292,8 @@ def start_mcp(
                               Use view name, NOT view path. Example: "tenant1:view1,tenant2:view2".
                             - Leave empty string to get metrics for all instances of the object type.
                             - If object_name is "view" and you want specific views, instances is REQUIRED in "tenant:view_name" format.
+            refresh (bool): Query the cluster even if the same request was answered in the last few seconds
+                            (up to an hour for day-granularity timeframes). Defaults to False.
 
         Returns:
             A dict where each key is the instance name which contains a list of performance metrics. Each item contains metric, IOPS 95th Percentile, IOPS Average, IOPS Max, BW 95th Percentile, BW Average, BW Max, LATENCY 95th Percentile, LATENCY Average, LATENCY Max for the different objects.
@@ -308,7 +311,8 @@ def start_mcp(
                 object_name=object_name,
                 cluster=cluster,
                 timeframe=timeframe or '5m',
-                instances=instances or None
+                instances=instances or None,
+                refresh=refresh
             )
 
             return _make_result(performance_data)
@@ -843,12 +847,12 @@ def start_mcp(
 
     # Dynamically register tools from YAML templates
     default_template_path = get_default_template_path()
-    if os.path.exists(TEMPLATE_MODIFICATIONS_FILE) or default_template_path:
+    if os.path.exists(get_template_modifications_file()) or default_template_path:
         try:
-            parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+            parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
             all_commands = parser.get_all_commands()
         except Exception as e:
-            logging.warning(f"Could not load template parser from {TEMPLATE_MODIFICATIONS_FILE}: {e}")
+            logging.warning(f"Could not load template parser from {get_template_modifications_file()}: {e}")
             parser = None
         
         if parser:
@@ -1142,17 +1146,17 @@ def start_mcp(
                     
                     logging.info(f"Registered dynamic tool: {tool_name}")
                 except Exception as e:
-                    logging.warning(f"Could not register dynamic tool 'list_{command_name}_vast' from template file {TEMPLATE_MODIFICATIONS_FILE}: {e}")
+                    logging.warning(f"Could not register dynamic tool 'list_{command_name}_vast' from template file {get_template_modifications_file()}: {e}")
                     import traceback
                     logging.debug(f"Traceback for {command_name}: {traceback.format_exc()}")
     else:
-        logging.info(f"Template file {TEMPLATE_MODIFICATIONS_FILE} not found and no default template. Only static tools will be available.")
+        logging.info(f"Template file {get_template_modifications_file()} not found and no default template. Only static tools will be available.")
 
     # Register merged commands from YAML templates
     default_template_path = get_default_template_path()
-    if os.path.exists(TEMPLATE_MODIFICATIONS_FILE) or default_template_path:
+    if os.path.exists(get_template_modifications_file()) or default_template_path:
         try:
-            parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+            parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
             merged_command_names = parser.get_merged_command_names()
             
             for merged_name in merged_command_names:
@@ -1395,7 +1399,7 @@ def start_mcp(
                 
                 logging.info(f"Registered merged tool: {tool_name}")
         except Exception as e:
-            logging.warning(f"Could not load merged tools from template file {TEMPLATE_MODIFICATIONS_FILE}: {e}")
+            logging.warning(f"Could not load merged tools from template file {get_template_modifications_file()}: {e}")
 
     # Register create functions (always visible to LLM, but check read_write at runtime)
     if CREATE_FUNCTIONS_AVAILABLE:
@@ -211,10 +211,11 @@ def validate_cluster(cluster: str, tenant: str, username: str, password: str, us
         return {}
 
 
-def setup_config(config_file: str = CONFIG_FILE):
+def setup_config(config_file: str = CONFIG_FILE, pretty: bool = False):
     """
     Enhanced setup function that supports adding, editing, and removing clusters.
     Provides a menu-driven interface for managing cluster configurations.
+    The config is saved as compact JSON unless pretty is True.
     """
     if not os.path.exists(os.path.dirname(config_file)):
         os.makedirs(os.path.dirname(config_file))
@@ -331,8 +332,11 @@ def setup_config(config_file: str = CONFIG_FILE):
             # Save and exit
             if config['clusters'] or config.get('http_server', {}).get('enabled'):
                 try:
-                    with open(config_file, 'w') as f:
-                        json.dump(config, f, indent=2)
+                    with open(config_file, 'w', encoding='utf-8') as f:
+                        if pretty:
+                            json.dump(config, f, indent=2, ensure_ascii=False)
+                        else:
+                            json.dump(config, f, separators=(',', ':'), ensure_ascii=False)
                     logging.info(f"Configuration saved to: {config_file}")
                     return config
                 except Exception as e:
@@ -10,7 +10,7 @@ import yaml
 import re
 import logging
 import os
-from typing import Dict, List, Any, Optional
+from typing import Dict, FrozenSet, List, Any, Optional
 from pathlib import Path
 
 
@@ -395,11 +395,12 @@ class TemplateParser:
         templates = self._apply_replacements_recursive(templates)
         return templates
     
-    def _load_api_whitelist(self) -> Dict[str, List[str]]:
+    def _load_api_whitelist(self) -> Dict[str, FrozenSet[str]]:
         """Load api_whitelist section from merged YAML data
         
         Returns:
-            Dictionary mapping endpoint names to allowed HTTP methods.
+            Dictionary mapping endpoint names to frozen sets of allowed HTTP methods
+            (sets so permission checks are O(1) membership tests).
             - Simple format (e.g., "- views"): defaults to ['get'] only
             - With methods (e.g., "- views: [post]"): includes 'get' + specified methods
             - Empty dict means deny all (restrictive default).
@@ -424,30 +425,26 @@ class TemplateParser:
         for entry in whitelist_data:
             if isinstance(entry, str):
                 # Simple format: "- views" (defaults to GET only)
-                whitelist[entry] = ['get']  # Default to GET only
+                whitelist[entry] = frozenset(['get'])  # Default to GET only
             elif isinstance(entry, dict):
                 # Complex format: "- views: [post]" or "- views: [get, post]"
                 for endpoint, methods in entry.items():
                     if isinstance(methods, list):
-                        # Normalize method names to lowercase
-                        normalized_methods = [m.lower() if isinstance(m, str) else str(m).lower() for m in methods]
-                        # Always include 'get' if not already present
-                        if 'get' not in normalized_methods:
-                            normalized_methods.insert(0, 'get')
-                        whitelist[endpoint] = normalized_methods
+                        # Normalize method names to lowercase and always include 'get'
+                        whitelist[endpoint] = frozenset(str(m).lower() for m in methods) | {'get'}
                     else:
                         # Single method or invalid format, default to GET only
-                        whitelist[endpoint] = ['get']
+                        whitelist[endpoint] = frozenset(['get'])
             else:
                 logging.warning(f"Invalid api_whitelist entry format: {entry}, skipping")
         
         return whitelist
     
-    def get_api_whitelist(self) -> Dict[str, List[str]]:
+    def get_api_whitelist(self) -> Dict[str, FrozenSet[str]]:
         """Get the API whitelist configuration
         
         Returns:
-            Dictionary mapping endpoint names to allowed HTTP methods.
+            Dictionary mapping endpoint names to frozen sets of allowed HTTP methods.
             - Simple format (e.g., "- views"): defaults to ['get'] only
             - With methods (e.g., "- views: [post]"): includes 'get' + specified methods
             - Empty dict means deny all (restrictive default).
@@ -1,6 +1,7 @@
 """Utility functions for vast-admin-mcp: password management, formatting, validation, and logging."""
 
 import base64
+import functools
 import os
 import sys
 import json
@@ -8,11 +9,11 @@ import csv
 import logging
 import logging.handlers
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Optional, Tuple
+from typing import Callable, List, Dict, Any, Optional, Tuple, FrozenSet
 
 from .config import (
-    CONFIG_FILE, LOG_PATH, TEMPLATE_MODIFICATIONS_FILE, get_default_template_path,
-    LOG_FILE_MAX_BYTES, LOG_FILE_BACKUP_COUNT, PBKDF2_ITERATIONS, ENCRYPTION_KEY_FILE_PERMISSIONS
+    CONFIG_FILE, LOG_PATH, get_template_modifications_file, get_default_template_path,
+    LOG_FILE_MAX_BYTES, LOG_FILE_BACKUP_COUNT, PBKDF2_ITERATIONS, ENCRYPTION_KEY_FILE_PERMISSIONS, save_config
 )
 
 # Try to import keyring for secure password storage
@@ -321,9 +322,8 @@ def migrate_password_storage():
                     logging.warning(f"Could not migrate password for cluster {cluster_info['cluster']}: {e}")
         
         if modified:
-            # Save updated config
-            with open(CONFIG_FILE, 'w') as f:
-                json.dump(config, f, indent=2)
+            # Save updated config (keeping the file's compact or indented format)
+            save_config(config)
             logging.info("Password storage migration completed")
     
     except Exception as e:
@@ -1185,6 +1185,7 @@ def apply_ordering(data: List[Dict], order_configs: List[Dict[str, str]], remove
     return sorted_data
 
 
+@functools.lru_cache(maxsize=4096)
 def normalize_field_name(field_name: str, direction: str = 'to_underscore') -> str:
     """Normalize field name between space-separated and underscore-separated formats.
     
@@ -1262,6 +1263,7 @@ def to_raw_field_name(field_name: str) -> str:
     return f'_raw_{normalized}'
 
 
+@functools.lru_cache(maxsize=4096)
 def to_python_name(field_name: str) -> str:
     """Convert field name to Python variable name format.
     
@@ -1401,25 +1403,111 @@ def is_vast_version_legacy(version_string: str, threshold: tuple = (5, 3)) -> bo
         return False
 
 
-def get_api_whitelist() -> Dict[str, List[str]]:
+# Module-level copy of the loaded whitelist, so repeated calls skip the cache manager's lock
+_api_whitelist: Optional[Dict[str, FrozenSet[str]]] = None
+
+
+def get_api_whitelist() -> Dict[str, FrozenSet[str]]:
     """Get API whitelist from template parser (cached).
     
     This function is shared across modules to avoid duplication.
-    The whitelist is cached in memory to avoid redundant parsing.
+    The whitelist is parsed once and then returned from a module-level variable;
+    call clear_api_whitelist_cache() after the template files change.
     
     Returns:
-        Dictionary mapping API endpoint names to lists of allowed field names.
+        Dictionary mapping API endpoint names to frozen sets of allowed HTTP methods.
         Empty dict means deny all (default if loading fails).
     """
     def _load_whitelist():
         try:
             from .template_parser import TemplateParser
             default_template_path = get_default_template_path()
-            parser = TemplateParser(TEMPLATE_MODIFICATIONS_FILE, default_template_path=default_template_path)
+            parser = TemplateParser(get_template_modifications_file(), default_template_path=default_template_path)
             return parser.get_api_whitelist()
         except Exception as e:
             logging.warning(f"Could not load API whitelist: {e}, defaulting to empty (deny all)")
             return {}
     
-    return _cache_manager.get_or_set('whitelist', 'api_whitelist', _load_whitelist)
+    global _api_whitelist
+    whitelist = _api_whitelist
+    if whitelist is None:
+        whitelist = _api_whitelist = _cache_manager.get_or_set('whitelist', 'api_whitelist', _load_whitelist)
+    return whitelist
+
+
+def get_api_whitelist_allow_set() -> FrozenSet[Tuple[str, str]]:
+    """Get the API whitelist as a precomputed set of allowed (endpoint, method) pairs (cached).
+    
+    Lets hot paths check permissions with a single set membership test instead
+    of dict lookups plus list scans.
+    
+    Returns:
+        Frozen set of (endpoint, lowercase HTTP method) tuples.
+        Empty set means deny all.
+    """
+    def _build_allow_set():
+        return frozenset(
+            (endpoint, method)
+            for endpoint, methods in get_api_whitelist().items()
+            for method in methods
+        )
+    
+    return _cache_manager.get_or_set('whitelist', 'allow_set', _build_allow_set)
+
+
+def get_api_permission_check() -> Callable[[str, str], bool]:
+    """Get an is_allowed(endpoint, method) predicate for the API whitelist (cached).
+    
+    The predicate closes over get_api_whitelist_allow_set(), so each check is a
+    single set membership test. Built once per whitelist load and reset by
+    clear_api_whitelist_cache().
+    """
+    def _build_permission_check():
+        allow_set = get_api_whitelist_allow_set()
+        
+        def is_allowed(endpoint: str, method: str) -> bool:
+            return (endpoint, method.lower()) in allow_set
+        
+        return is_allowed
+    
+    return _cache_manager.get_or_set('whitelist', 'permission_check', _build_permission_check)
 
+
+def check_api_method_allowed(endpoint: str, method: str) -> None:
+    """Validate that an HTTP method is whitelisted for an endpoint.
+    
+    Used for sub-endpoint calls (e.g. snapshots[id].clone.post()) that bypass
+    call_vast_api's whitelist validation.
+    
+    Args:
+        endpoint: API endpoint name (e.g., 'snapshots')
+        method: HTTP method (e.g., 'post')
+        
+    Raises:
+        ValueError: If the endpoint is not whitelisted or the method is not allowed
+    """
+    if get_api_permission_check()(endpoint, method):
+        return
+    allow_set = get_api_whitelist_allow_set()
+    # Every whitelisted endpoint allows GET, so its absence means the endpoint isn't listed
+    if (endpoint, 'get') not in allow_set:
+        raise ValueError(
+            f"Access denied: API endpoint '{endpoint}' is not whitelisted. "
+            f"Please contact your administrator to add it to the api_whitelist section "
+            f"in the YAML configuration file."
+        )
+    allowed_methods = sorted(get_api_whitelist().get(endpoint, ()))
+    raise ValueError(
+        f"Access denied: HTTP method '{method.upper()}' is not allowed for endpoint '{endpoint}'. "
+        f"Allowed methods: {allowed_methods}"
+    )
+
+
+def clear_api_whitelist_cache() -> None:
+    """Clear the cached API whitelist and everything precomputed from it.
+    
+    Call after the template files are modified so the whitelist is reloaded.
+    """
+    global _api_whitelist
+    _api_whitelist = None
+    _cache_manager.clear('whitelist')
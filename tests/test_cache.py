@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Unit tests for the CacheManager in cache.py."""
+
+import sys
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+# Add parent directory to path to import vast_admin_mcp
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vast_admin_mcp.cache import CacheManager
+
+
+class TestCacheManagerMaxsize(unittest.TestCase):
+    """Tests for the maxsize bound of CacheManager.set()."""
+
+    def test_unbounded_by_default(self):
+        cache = CacheManager()
+        for i in range(10):
+            cache.set('c', str(i), i)
+        self.assertEqual(len(cache._caches['c']), 10)
+
+    def test_oldest_entries_are_evicted(self):
+        cache = CacheManager()
+        for i in range(5):
+            cache.set('c', str(i), i, maxsize=3)
+        self.assertEqual(list(cache._caches['c']), ['2', '3', '4'])
+        self.assertIsNone(cache.get('c', '0'))
+        self.assertEqual(cache.get('c', '4'), 4)
+
+    def test_updated_entry_counts_as_newest(self):
+        cache = CacheManager()
+        for key in ['a', 'b', 'c', 'a', 'd']:
+            cache.set('c', key, key, maxsize=3)
+        self.assertEqual(list(cache._caches['c']), ['c', 'a', 'd'])
+
+    def test_expired_entries_are_pruned_first(self):
+        cache = CacheManager()
+        with patch('vast_admin_mcp.cache.time.time', return_value=100.0):
+            cache.set('c', 'old', 1, ttl=10)
+        with patch('vast_admin_mcp.cache.time.time', return_value=105.0):
+            cache.set('c', 'recent', 2, ttl=10)
+        with patch('vast_admin_mcp.cache.time.time', return_value=120.0):
+            cache.set('c', 'new', 3, ttl=10, maxsize=2)
+        # 'recent' is expired as well, so both go even though maxsize allows two entries
+        self.assertEqual(list(cache._caches['c']), ['new'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Unit tests for docstring parsing used by describe_tool in functions.py."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add parent directory to path to import vast_admin_mcp
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vast_admin_mcp.functions import _parse_docstring_args
+
+
+class TestParseDocstringArgs(unittest.TestCase):
+    """Tests for _parse_docstring_args()."""
+
+    def test_no_args_section(self):
+        self.assertEqual(_parse_docstring_args("Do something.\n\nReturns:\n    value: a value"), {})
+
+    def test_name_colon_and_typed_lines(self):
+        doc = (
+            "List things.\n"
+            "\n"
+            "Args:\n"
+            "    cluster: Cluster address or name\n"
+            "    top (int): Maximum number of rows\n"
+            "    refresh (bool, optional): Skip the cache\n"
+            "\n"
+            "Returns:\n"
+            "    result: not an argument\n"
+        )
+        self.assertEqual(_parse_docstring_args(doc), {
+            'cluster': 'Cluster address or name',
+            'top': 'Maximum number of rows',
+            'refresh': 'Skip the cache',
+        })
+
+    def test_bare_name_takes_next_line(self):
+        doc = "Args:\n    tenant\n        Tenant name\n    path: View path\n"
+        self.assertEqual(_parse_docstring_args(doc), {'tenant': 'Tenant name', 'path': 'View path'})
+
+    def test_first_non_empty_description_wins(self):
+        doc = "Args:\n    name:\n    name: First\n    name: Second\n"
+        self.assertEqual(_parse_docstring_args(doc), {'name': 'First'})
+
+    def test_continuation_lines_are_not_arguments(self):
+        doc = (
+            "Args:\n"
+            "    instances: Comma-separated instance names.\n"
+            "               - Leave empty to get all instances.\n"
+            "    timeframe: Time window, e.g. 5m\n"
+        )
+        self.assertEqual(_parse_docstring_args(doc), {
+            'instances': 'Comma-separated instance names.',
+            'timeframe': 'Time window, e.g. 5m',
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()
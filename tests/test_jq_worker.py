@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Unit tests for the long-lived jq worker processes in data_processors.py."""
+
+import shutil
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+from pathlib import Path
+
+# Add parent directory to path to import vast_admin_mcp
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vast_admin_mcp import data_processors
+from vast_admin_mcp.data_processors import (
+    JQ_WORKERS_SUPPORTED, close_jq_workers, jq_worker_supported, run_jq_worker
+)
+
+
+@unittest.skipUnless(shutil.which('jq') and JQ_WORKERS_SUPPORTED, "jq command with worker support required")
+class TestRunJqWorker(unittest.TestCase):
+    """Tests for run_jq_worker() result shaping and error handling."""
+
+    def tearDown(self):
+        close_jq_workers()
+
+    def test_single_result(self):
+        self.assertEqual(run_jq_worker('.a', b'{"a": [1, 2]}'), [1, 2])
+
+    def test_worker_is_reused_across_values(self):
+        self.assertEqual(run_jq_worker('. * 2', b'1'), 2)
+        self.assertEqual(run_jq_worker('. * 2', b'21'), 42)
+
+    def test_empty_result(self):
+        # Like the jq command line, no output at all
+        self.assertEqual(run_jq_worker('empty', b'1'), '')
+
+    def test_multiple_results(self):
+        # One JSON text per line, as the jq command line prints them
+        self.assertEqual(run_jq_worker('.[]', b'[1, "a", null]'), '1\n"a"\nnull')
+
+    def test_error_is_raised_and_worker_survives(self):
+        with self.assertRaisesRegex(ValueError, 'boom'):
+            run_jq_worker('if . == 1 then error("boom") else . end', b'1')
+        self.assertEqual(run_jq_worker('if . == 1 then error("boom") else . end', b'2'), 2)
+
+    def test_compile_error(self):
+        with self.assertRaises(ValueError):
+            run_jq_worker('.[', b'1')
+
+    def test_timeout_kills_worker(self):
+        countdown = 'until(. == 0; . - 1)'
+        with patch.object(data_processors, 'JQ_TIMEOUT_SECONDS', 0.2):
+            with self.assertRaises(subprocess.TimeoutExpired):
+                run_jq_worker(countdown, b'-1')
+        # The killed worker is replaced on the next call
+        self.assertEqual(run_jq_worker(countdown, b'3'), 0)
+
+    def test_input_expressions_are_rejected(self):
+        with self.assertRaises(ValueError):
+            run_jq_worker('[., input]', b'1')
+
+
+class TestJqWorkerSupported(unittest.TestCase):
+    """Tests for jq_worker_supported() detection of input/inputs."""
+
+    def test_input_builtins(self):
+        for jq_expr in ('input', '[., input]', '[inputs]', 'reduce inputs as $x (0; . + $x)', '.a | input'):
+            with self.subTest(jq_expr=jq_expr):
+                self.assertFalse(jq_worker_supported(jq_expr))
+
+    def test_fields_and_variables(self):
+        for jq_expr in ('.input', '.a.inputs', '. as $input | $input', '.input_path', 'join(",")'):
+            with self.subTest(jq_expr=jq_expr):
+                self.assertEqual(jq_worker_supported(jq_expr), JQ_WORKERS_SUPPORTED)
+
+
+if __name__ == '__main__':
+    unittest.main()
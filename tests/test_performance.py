@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""Unit tests for performance data processing helpers in functions.py."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path to import vast_admin_mcp
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from vast_admin_mcp.config import (
+    GRANULARITY_THRESHOLD_SECONDS, GRANULARITY_THRESHOLD_HOURS, GRANULARITY_THRESHOLD_DAYS
+)
+from vast_admin_mcp.functions import (
+    _get_granularity, _normalize_metric_display, _partition_p95_max, _process_performance_data
+)
+
+
+class TestPartitionP95Max(unittest.TestCase):
+    """Tests for _partition_p95_max() against np.percentile and np.max."""
+
+    def test_matches_numpy(self):
+        rng = np.random.default_rng(0)
+        for rows in (1, 2, 3, 19, 20, 21, 100, 1001):
+            values = rng.normal(size=(rows, 4)) * 1000
+            values[:, 3] = 7.0  # constant column
+            with self.subTest(rows=rows):
+                p95, maximum = _partition_p95_max(values.copy())
+                np.testing.assert_allclose(p95, np.percentile(values, 95, axis=0), rtol=1e-12, atol=1e-9)
+                np.testing.assert_array_equal(maximum, values.max(axis=0))
+
+    def test_integer_valued_rows(self):
+        values = np.arange(40, dtype=np.float64)[::-1].reshape(20, 2)
+        p95, maximum = _partition_p95_max(values.copy())
+        np.testing.assert_allclose(p95, np.percentile(values, 95, axis=0))
+        np.testing.assert_array_equal(maximum, [39.0, 38.0])
+
+
+class TestGetGranularity(unittest.TestCase):
+    """Tests for _get_granularity() threshold boundaries."""
+
+    def test_boundaries(self):
+        cases = [
+            (0, 'seconds'),
+            (300, 'seconds'),
+            (GRANULARITY_THRESHOLD_SECONDS, 'seconds'),
+            (GRANULARITY_THRESHOLD_SECONDS + 1, 'minutes'),
+            (GRANULARITY_THRESHOLD_HOURS, 'minutes'),
+            (GRANULARITY_THRESHOLD_HOURS + 1, 'hours'),
+            (GRANULARITY_THRESHOLD_DAYS, 'hours'),
+            (GRANULARITY_THRESHOLD_DAYS + 1, 'days'),
+            (GRANULARITY_THRESHOLD_DAYS * 10, 'days'),
+        ]
+        for timeframe, expected in cases:
+            with self.subTest(timeframe=timeframe):
+                self.assertEqual(_get_granularity(timeframe), expected)
+
+
+class TestNormalizeMetricDisplay(unittest.TestCase):
+    """Tests for the _normalize_metric_display() lookup tables."""
+
+    def test_display_names_and_units(self):
+        cases = [
+            # (display_name, units, metric_name) -> (display_name, units)
+            # The view latency overrides still lose their trailing unit word, as they always did
+            (("ViewMetrics,read_latency__rate", "", "ViewMetrics,read_latency__rate"), ("Read", "latency")),
+            (("ViewMetrics,write_latency__rate", "ms", "ViewMetrics,write_latency__rate"), ("Write", "latency")),
+            (("NFS Read IOPS (Rate)", "IOPS", "x"), ("NFS Read", "iops")),
+            (("S3 Write Bandwidth (Sum)", "MB/Sec", "x"), ("S3 Write", "bw")),
+            (("SMB BW", "", "ProtoMetrics,smb_bw"), ("SMB", "bw")),
+            (("NFS Latency", "ms", "x"), ("NFS", "latency")),
+            (("Read Bandwidth IOPS", "IOPS", "x"), ("Read", "iops")),
+            (("IOPS", "", "ProtoMetrics,iops"), ("All Protocols", "iops")),
+            (("Bandwidth", "", "ProtoMetrics,bw"), ("All Protocols", "bw")),
+            (("", "", "ProtoMetrics,latency"), ("All Protocols", "latency")),
+            (("Capacity", "K B", "x"), ("Capacity", "KB")),
+        ]
+        for args, expected in cases:
+            with self.subTest(args=args):
+                self.assertEqual(_normalize_metric_display(*args), expected)
+
+
+class TestProcessPerformanceData(unittest.TestCase):
+    """Tests for _process_performance_data() row handling."""
+
+    def _metrics(self, data, object_ids=(1,)):
+        return {
+            'prop_list': ['timestamp', 'object_id', 'View,iops'],
+            'data': data,
+            'object_ids': list(object_ids),
+        }
+
+    def _summary(self, table, instance='view-1'):
+        return table[instance]['All Protocols']['iops']
+
+    def test_averages_per_object(self):
+        data = [
+            ['2024-01-01T00:00:00Z', 1, 10.0],
+            ['2024-01-01T00:00:10Z', 2, 100.0],
+            ['2024-01-01T00:00:20Z', 1, 30.0],
+        ]
+        instances = [{'id': 1, 'name': 'view-1'}, {'id': 2, 'name': 'view-2'}]
+        table = _process_performance_data(self._metrics(data, (1, 2)), {}, 'view', instances)
+        self.assertEqual(self._summary(table)['Average'], 20.0)
+        self.assertEqual(self._summary(table)['Max'], 30.0)
+        self.assertEqual(self._summary(table, 'view-2')['Average'], 100.0)
+
+    def test_rows_without_integer_object_id_are_dropped(self):
+        """Rows with a None or non-numeric object_id must not break the others."""
+        data = [
+            ['2024-01-01T00:00:00Z', 1, 10.0],
+            ['2024-01-01T00:00:10Z', None, 50.0],
+            ['2024-01-01T00:00:20Z', 'n/a', 70.0],
+            ['2024-01-01T00:00:30Z', '1', 30.0],
+        ]
+        with self.assertLogs(level='WARNING'):
+            table = _process_performance_data(self._metrics(data), {}, 'view', [{'id': 1, 'name': 'view-1'}])
+        self.assertEqual(self._summary(table)['Average'], 20.0)
+        self.assertEqual(self._summary(table)['Max'], 30.0)
+
+    def test_only_invalid_object_ids(self):
+        data = [['2024-01-01T00:00:00Z', None, 10.0]]
+        with self.assertLogs(level='WARNING'):
+            table = _process_performance_data(self._metrics(data), {}, 'view', [{'id': 1, 'name': 'view-1'}])
+        self.assertEqual(table, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
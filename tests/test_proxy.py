@@ -10,7 +10,7 @@ from pathlib import Path
 # Add parent directory to path to import vast_admin_mcp
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from vast_admin_mcp.client import _get_proxy_url, _create_pool_manager
+from vast_admin_mcp.client import _get_proxy_url, _create_pool_manager, _get_pool_manager
 
 
 class TestGetProxyUrl(unittest.TestCase):
@@ -187,6 +187,24 @@ class TestCreatePoolManager(unittest.TestCase):
         self.assertIsInstance(pm, SOCKSProxyManager)
 
 
+class TestGetPoolManager(unittest.TestCase):
+    """Tests for _get_pool_manager() connection reuse."""
+
+    def test_same_settings_reuse_manager(self):
+        """Requests with the same proxy/cert settings should share one manager."""
+        pm1 = _get_pool_manager(None, None, None)
+        pm2 = _get_pool_manager(None, None, None)
+        self.assertIs(pm1, pm2)
+
+    def test_different_proxy_gets_own_manager(self):
+        """A different proxy URL should produce a separate manager."""
+        import urllib3
+        direct = _get_pool_manager(None, None, None)
+        proxied = _get_pool_manager("http://proxy:8080", None, None)
+        self.assertIsNot(direct, proxied)
+        self.assertIsInstance(proxied, urllib3.ProxyManager)
+
+
 def _import_blocker(blocked_module):
     """Return an __import__ replacement that blocks a specific module."""
     real_import = __builtins__.__import__ if hasattr(__builtins__, '__import__') else __import__